@@ -4,6 +4,7 @@ EF Memory V2 — Auto-Capture (Draft Management)
 CRUD operations for memory draft files:
   - create_draft: write a candidate entry to .memory/drafts/
   - list_drafts: list all pending draft files
+  - draft_titles: titles of all draft files (cached per file)
   - approve_draft: validate + append to events.jsonl + delete draft
   - reject_draft: delete a draft file
   - review_drafts: list drafts with full verification status
@@ -17,12 +18,13 @@ No external dependencies — pure Python stdlib + internal modules.
 import copy
 import json
 import logging
+import os
 import re
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from .auto_verify import (
     ValidationResult,
@@ -33,6 +35,10 @@ from .auto_verify import (
 
 logger = logging.getLogger("efm.auto_capture")
 
+# Title cache for draft_titles(): {filename: [mtime_ns, size, title]}.
+# Not *.json, so list_drafts() never picks it up as a draft.
+_TITLES_INDEX = "_titles.index"
+
 
 # ---------------------------------------------------------------------------
 # Result dataclasses
@@ -197,6 +203,58 @@ def list_drafts(drafts_dir: Path) -> List[DraftInfo]:
     return drafts
 
 
+def draft_titles(drafts_dir: Path) -> Set[str]:
+    """
+    Non-empty titles of all draft files, as ``list_drafts`` would report.
+
+    Titles are cached in ``drafts_dir/_titles.index`` keyed by filename
+    and validated against each file's (mtime_ns, size) from one directory
+    scan, so only new or changed drafts are opened and parsed. Approved,
+    rejected or hand-deleted drafts simply drop out of the scan.
+    """
+    index_path = drafts_dir / _TITLES_INDEX
+    try:
+        cached = json.loads(index_path.read_text(encoding="utf-8"))
+        if not isinstance(cached, dict):
+            cached = {}
+    except (OSError, ValueError):
+        cached = {}
+
+    index: dict = {}
+    try:
+        with os.scandir(drafts_dir) as it:
+            for dir_entry in it:
+                name = dir_entry.name
+                if not name.endswith(".json") or name.startswith("."):
+                    continue
+                try:
+                    st = dir_entry.stat()
+                except OSError:
+                    continue
+                hit = cached.get(name)
+                if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+                    index[name] = hit
+                    continue
+                try:
+                    entry = json.loads(Path(dir_entry.path).read_text(encoding="utf-8"))
+                    title = entry.get("title", "") if isinstance(entry, dict) else ""
+                except (OSError, ValueError):
+                    title = ""
+                index[name] = [st.st_mtime_ns, st.st_size, title or ""]
+    except OSError:
+        return set()  # No drafts dir yet
+
+    if index != cached:
+        tmp_path = index_path.with_name(index_path.name + ".tmp")
+        try:
+            tmp_path.write_text(json.dumps(index, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, index_path)
+        except OSError:
+            pass  # Cache only; next call re-parses
+
+    return {hit[2] for hit in index.values() if hit[2]}
+
+
 def approve_draft(draft_path: Path, events_path: Path) -> ApproveResult:
     """
     Validate a draft and append it to events.jsonl.
@@ -254,12 +254,13 @@ def _run_sync_step(events_path: Path, config: dict) -> StepResult:
                 logger.warning(f"Embedder not available: {e}")
 
         # Run sync
-        batch_size = embedding_config.get("sync", {}).get("batch_size", 20)
+        sync_config = embedding_config.get("sync", {})
         sync_report = sync_embeddings(
             events_path=events_path,
             vectordb=db,
             embedder=embedder,
-            batch_size=batch_size,
+            batch_size=sync_config.get("batch_size", 20),
+            max_workers=sync_config.get("concurrency", 4),
         )
 
         result.success = len(sync_report.errors) == 0
@@ -579,6 +579,32 @@ def _load_entries_latest_wins(events_path: Path) -> Dict[str, dict]:
     return entries
 
 
+def _char_masks(text: str) -> Dict[str, int]:
+    """Bit i of ``masks[c]`` is set where ``text[i] == c`` (for _lcs_length)."""
+    masks: Dict[str, int] = {}
+    for i, c in enumerate(text):
+        masks[c] = masks.get(c, 0) | (1 << i)
+    return masks
+
+
+def _lcs_length(masks: Dict[str, int], n: int, other: str) -> int:
+    """
+    Length of the longest common subsequence of a length-``n`` text (given
+    by its ``_char_masks``) and ``other``.
+
+    Bit-parallel (Hyyrö 2004): one row of the LCS table lives in the bits
+    of a Python int, so each character of ``other`` costs a few big-int
+    operations instead of ``n`` interpreted steps.
+    """
+    full = (1 << n) - 1
+    row = full
+    get = masks.get
+    for c in other:
+        matched = row & get(c, 0)
+        row = ((row + matched) | (row - matched)) & full
+    return n - row.bit_count()
+
+
 def check_duplicates(
     entry: dict,
     events_path: Path,
@@ -594,6 +620,10 @@ def check_duplicates(
     Threshold default: 0.85 (lower than embedding's 0.92 because
     text similarity is less precise).
 
+    The blocks SequenceMatcher matches form a common subsequence, so
+    ``2 * LCS / total`` bounds ``ratio()`` from above; pairs whose bound is
+    already under the threshold skip the (much slower) ratio computation.
+
     Args:
         _preloaded_entries: Optional pre-loaded entries dict to avoid
             re-reading events.jsonl on every call (used by verify_all_entries).
@@ -608,6 +638,9 @@ def check_duplicates(
     # Use pre-loaded entries if available, otherwise load from file
     existing = _preloaded_entries if _preloaded_entries is not None else _load_entries_latest_wins(events_path)
 
+    n = len(candidate_text)
+    masks = _char_masks(candidate_text)
+
     for existing_id, existing_entry in existing.items():
         # Don't compare against self
         if existing_id == entry_id:
@@ -620,6 +653,12 @@ def check_duplicates(
         if not existing_text:
             continue
 
+        total = n + len(existing_text)
+        if 2.0 * min(n, len(existing_text)) / total < threshold:
+            continue
+        if 2.0 * _lcs_length(masks, n, existing_text) / total < threshold:
+            continue
+
         ratio = difflib.SequenceMatcher(
             None, candidate_text, existing_text
         ).ratio()
@@ -7,15 +7,237 @@ sync, and generate_rules with one shared implementation.
 
 All callers apply their own post-filters (deprecated, hard classification, etc.)
 on top of the base latest-wins dict returned here.
+
+orjson is used for decoding when installed (optional — stdlib json otherwise).
 """
 
 import json
 import logging
+import os
+import re
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Tuple, Union
 
 logger = logging.getLogger("efm.events_io")
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Block size for raw chunked reads of events.jsonl (1 MiB)
+_READ_CHUNK = 1 << 20
+
+# Leading "id" key of a raw JSONL line.  Only matches when id is the first
+# key (so it is the top-level one) and has no escapes (raw == decoded).
+_LEADING_ID_RE = re.compile(rb'\{\s*"id"\s*:\s*"([^"\\]+)"')
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Decode a JSON document, using orjson's C parser when it is installed.
+
+    orjson is stricter than the stdlib (e.g. it rejects NaN/Infinity), so
+    anything it refuses is retried with ``json.loads``. Results and the
+    raised ``json.JSONDecodeError`` therefore match the stdlib either way.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def iter_jsonl_lines(f: BinaryIO, chunk_size: int = _READ_CHUNK) -> Iterator[bytes]:
+    """
+    Yield the raw lines of a binary file object, without trailing ``\\n``.
+
+    Reads fixed-size blocks and splits them in C instead of going through
+    per-line ``readline`` and text decoding; a partial line at the end of a
+    block is carried over to the next one.  Yields the same lines (and the
+    same count) as iterating the file in text mode, minus the newline, so
+    ``enumerate`` indices still match file line numbers.  ``\\r`` is left in
+    place — callers ``strip()`` as they already do.
+    """
+    remainder = b""
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        if remainder:
+            chunk = remainder + chunk
+        lines = chunk.split(b"\n")
+        remainder = lines.pop()
+        yield from lines
+    if remainder:
+        yield remainder
+
+
+def peek_entry_id(line: bytes) -> Optional[str]:
+    """
+    Read the entry id from a stripped raw line without parsing it.
+
+    Returns None when the id is not the leading key or contains escapes —
+    callers must then fall back to a full parse.
+    """
+    m = _LEADING_ID_RE.match(line)
+    return m.group(1).decode("utf-8", "replace") if m else None
+
+
+def load_events_by_ids(events_path: Path, ids: Iterable[str]) -> Dict[str, dict]:
+    """
+    Latest-wins load restricted to ``ids``.
+
+    Scans the whole file (a later line may supersede an earlier one) but
+    only parses lines whose id is wanted, as read by :func:`peek_entry_id`.
+    Lines whose id cannot be peeked are parsed and filtered afterwards.
+
+    Returns ``{entry_id: latest_entry_dict}`` for the ids that were found
+    (deprecated entries included — callers filter as needed).
+    """
+    wanted = set(ids)
+    entries: Dict[str, dict] = {}
+    if not wanted or not events_path.exists():
+        return entries
+
+    try:
+        with open(events_path, "rb") as f:
+            for line in iter_jsonl_lines(f):
+                line = line.strip()
+                if not line:
+                    continue
+                peeked = peek_entry_id(line)
+                if peeked is not None and peeked not in wanted:
+                    continue
+                try:
+                    entry = json_loads(line)
+                except ValueError as e:
+                    logger.debug("Skipping invalid JSON: %s", e)
+                    continue
+                entry_id = entry.get("id")
+                if entry_id in wanted:
+                    entries[entry_id] = entry
+    except OSError:
+        pass
+
+    return entries
+
+
+def _apply_active_lines(f: BinaryIO, entries: Dict[str, dict]) -> int:
+    """
+    Apply lines from ``f``'s current position to an active-entries dict.
+
+    A deprecating line drops its id; any other line with an id replaces
+    it.  Returns the byte offset just past the last newline-terminated
+    line, so a trailing partial line (a write still in progress) is
+    re-read on the next resume instead of being skipped.
+    """
+    resume = line_start = f.tell()
+    for line in iter_jsonl_lines(f):
+        line_start = resume
+        resume += len(line) + 1
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json_loads(line)
+        except ValueError as e:
+            logger.debug("Skipping invalid JSON: %s", e)
+            continue
+        entry_id = entry.get("id")
+        if not entry_id:
+            continue
+        if entry.get("deprecated", False):
+            entries.pop(entry_id, None)
+        else:
+            entries[entry_id] = entry
+    end = f.tell()
+    if resume > end:
+        # Last line had no trailing newline: resume at its start
+        resume = line_start
+    return resume
+
+
+def load_active_events(events_path: Path) -> Dict[str, dict]:
+    """
+    Latest-wins load of non-deprecated entries, in one streaming pass.
+
+    Equivalent to filtering :func:`load_events_latest_wins` on
+    ``deprecated``, but a deprecating line drops its id as it is read, so
+    no deprecated entries are held and no filtered copy is built.  Reads
+    raw chunks via :func:`iter_jsonl_lines`.
+    """
+    entries: Dict[str, dict] = {}
+    if not events_path.exists():
+        return entries
+
+    try:
+        with open(events_path, "rb") as f:
+            _apply_active_lines(f, entries)
+    except OSError:
+        pass
+
+    return entries
+
+
+# Snapshots for load_active_events_cached:
+#   str(path) -> ((st_dev, st_ino, st_mtime_ns, st_size), resume_offset, entries)
+_active_cache: Dict[str, Tuple[Tuple[int, int, int, int], int, Dict[str, dict]]] = {}
+
+
+def load_active_events_cached(events_path: Path) -> Dict[str, dict]:
+    """
+    :func:`load_active_events` with a per-process snapshot cache.
+
+    - Unchanged file (same device, inode, mtime and size): the cached dict
+      is returned after a single ``open`` + ``fstat``.
+    - Same inode, grown file: events.jsonl is append-only between rewrites,
+      so only the bytes after the cached offset are parsed and applied to
+      a copy of the cached dict.
+    - Anything else (rewrite via ``os.replace``, truncation): full reload.
+
+    The signature is taken from the open handle, so it always describes
+    the inode whose bytes are read, even if the path is swapped meanwhile.
+
+    The returned dict is a shared snapshot — callers must not mutate it.
+    """
+    key = str(events_path)
+    try:
+        f = open(events_path, "rb")
+    except OSError:
+        _active_cache.pop(key, None)
+        return {}
+
+    try:
+        with f:
+            st = os.fstat(f.fileno())
+            sig = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+            cached = _active_cache.get(key)
+            if cached is not None and cached[0] == sig:
+                return cached[2]
+
+            entries: Dict[str, dict] = {}
+            offset = 0
+            if (
+                cached is not None
+                and cached[0][:2] == sig[:2]          # same file, not replaced
+                and sig[3] > cached[0][3]             # grew: appended to
+                and sig[2] >= cached[0][2]
+            ):
+                entries = dict(cached[2])
+                offset = cached[1]
+
+            f.seek(offset)
+            resume = _apply_active_lines(f, entries)
+    except OSError:
+        _active_cache.pop(key, None)
+        return load_active_events(events_path)
+
+    _active_cache[key] = (sig, resume, entries)
+    return entries
+
 
 def load_events_latest_wins(
     events_path: Path,
@@ -51,41 +273,39 @@ def load_events_latest_wins(
         return entries, 0, 0
 
     try:
-        with open(events_path, "r", encoding="utf-8") as f:
+        with open(events_path, "rb") as f:
+            # Raw bytes straight into the decoder: no text decoding pass and
+            # no strip() copy — both parsers skip surrounding whitespace.
             if byte_offset > 0:
                 # Fast path: seek directly to unprocessed content
                 f.seek(byte_offset)
-                for line in f:
-                    line = line.strip()
-                    if not line:
+                for line in iter_jsonl_lines(f):
+                    if not line or line.isspace():
                         continue
                     try:
-                        entry = json.loads(line)
+                        entry = json_loads(line)
                         entry_id = entry.get("id")
                         if entry_id:
                             entries[entry_id] = entry
-                    except json.JSONDecodeError as e:
+                    except ValueError as e:
                         logger.debug("Skipping invalid JSON: %s", e)
                 # total_lines not computed in byte-offset mode — callers using
                 # byte_offset rely on end_byte_offset for cursors, not total_lines.
                 total_lines = 0
             else:
                 # Standard path: scan from beginning
-                for i, line in enumerate(f):
+                for i, line in enumerate(iter_jsonl_lines(f)):
                     total_lines = i + 1
-                    line = line.strip()
-                    if not line:
-                        continue
-                    if i < start_line:
+                    if i < start_line or not line or line.isspace():
                         continue
                     try:
-                        entry = json.loads(line)
+                        entry = json_loads(line)
                         entry_id = entry.get("id")
                         if entry_id:
                             if track_lines:
                                 entry["_line"] = i
                             entries[entry_id] = entry
-                    except json.JSONDecodeError as e:
+                    except ValueError as e:
                         logger.debug("Skipping invalid JSON at line %d: %s", i + 1, e)
 
             end_offset = f.seek(0, 2)  # Seek to end to get byte offset
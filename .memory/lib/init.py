@@ -397,17 +397,20 @@ def scan_project(project_root: Path) -> List[str]:
     #   - working/: session-scoped PWF files
     #   - archive/: compacted history, regenerable
     #   - drafts/*.json: review queue, transient
+    #   - drafts/_titles.index*: draft title cache, rebuilt on demand
     #   - .claude/rules/ef-memory/: auto-generated from events.jsonl
     _required_ignores = {
         ".memory/vectors.db": [".memory/vectors.db", "vectors.db"],
         ".memory/working/": [".memory/working/"],
         ".memory/archive/": [".memory/archive/"],
         ".memory/drafts/*.json": [".memory/drafts/", "drafts/*.json"],
+        # Whole-dir variant as a full line, so "drafts/*.json" doesn't count
+        ".memory/drafts/_titles.index*": [".memory/drafts/\n", "_titles.index"],
         ".claude/rules/ef-memory/": [".claude/rules/ef-memory/"],
     }
     gitignore = project_root / ".gitignore"
     if gitignore.exists():
-        content = gitignore.read_text()
+        content = gitignore.read_text() + "\n"
         missing = [
             pattern
             for pattern, variants in _required_ignores.items()
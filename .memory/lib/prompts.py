@@ -12,7 +12,7 @@ No external dependencies — pure Python stdlib.
 """
 
 import json
-from typing import Tuple
+from typing import Iterable, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -33,12 +33,13 @@ def _truncate(text: str, max_chars: int) -> str:
     return text[:max_chars - 3] + "..."
 
 
-def _entries_to_compact_text(entries: list, max_chars: int) -> str:
+def _entries_to_compact_text(entries: Iterable[dict], max_chars: int) -> str:
     """
-    Serialize a list of entry dicts to compact text for LLM prompts.
+    Serialize entry dicts to compact text for LLM prompts.
 
     Each entry is formatted as a brief summary. Entries are added
-    until max_chars is reached.
+    until max_chars is reached; any iterable works, and entries past
+    the budget are never visited.
     """
     parts = []
     current_len = 0
@@ -17,12 +17,16 @@ import json
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import combinations
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .auto_verify import _load_entries_latest_wins, _parse_iso8601
+from .events_io import json_loads
 from .llm_provider import LLMProvider, LLMResponse
 from .prompts import (
     _entries_to_compact_text,
@@ -43,21 +47,44 @@ _DEFAULT_CORRELATION_THRESHOLD = 2   # Min tag overlap to correlate
 _DEFAULT_SYNTHESIS_MIN_GROUP = 3     # Min entries for synthesis suggestion
 _DEFAULT_MAX_TOKENS = 4096
 _DEFAULT_TOKEN_BUDGET = 16000
+# Chars of token_budget held back for each prompt template's fixed text, so
+# variable-length sections never push the trailing instructions out
+_PROMPT_RESERVE_CHARS = 500
 
 # Opposing keyword pairs for heuristic contradiction detection
-_OPPOSING_KEYWORDS = [
+_OPPOSING_KEYWORDS: Tuple[Tuple[str, str], ...] = (
     ("MUST", "NEVER"),
     ("ALWAYS", "NEVER"),
     ("MUST", "MUST NOT"),
     ("before", "after"),
-]
+)
+
+# One bit per distinct lowercased opposing keyword. Rules are scanned for
+# each keyword once per entry; pairs are then compared with integer ANDs.
+_KEYWORD_BITS: Dict[str, int] = {
+    kw: 1 << idx
+    for idx, kw in enumerate(dict.fromkeys(
+        k.lower() for pair in _OPPOSING_KEYWORDS for k in pair
+    ))
+}
+_KEYWORD_BIT_ITEMS: Tuple[Tuple[str, int], ...] = tuple(_KEYWORD_BITS.items())
+_OPPOSING_KEYWORD_MASKS: Tuple[Tuple[str, str, int, int], ...] = tuple(
+    (kw_pos, kw_neg, _KEYWORD_BITS[kw_pos.lower()], _KEYWORD_BITS[kw_neg.lower()])
+    for kw_pos, kw_neg in _OPPOSING_KEYWORDS
+)
+
+# A source ref's file path ends at the first of these (":L12", "::sym", "#anchor")
+_SOURCE_DELIMS = (":", "#")
+
+# Markdown code fence wrapping an LLM JSON payload
+_MD_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?\s*```", re.DOTALL)
 
 
 # ---------------------------------------------------------------------------
 # Data types — Correlation
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class CorrelationGroup:
     """A group of related entries found by correlation analysis."""
     entry_ids: List[str] = field(default_factory=list)
@@ -66,7 +93,7 @@ class CorrelationGroup:
     strength: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CorrelationReport:
     """Summary of correlation analysis."""
     total_entries: int = 0
@@ -79,7 +106,7 @@ class CorrelationReport:
 # Data types — Contradiction
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ContradictionPair:
     """A pair of potentially conflicting entries."""
     entry_id_a: str = ""
@@ -89,7 +116,7 @@ class ContradictionPair:
     confidence: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ContradictionReport:
     """Summary of contradiction detection."""
     total_entries: int = 0
@@ -102,7 +129,7 @@ class ContradictionReport:
 # Data types — Synthesis
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class SynthesisSuggestion:
     """A suggestion to consolidate multiple entries into one principle."""
     source_entry_ids: List[str] = field(default_factory=list)
@@ -111,7 +138,7 @@ class SynthesisSuggestion:
     rationale: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SynthesisReport:
     """Summary of knowledge synthesis."""
     total_entries: int = 0
@@ -124,7 +151,7 @@ class SynthesisReport:
 # Data types — Risk
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class RiskAnnotation:
     """A risk annotation for a search result entry."""
     entry_id: str = ""
@@ -133,7 +160,7 @@ class RiskAnnotation:
     related_entry_ids: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskReport:
     """Summary of risk assessment."""
     query: str = ""
@@ -146,7 +173,7 @@ class RiskReport:
 # Data types — Comprehensive
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ReasoningReport:
     """Comprehensive reasoning report combining all analyses."""
     total_entries: int = 0
@@ -207,17 +234,19 @@ def _parse_llm_json(response_text: str) -> Optional[dict]:
 
     text = response_text.strip()
 
-    # Try raw JSON first
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
+    # Try raw JSON first (a fenced response can never parse raw, so skip
+    # the doomed full-text decode)
+    if not text.startswith("```"):
+        try:
+            return json_loads(text)
+        except json.JSONDecodeError:
+            pass
 
     # Try extracting from markdown code block
-    md_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?\s*```", text, re.DOTALL)
+    md_match = _MD_FENCE_RE.search(text)
     if md_match:
         try:
-            return json.loads(md_match.group(1).strip())
+            return json_loads(md_match.group(1).strip())
         except json.JSONDecodeError:
             pass
 
@@ -226,7 +255,7 @@ def _parse_llm_json(response_text: str) -> Optional[dict]:
     brace_end = text.rfind("}")
     if brace_start >= 0 and brace_end > brace_start:
         try:
-            return json.loads(text[brace_start:brace_end + 1])
+            return json_loads(text[brace_start:brace_end + 1])
         except json.JSONDecodeError:
             pass
 
@@ -234,6 +263,146 @@ def _parse_llm_json(response_text: str) -> Optional[dict]:
     return None
 
 
+def _join_within_budget(
+    parts: Iterable[str],
+    max_chars: int,
+    sep: str = "\n",
+) -> Tuple[str, int]:
+    """
+    Join prompt parts until max_chars would be exceeded.
+
+    The prompt templates truncate their whole user prompt to the budget,
+    which cuts off the closing instructions when a section runs long and
+    wastes the call. Budgeting whole items up front keeps every prompt
+    intact; omitted items are noted in the text.
+
+    Returns:
+        (text, number of parts kept)
+    """
+    kept: List[str] = []
+    used = 0
+    for part in parts:
+        cost = len(part) + (len(sep) if kept else 0)
+        if used + cost > max_chars:
+            kept.append("... (remaining items omitted due to token budget)")
+            return sep.join(kept), len(kept) - 1
+        kept.append(part)
+        used += cost
+    return sep.join(kept), len(kept)
+
+
+# ---------------------------------------------------------------------------
+# Heuristic helpers
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=8192)
+def _parse_timestamp_cached(timestamp: str) -> Optional[datetime]:
+    """Memoized _parse_iso8601 that returns None instead of raising."""
+    try:
+        return _parse_iso8601(timestamp)
+    except ValueError:
+        return None
+
+
+def _entry_timestamp(value) -> Optional[datetime]:
+    """
+    Parse an entry timestamp field (created_at / last_verified).
+
+    Memoized on the ISO string, so correlation and risk passes over the
+    same entries parse each timestamp once. Returns None when the value
+    is missing or unparseable.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    return _parse_timestamp_cached(value)
+
+
+def _index_tags(
+    entry_list: List[Tuple[str, dict]],
+) -> Tuple[List[int], List[str], List[List[int]]]:
+    """
+    Index entry tags in one pass.
+
+    Each entry's tags are packed into an int bitset over a shared tag
+    index, so pairwise tag overlap is ``bits_a & bits_b`` plus a popcount
+    instead of building two Python sets for every pair.
+
+    Returns:
+        (bitsets, tag_names, postings) — bitsets[i] belongs to
+        entry_list[i]; bit k stands for tag_names[k]; postings[k] lists
+        the (ascending) entry indices carrying tag k.
+    """
+    tag_index: Dict[str, int] = {}
+    bitsets: List[int] = []
+    postings: List[List[int]] = []
+    for idx, (_eid, entry) in enumerate(entry_list):
+        bits = 0
+        for tag in entry.get("tags", []):
+            k = tag_index.get(tag)
+            if k is None:
+                k = tag_index[tag] = len(tag_index)
+                postings.append([])
+            bit = 1 << k
+            if not bits & bit:
+                bits |= bit
+                postings[k].append(idx)
+        bitsets.append(bits)
+    return bitsets, list(tag_index), postings
+
+
+def _tag_sharing_pairs(postings: List[List[int]]) -> List[Tuple[int, int]]:
+    """
+    Index pairs (i < j) of entries that share at least one tag, sorted.
+
+    Built from the tag postings of :func:`_index_tags`, so the cost follows
+    the number of tag-sharing pairs rather than N^2.
+    """
+    pairs: set = set()
+    for idxs in postings:
+        if len(idxs) > 1:
+            pairs.update(combinations(idxs, 2))
+    return sorted(pairs)
+
+
+def _keyword_mask(rule: str) -> int:
+    """Bitmask of the opposing keywords (case-insensitive) present in a rule."""
+    rule_lc = rule.lower()
+    mask = 0
+    for kw, bit in _KEYWORD_BIT_ITEMS:
+        if kw in rule_lc:
+            mask |= bit
+    return mask
+
+
+def _source_file_path(src: str) -> str:
+    """Return the file path part of a source ref (before the first ':' or '#')."""
+    end = len(src)
+    for delim in _SOURCE_DELIMS:
+        pos = src.find(delim, 0, end)
+        if pos >= 0:
+            end = pos
+    return src[:end]
+
+
+def _uf_find(parent: Dict[str, str], eid: str) -> str:
+    """Union-find root lookup with path halving; unseen ids become singletons."""
+    parent.setdefault(eid, eid)
+    while parent[eid] != eid:
+        parent[eid] = parent[parent[eid]]
+        eid = parent[eid]
+    return eid
+
+
+def _bits_to_tags(bits: int, tag_names: List[str]) -> List[str]:
+    """Decode a tag bitset back into its sorted tag names."""
+    tags = []
+    while bits:
+        low = bits & -bits
+        tags.append(tag_names[low.bit_length() - 1])
+        bits ^= low
+    return sorted(tags)
+
+
 # ---------------------------------------------------------------------------
 # Core function 1: find_correlations
 # ---------------------------------------------------------------------------
@@ -272,70 +441,83 @@ def find_correlations(
 
     # --- Stage 1: Heuristic pre-filter ---
 
-    # Tag overlap
-    for i in range(len(entry_list)):
-        eid_a, entry_a = entry_list[i]
-        tags_a = set(entry_a.get("tags", []))
-        for j in range(i + 1, len(entry_list)):
-            eid_b, entry_b = entry_list[j]
-            tags_b = set(entry_b.get("tags", []))
-            overlap = tags_a & tags_b
-            if len(overlap) >= threshold:
-                key = f"tag:{','.join(sorted(overlap))}"
-                if key not in seen_groups:
-                    seen_groups[key] = set()
-                seen_groups[key].add(eid_a)
-                seen_groups[key].add(eid_b)
-
-    # Source file overlap (extract file path from source strings)
+    # Index tags, then collect source files and timestamps in one shared
+    # pass instead of a separate walk over entry_list for each heuristic.
+    tag_bits, tag_names, postings = _index_tags(entry_list)
     source_files: Dict[str, List[str]] = {}
+    entry_times: List[Tuple[str, float]] = []  # (eid, epoch seconds)
     for eid, entry in entry_list:
         for src in entry.get("source", []):
             # Extract file path (before :L or # or ::)
-            file_path = re.split(r"[::#]", src)[0]
+            file_path = _source_file_path(src)
             if file_path:
                 source_files.setdefault(file_path, []).append(eid)
-
+        ts = _entry_timestamp(entry.get("created_at"))
+        if ts:
+            entry_times.append((eid, ts.timestamp()))
+
+    # Tag overlap — only pairs sharing a tag can reach a positive threshold
+    if threshold > 0:
+        tag_pairs = _tag_sharing_pairs(postings)
+    else:
+        tag_pairs = combinations(range(len(entry_list)), 2)
+    for i, j in tag_pairs:
+        overlap = tag_bits[i] & tag_bits[j]
+        if overlap.bit_count() >= threshold:
+            key = f"tag:{','.join(_bits_to_tags(overlap, tag_names))}"
+            if key not in seen_groups:
+                seen_groups[key] = set()
+            seen_groups[key].add(entry_list[i][0])
+            seen_groups[key].add(entry_list[j][0])
+
+    # Source file overlap
     for file_path, eids in source_files.items():
         if len(eids) >= 2:
             key = f"source:{file_path}"
             seen_groups[key] = set(eids)
 
     # Temporal proximity (within 24h)
-    entry_times: List[Tuple[str, datetime]] = []
-    for eid, entry in entry_list:
-        try:
-            ts = _parse_iso8601(entry.get("created_at", ""))
-        except (ValueError, TypeError):
-            ts = None
-        if ts:
-            entry_times.append((eid, ts))
     entry_times.sort(key=lambda x: x[1])
 
     for i in range(len(entry_times)):
+        eid_i, ts_i = entry_times[i]
         for j in range(i + 1, len(entry_times)):
-            diff = abs((entry_times[j][1] - entry_times[i][1]).total_seconds())
-            if diff <= 86400:  # 24 hours
-                key = f"temporal:{entry_times[i][0]},{entry_times[j][0]}"
-                seen_groups[key] = {entry_times[i][0], entry_times[j][0]}
+            eid_j, ts_j = entry_times[j]
+            if ts_j - ts_i <= 86400:  # 24 hours (sorted, so never negative)
+                key = f"temporal:{eid_i},{eid_j}"
+                seen_groups[key] = {eid_i, eid_j}
             else:
                 break  # Sorted, so no need to check further
 
-    # Convert to CorrelationGroup objects (merge overlapping groups by entry set)
-    unique_sets: List[Tuple[frozenset, str]] = []
-    for key, id_set in seen_groups.items():
-        rel_type = key.split(":")[0]
-        # Check if this set is a subset of an existing group
-        merged = False
-        for idx, (existing_set, existing_rel) in enumerate(unique_sets):
-            if id_set & existing_set:
-                unique_sets[idx] = (existing_set | frozenset(id_set), f"{existing_rel}+{rel_type}")
-                merged = True
-                break
-        if not merged:
-            unique_sets.append((frozenset(id_set), rel_type))
-
-    for id_set, rel_type in unique_sets:
+    # Convert to CorrelationGroup objects (merge overlapping groups by entry set).
+    # Union-find over entry ids keeps this near-linear in total group members;
+    # each component remembers its first-seen order and contributing rel types.
+    parent: Dict[str, str] = {}
+    components: Dict[str, Tuple[int, List[str]]] = {}  # root -> (order, rel types)
+    for order, (key, id_set) in enumerate(seen_groups.items()):
+        rel_type = key.partition(":")[0]
+        roots = {_uf_find(parent, eid) for eid in id_set}
+        merged = sorted(
+            (components.pop(r), r) for r in roots if r in components
+        )
+        if merged:
+            (first_order, rels), root = merged[0]
+            for (_order, other_rels), _root in merged[1:]:
+                rels.extend(other_rels)
+        else:
+            first_order, rels, root = order, [], next(iter(roots))
+        rels.append(rel_type)
+        for r in roots:
+            parent[r] = root
+        components[root] = (first_order, rels)
+
+    members: Dict[str, List[str]] = {}
+    for eid in parent:
+        members.setdefault(_uf_find(parent, eid), []).append(eid)
+
+    for root, (_order, rels) in sorted(components.items(), key=lambda x: x[1][0]):
+        rel_type = "+".join(rels)
+        id_set = members[root]
         report.groups.append(CorrelationGroup(
             entry_ids=sorted(id_set),
             relationship=rel_type,
@@ -346,14 +528,17 @@ def find_correlations(
     # --- Stage 2: LLM enrichment ---
     llm_calls = 0
     if llm_provider and entries:
+        # Rendering stops at the char budget, so stream the values rather
+        # than copying the whole corpus into a list first
         entries_text = _entries_to_compact_text(
-            list(entries.values()),
+            entries.values(),
             max_chars=rc["token_budget"] // 2,
         )
-        groups_text = "\n".join(
-            f"Group: {g.entry_ids} — {g.relationship}"
-            for g in report.groups
-        ) or "None found"
+        groups_text, _kept = _join_within_budget(
+            (f"Group: {g.entry_ids} — {g.relationship}" for g in report.groups),
+            max_chars=rc["token_budget"] // 2 - _PROMPT_RESERVE_CHARS,
+        )
+        groups_text = groups_text or "None found"
 
         sys_prompt, user_prompt = correlation_prompt(
             entries_text, groups_text,
@@ -419,85 +604,95 @@ def detect_contradictions(
 
     entry_list = list(entries.items())
     candidate_pairs: List[ContradictionPair] = []
+    seen_pair_keys: set = set()  # (eid_a, eid_b) already in candidate_pairs
 
     # --- Stage 1: Heuristic pre-filter ---
-    for i in range(len(entry_list)):
+    tag_bits, tag_names, postings = _index_tags(entry_list)
+    kw_masks = [_keyword_mask(entry.get("rule") or "") for _eid, entry in entry_list]
+    # Severities interned to small ints once (-1 = missing), so the pair
+    # check is an int compare rather than string hashing per pair
+    sev_index: Dict[str, int] = {}
+    sev_ids = [
+        sev_index.setdefault(sev, len(sev_index)) if sev else -1
+        for sev in (entry.get("severity", "") for _eid, entry in entry_list)
+    ]
+
+    # Must share at least one tag to be comparable
+    for i, j in _tag_sharing_pairs(postings):
         eid_a, entry_a = entry_list[i]
-        rule_a = (entry_a.get("rule") or "").strip()
-        tags_a = set(entry_a.get("tags", []))
-
-        for j in range(i + 1, len(entry_list)):
-            eid_b, entry_b = entry_list[j]
-            rule_b = (entry_b.get("rule") or "").strip()
-            tags_b = set(entry_b.get("tags", []))
-
-            # Must share at least one tag to be comparable
-            if not (tags_a & tags_b):
-                continue
-
-            # Check for opposing keywords in rules
-            if rule_a and rule_b:
-                for kw_pos, kw_neg in _OPPOSING_KEYWORDS:
-                    a_has_pos = kw_pos.lower() in rule_a.lower()
-                    a_has_neg = kw_neg.lower() in rule_a.lower()
-                    b_has_pos = kw_pos.lower() in rule_b.lower()
-                    b_has_neg = kw_neg.lower() in rule_b.lower()
-
-                    if (a_has_pos and b_has_neg) or (a_has_neg and b_has_pos):
-                        candidate_pairs.append(ContradictionPair(
-                            entry_id_a=eid_a,
-                            entry_id_b=eid_b,
-                            type="rule_conflict",
-                            explanation=(
-                                f"Opposing keywords: '{kw_pos}'/'{kw_neg}' "
-                                f"in rules of entries sharing tags {sorted(tags_a & tags_b)}"
-                            ),
-                            confidence=0.6,
-                        ))
-                        break  # One conflict per pair is enough
-
-            # Severity mismatch on same topic
-            sev_a = entry_a.get("severity", "")
-            sev_b = entry_b.get("severity", "")
-            tag_overlap = len(tags_a & tags_b)
-            if sev_a and sev_b and sev_a != sev_b and tag_overlap >= 2:
-                # Don't duplicate if already found as rule_conflict
-                existing_pair = any(
-                    p.entry_id_a == eid_a and p.entry_id_b == eid_b
-                    for p in candidate_pairs
-                )
-                if not existing_pair:
+        eid_b, entry_b = entry_list[j]
+        shared_bits = tag_bits[i] & tag_bits[j]
+        kw_a = kw_masks[i]
+        kw_b = kw_masks[j]
+
+        # Check for opposing keywords in rules (an empty mask means the
+        # rule is blank or has no opposing keyword at all)
+        if kw_a and kw_b:
+            for kw_pos, kw_neg, pos_bit, neg_bit in _OPPOSING_KEYWORD_MASKS:
+                if ((kw_a & pos_bit and kw_b & neg_bit)
+                        or (kw_a & neg_bit and kw_b & pos_bit)):
+                    seen_pair_keys.add((eid_a, eid_b))
                     candidate_pairs.append(ContradictionPair(
                         entry_id_a=eid_a,
                         entry_id_b=eid_b,
-                        type="severity_mismatch",
+                        type="rule_conflict",
                         explanation=(
-                            f"Different severity ({sev_a} vs {sev_b}) for "
-                            f"entries sharing tags {sorted(tags_a & tags_b)}"
+                            f"Opposing keywords: '{kw_pos}'/'{kw_neg}' "
+                            f"in rules of entries sharing tags "
+                            f"{_bits_to_tags(shared_bits, tag_names)}"
                         ),
-                        confidence=0.4,
+                        confidence=0.6,
                     ))
+                    break  # One conflict per pair is enough
+
+        # Severity mismatch on same topic
+        sev_a_id = sev_ids[i]
+        sev_b_id = sev_ids[j]
+        if (sev_a_id >= 0 and sev_b_id >= 0 and sev_a_id != sev_b_id
+                and shared_bits.bit_count() >= 2):
+            sev_a = entry_a["severity"]
+            sev_b = entry_b["severity"]
+            # Don't duplicate if already found as rule_conflict
+            if (eid_a, eid_b) not in seen_pair_keys:
+                seen_pair_keys.add((eid_a, eid_b))
+                candidate_pairs.append(ContradictionPair(
+                    entry_id_a=eid_a,
+                    entry_id_b=eid_b,
+                    type="severity_mismatch",
+                    explanation=(
+                        f"Different severity ({sev_a} vs {sev_b}) for "
+                        f"entries sharing tags {_bits_to_tags(shared_bits, tag_names)}"
+                    ),
+                    confidence=0.4,
+                ))
 
     report.pairs = candidate_pairs
 
     # --- Stage 2: LLM enrichment ---
     if llm_provider and candidate_pairs:
-        pairs_text = "\n".join(
-            f"Pair: [{p.entry_id_a}] vs [{p.entry_id_b}]\n"
-            f"  Entry A rule: {entries.get(p.entry_id_a, {}).get('rule', 'N/A')}\n"
-            f"  Entry B rule: {entries.get(p.entry_id_b, {}).get('rule', 'N/A')}\n"
-            f"  Shared tags: {sorted(set(entries.get(p.entry_id_a, {}).get('tags', [])) & set(entries.get(p.entry_id_b, {}).get('tags', [])))}\n"
-            f"  Heuristic type: {p.type}\n"
-            for p in candidate_pairs
+        pairs_text, pairs_kept = _join_within_budget(
+            (
+                f"Pair: [{p.entry_id_a}] vs [{p.entry_id_b}]\n"
+                f"  Entry A rule: {entries.get(p.entry_id_a, {}).get('rule', 'N/A')}\n"
+                f"  Entry B rule: {entries.get(p.entry_id_b, {}).get('rule', 'N/A')}\n"
+                f"  Shared tags: {sorted(set(entries.get(p.entry_id_a, {}).get('tags', [])) & set(entries.get(p.entry_id_b, {}).get('tags', [])))}\n"
+                f"  Heuristic type: {p.type}\n"
+                for p in candidate_pairs
+            ),
+            max_chars=rc["token_budget"] - _PROMPT_RESERVE_CHARS,
         )
 
-        sys_prompt, user_prompt = contradiction_prompt(
-            pairs_text, max_input_chars=rc["token_budget"],
-        )
-        response = _safe_llm_call(
-            llm_provider, sys_prompt, user_prompt,
-            max_tokens=rc["max_tokens"],
-        )
+        response = None
+        if pairs_kept:
+            sys_prompt, user_prompt = contradiction_prompt(
+                pairs_text, max_input_chars=rc["token_budget"],
+            )
+            response = _safe_llm_call(
+                llm_provider, sys_prompt, user_prompt,
+                max_tokens=rc["max_tokens"],
+            )
+        else:
+            logger.info("Skipping contradiction LLM enrichment: no pair fits token_budget")
 
         if response:
             parsed = _parse_llm_json(response.text)
@@ -591,15 +786,16 @@ def suggest_syntheses(
 
     # --- Stage 2: LLM enrichment ---
     if llm_provider and heuristic_suggestions:
-        cluster_text = ""
+        cluster_budget = rc["token_budget"] // max(len(heuristic_suggestions), 1)
+        cluster_parts: List[str] = []
         for idx, sugg in enumerate(heuristic_suggestions):
             cluster_entries = [entries[eid] for eid in sugg.source_entry_ids if eid in entries]
-            cluster_text += f"Cluster {idx + 1} ({sugg.rationale}):\n"
-            cluster_text += _entries_to_compact_text(
-                cluster_entries,
-                max_chars=rc["token_budget"] // max(len(heuristic_suggestions), 1),
-            )
-            cluster_text += "\n"
+            cluster_parts.append(f"Cluster {idx + 1} ({sugg.rationale}):\n")
+            cluster_parts.append(_entries_to_compact_text(
+                cluster_entries, max_chars=cluster_budget,
+            ))
+            cluster_parts.append("\n")
+        cluster_text = "".join(cluster_parts)
 
         sys_prompt, user_prompt = synthesis_prompt(
             cluster_text, max_input_chars=rc["token_budget"],
@@ -681,15 +877,8 @@ def assess_risks(
             continue
 
         # Check for stale/old entries
-        try:
-            created_at = _parse_iso8601(entry.get("created_at", ""))
-        except (ValueError, TypeError):
-            created_at = None
-        try:
-            lv = entry.get("last_verified")
-            last_verified = _parse_iso8601(lv) if lv else None
-        except (ValueError, TypeError):
-            last_verified = None
+        created_at = _entry_timestamp(entry.get("created_at"))
+        last_verified = _entry_timestamp(entry.get("last_verified"))
         ref_time = last_verified or created_at
 
         risk_level = "info"
@@ -797,37 +986,48 @@ def build_reasoning_report(
     """
     t0 = time.monotonic()
 
-    # Load entries
-    entries = _load_entries_latest_wins(events_path)
-    # Filter deprecated
-    active_entries = {
-        eid: e for eid, e in entries.items()
-        if not e.get("deprecated", False)
-    }
+    # Load entries, then drop deprecated ones in place rather than copying
+    # into a second dict. (Filtering cannot happen inside the latest-wins
+    # reducer: a later deprecated record must still evict the earlier one.)
+    active_entries = _load_entries_latest_wins(events_path)
+    deprecated_ids = [
+        eid for eid, e in active_entries.items()
+        if e.get("deprecated", False)
+    ]
+    for eid in deprecated_ids:
+        del active_entries[eid]
 
     report = ReasoningReport(total_entries=len(active_entries))
     total_llm_calls = 0
     total_tokens = 0
 
-    # Correlation
+    stages = []
     if not skip_correlations:
-        corr = find_correlations(active_entries, config, llm_provider)
-        report.correlation_report = corr
-        if corr.mode == "llm_enriched":
-            total_llm_calls += 1
-
-    # Contradiction
+        stages.append(("correlation_report", find_correlations))
     if not skip_contradictions:
-        contr = detect_contradictions(active_entries, config, llm_provider)
-        report.contradiction_report = contr
-        if contr.mode == "llm_enriched":
-            total_llm_calls += 1
-
-    # Synthesis
+        stages.append(("contradiction_report", detect_contradictions))
     if not skip_syntheses:
-        synth = suggest_syntheses(active_entries, config, llm_provider)
-        report.synthesis_report = synth
-        if synth.mode == "llm_enriched":
+        stages.append(("synthesis_report", suggest_syntheses))
+
+    if llm_provider and len(stages) > 1:
+        # Each stage's LLM enrichment is an independent network round-trip;
+        # run the stages concurrently so wall-clock is the slowest call
+        # rather than the sum of all of them.
+        with ThreadPoolExecutor(max_workers=len(stages)) as pool:
+            futures = [
+                (attr, pool.submit(fn, active_entries, config, llm_provider))
+                for attr, fn in stages
+            ]
+            results = [(attr, fut.result()) for attr, fut in futures]
+    else:
+        results = [
+            (attr, fn(active_entries, config, llm_provider))
+            for attr, fn in stages
+        ]
+
+    for attr, sub_report in results:
+        setattr(report, attr, sub_report)
+        if sub_report.mode == "llm_enriched":
             total_llm_calls += 1
 
     # Determine overall mode
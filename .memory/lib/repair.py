@@ -12,7 +12,8 @@ Usage:
     from lib.repair import repair_events, detect_merge_markers
     report = repair_events(events_path, project_root)
 
-No external dependencies — pure Python stdlib.
+No external dependencies — pure Python stdlib (orjson used for decoding
+when installed, via events_io).
 """
 
 import json
@@ -21,14 +22,25 @@ import os
 import re
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .events_io import iter_jsonl_lines, json_loads
 
 logger = logging.getLogger("efm.repair")
 
-# Git merge conflict marker patterns
-_MERGE_MARKER_RE = re.compile(r"^(<{7}|={7}|>{7})(\s|$)")
+# Git merge conflict marker prefixes (compared against raw bytes)
+_MERGE_MARKERS = frozenset((b"<<<<<<<", b"=======", b">>>>>>>"))
+
+# Rewrite I/O: file buffer size, and how much encoded output to batch per write
+_WRITE_BUFFER = 1 << 20
+_WRITE_FLUSH = 4 << 20
+
+# File path part of a source ref: everything before the first '#' or ':'
+_FILE_PART_RE = re.compile(r"[^#:]*")
 
 
 # ---------------------------------------------------------------------------
@@ -43,6 +55,14 @@ class OrphanSource:
     missing_sources: List[str]
 
 
+@dataclass
+class _ReadStats:
+    """Counters filled in while :func:`_read_raw_lines` streams the file."""
+    total_valid: int = 0             # parsed JSON lines carrying an id
+    markers: int = 0                 # merge marker lines skipped
+    stale_skipped: int = 0           # older duplicates not passed to dedup
+
+
 @dataclass
 class RepairReport:
     """Result of a repair operation."""
@@ -65,105 +85,172 @@ class RepairReport:
 # Detection (read-only)
 # ---------------------------------------------------------------------------
 
-def detect_merge_markers(events_path: Path) -> int:
+def _is_merge_marker(line: bytes) -> bool:
+    """True if ``line`` is a git conflict marker (7 chars + space/EOL)."""
+    return line[:7] in _MERGE_MARKERS and (
+        len(line) == 7 or line[7:8].isspace()
+    )
+
+
+def has_merge_markers(events_path: Path) -> bool:
     """
-    Fast check: count git merge conflict marker lines in events.jsonl.
+    Fast check: does events.jsonl contain any git merge conflict marker?
 
-    Returns the number of marker lines found (0 = clean).
-    Designed for startup health check (<1ms on typical files).
+    Stops at the first marker line, so a conflicted file is detected
+    without reading past the first conflict region.  Designed for the
+    startup health check.
+    """
+    if not events_path.exists():
+        return False
+
+    try:
+        with open(events_path, "rb") as f:
+            for line in iter_jsonl_lines(f):
+                if _is_merge_marker(line):
+                    return True
+    except OSError:
+        pass
+    return False
+
+
+def count_merge_markers(events_path: Path) -> int:
+    """
+    Count git merge conflict marker lines in events.jsonl.
+
+    Returns the number of marker lines found (0 = clean).  Scans the whole
+    file; use :func:`has_merge_markers` when only presence matters.
     """
     if not events_path.exists():
         return 0
 
     count = 0
     try:
-        with open(events_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if _MERGE_MARKER_RE.match(line):
+        with open(events_path, "rb") as f:
+            for line in iter_jsonl_lines(f):
+                if _is_merge_marker(line):
                     count += 1
     except OSError:
         pass
     return count
 
 
+# Backward-compatible name for count_merge_markers
+detect_merge_markers = count_merge_markers
+
+
 # ---------------------------------------------------------------------------
 # Core repair
 # ---------------------------------------------------------------------------
 
-def _read_raw_lines(events_path: Path) -> Tuple[List[dict], int, int]:
+# Winners map used during dedup: id -> (created_at, file position, entry)
+_Winners = Dict[str, Tuple[str, int, dict]]
+
+
+def _is_stale_duplicate(entry: dict, best: _Winners) -> bool:
     """
-    Read events.jsonl, separating valid entries from merge markers.
+    True if the parsed ``entry`` is certain to lose to the winner in ``best``.
 
-    Returns:
-        (entries_with_position, total_valid, markers_found)
-        Each entry has an extra '_pos' key with its line index.
+    Only a strictly older created_at string qualifies: equal timestamps go
+    to the later line, so those still go through dedup.
+    """
+    existing = best.get(entry["id"])
+    if existing is None:
+        return False
+    created_at = entry.get("created_at")
+    return isinstance(created_at, str) and created_at < existing[0]
+
+
+def _read_raw_lines(
+    events_path: Path,
+    stats: Optional[_ReadStats] = None,
+    best: Optional[_Winners] = None,
+) -> Iterator[Tuple[int, dict]]:
+    """
+    Stream events.jsonl, skipping merge markers and invalid lines.
+
+    Yields ``(line_index, entry)`` for each valid entry; the entry dict is
+    yielded exactly as parsed.  Nothing is retained between lines, so
+    memory stays flat no matter how large the file is; marker and
+    valid-entry counts are accumulated into ``stats`` when one is given.
+
+    If ``best`` (the live winners dict of :func:`_resolve_by_newest`) is
+    given, parsed entries that are older duplicates of a current winner
+    are counted in ``stats.total_valid`` and ``stats.stale_skipped`` but
+    not yielded.
     """
-    entries: List[dict] = []
-    markers = 0
-    total_valid = 0
+    if stats is None:
+        stats = _ReadStats()
 
     if not events_path.exists():
-        return entries, 0, 0
+        return
 
-    with open(events_path, "r", encoding="utf-8") as f:
-        for i, line in enumerate(f):
+    with open(events_path, "rb") as f:
+        for i, line in enumerate(iter_jsonl_lines(f)):
             stripped = line.strip()
             if not stripped:
                 continue
-            if _MERGE_MARKER_RE.match(stripped):
-                markers += 1
+            if _is_merge_marker(stripped):
+                stats.markers += 1
                 continue
             try:
-                entry = json.loads(stripped)
-                entry_id = entry.get("id")
-                if entry_id:
-                    entry["_pos"] = i  # track file position for tiebreaking
-                    entries.append(entry)
-                    total_valid += 1
-            except json.JSONDecodeError:
+                entry = json_loads(stripped)
+            except ValueError:  # JSONDecodeError or invalid UTF-8
                 logger.debug("Skipping invalid JSON at line %d", i + 1)
-
-    return entries, total_valid, markers
-
-
-def _resolve_by_newest(entries: List[dict]) -> Tuple[List[dict], int]:
+                continue
+            if entry.get("id"):
+                stats.total_valid += 1
+                if best and _is_stale_duplicate(entry, best):
+                    stats.stale_skipped += 1
+                    continue
+                yield i, entry
+
+
+def _resolve_by_newest(
+    entries: Iterable[Tuple[int, dict]],
+    best: Optional[_Winners] = None,
+) -> Tuple[List[dict], int]:
     """
     Deduplicate entries by ID, keeping the one with the newest created_at.
 
-    For entries with the same created_at (or missing timestamps), the one
-    appearing later in the file (higher _pos) wins — consistent with the
-    original latest-wins semantics.
+    ``entries`` yields ``(file_position, entry)`` pairs.  For entries with
+    the same created_at (or missing timestamps), the one appearing later
+    in the file wins — consistent with the original latest-wins semantics.
+    Positions live only in ``best`` (id -> (created_at, position, entry)),
+    so entry dicts are never mutated or copied.
+
+    ``entries`` may be any iterable (typically the :func:`_read_raw_lines`
+    stream); only the current winner per ID is held in memory.  Pass a
+    ``best`` dict shared with the reader to let it skip stale duplicates.
+
+    Survivors are returned sorted by created_at (stable, so equal stamps
+    keep first-seen order), reusing the timestamp each winner was already
+    compared on rather than looking it up again for a separate sort.
 
     Returns:
-        (unique_entries, duplicates_resolved)
+        (unique_entries, duplicates_resolved) — the count covers only the
+        entries seen here, not lines the reader skipped.
     """
-    best: Dict[str, dict] = {}
+    if best is None:
+        best = {}
+    seen = 0
 
-    for entry in entries:
+    for pos, entry in entries:
+        seen += 1
         entry_id = entry["id"]
-        if entry_id not in best:
-            best[entry_id] = entry
-            continue
-
-        existing = best[entry_id]
         new_ts = entry.get("created_at", "")
-        old_ts = existing.get("created_at", "")
-
-        if new_ts > old_ts:
-            best[entry_id] = entry
-        elif new_ts == old_ts:
-            # Same timestamp: file position tiebreak (later wins)
-            if entry.get("_pos", 0) > existing.get("_pos", 0):
-                best[entry_id] = entry
+        current = best.get(entry_id)
+        if current is None:
+            best[entry_id] = (new_ts, pos, entry)
+            continue
 
-    duplicates = len(entries) - len(best)
-    # Remove internal _pos marker before returning
-    result = []
-    for entry in best.values():
-        clean = {k: v for k, v in entry.items() if k != "_pos"}
-        result.append(clean)
+        old_ts, old_pos, _existing = current
+        # Newer timestamp wins; same timestamp: later file position wins
+        if new_ts > old_ts or (new_ts == old_ts and pos > old_pos):
+            best[entry_id] = (new_ts, pos, entry)
 
-    return result, duplicates
+    duplicates = seen - len(best)
+    winners = sorted(best.values(), key=itemgetter(0))
+    return [entry for _ts, _pos, entry in winners], duplicates
 
 
 def _check_orphan_sources(
@@ -173,29 +260,40 @@ def _check_orphan_sources(
     """
     Check which entries reference source files that don't exist.
 
-    Only checks file-path sources (not commit/PR references).
+    Only checks file-path sources (not commit/PR references).  Runs in two
+    passes: collect every referenced path, stat each distinct path once,
+    then match entries against the set of paths that exist.
     """
-    orphans: List[OrphanSource] = []
-
+    # Pass 1: collect (entry, [(src, file_part)]) and the distinct paths
+    file_refs: List[Tuple[dict, List[Tuple[str, str]]]] = []
+    referenced = set()
     for entry in entries:
         sources = entry.get("source", [])
         if not sources:
             continue
 
-        missing = []
+        refs = []
         for src in sources:
             # Skip non-file sources (commits, PRs, URLs)
             if src.startswith("commit ") or src.startswith("PR #"):
                 continue
             # Extract file path: "path/file.py:L10-L20" -> "path/file.py"
             # Also: "path/file.py#heading:L10" -> "path/file.py"
-            file_part = src.split("#")[0].split(":")[0].split("::")[0]
+            file_part = _FILE_PART_RE.match(src).group()
             if not file_part:
                 continue
-            full_path = project_root / file_part
-            if not full_path.exists():
-                missing.append(src)
+            refs.append((src, file_part))
+            referenced.add(file_part)
+        if refs:
+            file_refs.append((entry, refs))
+
+    # Pass 2: one stat per distinct path
+    existing = {p for p in referenced if (project_root / p).exists()}
 
+    # Pass 3: report entries with missing paths
+    orphans: List[OrphanSource] = []
+    for entry, refs in file_refs:
+        missing = [src for src, file_part in refs if file_part not in existing]
         if missing:
             orphans.append(OrphanSource(
                 entry_id=entry.get("id", "?"),
@@ -206,6 +304,53 @@ def _check_orphan_sources(
     return orphans
 
 
+def _rewrite_events(
+    events_path: Path,
+    entries: List[dict],
+    create_backup: bool,
+) -> str:
+    """
+    Atomically replace events.jsonl with ``entries``.
+
+    Returns the backup path ("" when no backup was requested).
+    """
+    bak = ""
+    if create_backup:
+        bak_path = events_path.with_suffix(".jsonl.bak")
+        shutil.copy2(str(events_path), str(bak_path))
+        bak = str(bak_path)
+
+    tmp_path = events_path.with_suffix(".jsonl.tmp")
+    buf = bytearray()
+    with open(tmp_path, "wb", buffering=_WRITE_BUFFER) as f:
+        for entry in entries:
+            buf += json.dumps(entry, ensure_ascii=False).encode("utf-8")
+            buf += b"\n"
+            if len(buf) >= _WRITE_FLUSH:
+                f.write(buf)
+                buf.clear()
+        if buf:
+            f.write(buf)
+    os.replace(str(tmp_path), str(events_path))
+    return bak
+
+
+def _reset_sync_cursor(events_path: Path) -> None:
+    """Reset the vectordb sync cursor so the next sync re-indexes."""
+    try:
+        db_path = events_path.parent / "vectors.db"
+        if db_path.exists():
+            from .vectordb import VectorDB
+            db = VectorDB(db_path)
+            db.open()
+            try:
+                db.set_sync_cursor(0)
+            finally:
+                db.close()
+    except Exception as e:
+        logger.warning("Could not reset sync cursor: %s", e)
+
+
 def repair_events(
     events_path: Path,
     project_root: Path,
@@ -216,10 +361,10 @@ def repair_events(
     Repair events.jsonl after git merge conflicts.
 
     Steps:
-      1. Read all lines, strip merge markers
-      2. Deduplicate by ID (newest created_at wins)
-      3. Sort by created_at
-      4. Detect orphan sources
+      1. Stream lines, strip merge markers
+      2. Deduplicate by ID (newest created_at wins) in the same pass
+      3. Sort survivors by created_at (done by the dedup step)
+      4. Detect orphan sources (concurrently with step 5 when writing)
       5. Atomically rewrite (unless dry_run)
 
     Args:
@@ -239,49 +384,37 @@ def repair_events(
         return report
 
     try:
-        # Step 1: Read and strip markers
-        raw_entries, total_valid, markers = _read_raw_lines(events_path)
-        report.merge_markers_removed = markers
-        report.entries_before = total_valid
-
-        # Step 2: Deduplicate
-        unique_entries, dups = _resolve_by_newest(raw_entries)
-        report.duplicate_ids_resolved = dups
+        # Steps 1-3: Stream lines (stripping markers) straight into dedup,
+        # which returns the survivors sorted by created_at
+        stats = _ReadStats()
+        best: _Winners = {}
+        unique_entries, dups = _resolve_by_newest(
+            _read_raw_lines(events_path, stats, best), best,
+        )
+        report.merge_markers_removed = stats.markers
+        report.entries_before = stats.total_valid
+        report.duplicate_ids_resolved = dups + stats.stale_skipped
         report.entries_after = len(unique_entries)
 
-        # Step 3: Sort by created_at
-        unique_entries.sort(key=lambda e: e.get("created_at", ""))
-
-        # Step 4: Check orphan sources
-        report.orphan_sources = _check_orphan_sources(unique_entries, project_root)
-
-        # Step 5: Write (unless dry_run)
+        # Steps 4+5: Orphan check and rewrite (unless dry_run).  The orphan
+        # check only stats files and never affects the bytes written, so it
+        # runs on a worker thread while the rewrite does its I/O.
         if not dry_run and report.needs_repair:
-            if create_backup:
-                bak_path = events_path.with_suffix(".jsonl.bak")
-                shutil.copy2(str(events_path), str(bak_path))
-                report.backup_path = str(bak_path)
-
-            # Atomic rewrite
-            tmp_path = events_path.with_suffix(".jsonl.tmp")
-            with open(tmp_path, "w", encoding="utf-8") as f:
-                for entry in unique_entries:
-                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
-            os.replace(str(tmp_path), str(events_path))
-
-            # Reset vectordb sync cursor (force re-index)
-            try:
-                db_path = events_path.parent / "vectors.db"
-                if db_path.exists():
-                    from .vectordb import VectorDB
-                    db = VectorDB(db_path)
-                    db.open()
-                    try:
-                        db.set_sync_cursor(0)
-                    finally:
-                        db.close()
-            except Exception as e:
-                logger.warning("Could not reset sync cursor: %s", e)
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                orphans = pool.submit(
+                    _check_orphan_sources, unique_entries, project_root,
+                )
+                try:
+                    report.backup_path = _rewrite_events(
+                        events_path, unique_entries, create_backup,
+                    )
+                finally:
+                    report.orphan_sources = orphans.result()
+            _reset_sync_cursor(events_path)
+        else:
+            report.orphan_sources = _check_orphan_sources(
+                unique_entries, project_root,
+            )
 
     except Exception as e:
         report.errors.append(str(e))
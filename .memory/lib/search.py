@@ -17,13 +17,22 @@ Boost table (from config):
 No external dependencies — pure Python stdlib + M1 lib modules.
 """
 
+import heapq
 import json
 import logging
+import operator
 import re
+import sys
 import time
-from dataclasses import dataclass, field
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING, Callable, Collection, Dict, FrozenSet, List, Optional, Tuple,
+    Union,
+)
 
 # Lazy imports: embedder/vectordb/text_builder are heavy modules (sqlite3, HTTP
 # clients, etc.) that are NOT needed for basic search mode.  By deferring them
@@ -36,14 +45,23 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("efm.search")
 
+# Sort keys for top-k selection: SearchResults, and basic mode's
+# (score, position, ...) tuples
+_score_key = operator.attrgetter("score")
+_first = operator.itemgetter(0)
+_second = operator.itemgetter(1)
+
+# Word tokenizer shared by query and entry tokenization in basic mode
+_WORD_RE = re.compile(r"\w+")
+
 
 # ---------------------------------------------------------------------------
 # Data types
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SearchResult:
-    """A single search result with scoring breakdown."""
+    """A single search result with scoring breakdown (immutable)."""
     entry_id: str
     entry: dict               # Full entry data from events.jsonl
     score: float              # Final composite score
@@ -54,7 +72,7 @@ class SearchResult:
     search_mode: str = ""     # "hybrid" | "vector" | "keyword" | "basic"
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchReport:
     """Summary of a search operation."""
     query: str
@@ -85,20 +103,20 @@ def _get_search_weights(config: dict) -> dict:
     }
 
 
+# Severity → weights key for the hard-classification boost
+_HARD_BOOST_KEYS = {
+    "S1": "hard_s1_boost",
+    "S2": "hard_s2_boost",
+    "S3": "hard_s3_boost",
+}
+
+
 def _compute_boost(entry: dict, weights: dict) -> float:
     """Compute classification + severity boost for an entry."""
-    classification = entry.get("classification", "")
-    severity = entry.get("severity", "")
-
-    if classification.lower() != "hard":
+    if entry.get("classification", "").lower() != "hard":
         return 0.0
-
-    boost_map = {
-        "S1": weights["hard_s1_boost"],
-        "S2": weights["hard_s2_boost"],
-        "S3": weights["hard_s3_boost"],
-    }
-    return boost_map.get(severity, 0.0)
+    key = _HARD_BOOST_KEYS.get(entry.get("severity", ""))
+    return weights[key] if key else 0.0
 
 
 def _compute_confidence_boost(entry: dict, weights: dict) -> float:
@@ -107,19 +125,38 @@ def _compute_confidence_boost(entry: dict, weights: dict) -> float:
     return weights.get("confidence_weight", 0.1) * confidence
 
 
+def _weights_fingerprint(weights: dict) -> tuple:
+    """Hashable snapshot of a weights dict, for cache keys."""
+    return tuple(sorted(weights.items()))
+
+
+def _entry_boosts(entry: dict, weights: dict) -> Tuple[float, float]:
+    """Return ``(boost, confidence_boost)`` for one scored candidate."""
+    return _compute_boost(entry, weights), _compute_confidence_boost(entry, weights)
+
+
 # ---------------------------------------------------------------------------
 # Entry loader (events.jsonl → dict by entry_id)
 # ---------------------------------------------------------------------------
 
-def _load_entries(events_path: Path) -> Dict[str, dict]:
+def _load_entries(
+    events_path: Path,
+    ids: Optional[Collection[str]] = None,
+) -> Dict[str, dict]:
     """
-    Load all entries from events.jsonl, resolving latest-wins.
+    Load entries from events.jsonl, resolving latest-wins.
 
     Returns {entry_id: latest_entry_dict}, excluding deprecated entries.
-    Thin wrapper around :func:`events_io.load_events_latest_wins`.
+    Thin wrapper around :func:`events_io.load_active_events_cached`, or
+    :func:`events_io.load_events_by_ids` when only ``ids`` are needed.
+    The full load is a shared snapshot; do not mutate it.
     """
-    from .events_io import load_events_latest_wins
-    entries, _total, _offset = load_events_latest_wins(events_path)
+    if ids is None:
+        from .events_io import load_active_events_cached
+        return load_active_events_cached(events_path)
+
+    from .events_io import load_events_by_ids
+    entries = load_events_by_ids(events_path, ids)
     # Filter out deprecated entries
     return {
         eid: e for eid, e in entries.items()
@@ -127,6 +164,61 @@ def _load_entries(events_path: Path) -> Dict[str, dict]:
     }
 
 
+# An entries dict, or a loader returning the (non-deprecated) entries for a
+# set of candidate ids.  Vector/keyword modes get a loader so only the few
+# candidates the vectordb returns are parsed, never the whole file.
+EntrySource = Union[Dict[str, dict], Callable[[Collection[str]], Dict[str, dict]]]
+
+
+def _resolve_entries(entries: EntrySource, ids: Collection[str]) -> Dict[str, dict]:
+    """Return the entries dict, loading only ``ids`` if given a loader."""
+    if callable(entries):
+        return entries(ids)
+    return entries
+
+
+# Query embeddings: (provider class, provider id, model, dims, text) ->
+# (monotonic time, vector).  An embedder call is a network round trip;
+# repeating the same query text within the TTL reuses the vector.
+_EMBED_CACHE_SIZE = 512
+_EMBED_CACHE_TTL = 600.0
+_embed_cache: "OrderedDict[tuple, Tuple[float, List[float]]]" = OrderedDict()
+
+
+def _embed_cache_key(embedder: "EmbeddingProvider", text: str) -> tuple:
+    return (
+        type(embedder), embedder.provider_id, embedder.model_name,
+        embedder.dimensions, text,
+    )
+
+
+def _cached_query_vector(
+    embedder: "EmbeddingProvider", text: str,
+) -> Optional[List[float]]:
+    """The cached query vector for ``text``, or None on a miss."""
+    key = _embed_cache_key(embedder, text)
+    hit = _embed_cache.get(key)
+    if hit is None or time.monotonic() - hit[0] > _EMBED_CACHE_TTL:
+        return None
+    _embed_cache.move_to_end(key)
+    return hit[1]
+
+
+def _embed_query(embedder: "EmbeddingProvider", text: str) -> List[float]:
+    """``embedder.embed_query(text).vector``, through the embedding cache."""
+    vector = _cached_query_vector(embedder, text)
+    if vector is not None:
+        return vector
+
+    vector = embedder.embed_query(text).vector
+    key = _embed_cache_key(embedder, text)
+    _embed_cache[key] = (time.monotonic(), vector)
+    _embed_cache.move_to_end(key)
+    if len(_embed_cache) > _EMBED_CACHE_SIZE:
+        _embed_cache.popitem(last=False)
+    return vector
+
+
 # ---------------------------------------------------------------------------
 # Search modes
 # ---------------------------------------------------------------------------
@@ -135,61 +227,87 @@ def _search_hybrid(
     query: str,
     vectordb: "VectorDB",
     embedder: "EmbeddingProvider",
-    entries: Dict[str, dict],
+    entries: EntrySource,
     weights: dict,
     context: Optional[dict],
     max_results: int,
+    min_score: float = 0.0,
 ) -> List[SearchResult]:
     """
     Level 1: Hybrid search — BM25 + Vector + Re-rank.
 
     Combines FTS5 keyword matching with semantic vector similarity.
+    Candidates scoring below ``min_score`` are dropped before ranking.
     """
     from .text_builder import build_query_text
 
     fetch_limit = max_results * 3  # Over-fetch for merging
 
+    # The embedder call is network I/O and independent of the FTS query,
+    # so on a cache miss it runs on a worker thread while FTS runs here.
+    # search_fts stays on the calling thread: the sqlite3 connection is
+    # opened with the default check_same_thread=True.
+    query_text = build_query_text(query, context)
+    query_vector = _cached_query_vector(embedder, query_text)
+    if query_vector is None:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            embed_future = pool.submit(_embed_query, embedder, query_text)
+            bm25_raw = vectordb.search_fts(query, limit=fetch_limit)
+            query_vector = embed_future.result()
+    else:
+        bm25_raw = vectordb.search_fts(query, limit=fetch_limit)
+
     # BM25 scores (already normalized relative to result set by search_fts)
-    bm25_raw = vectordb.search_fts(query, limit=fetch_limit)
     bm25_map: Dict[str, float] = {eid: score for eid, score in bm25_raw}
 
     # Vector scores
-    query_text = build_query_text(query, context)
-    query_result = embedder.embed_query(query_text)
     vec_raw = vectordb.search_vectors(
-        query_result.vector, limit=fetch_limit, exclude_deprecated=True,
+        query_vector, limit=fetch_limit, exclude_deprecated=True,
     )
-    # Normalize vector scores to [0, 1] relative to result set
+    # Normalize vector scores to [0, 1] relative to result set:
+    # ((sim+1)/2) / ((max+1)/2) == (sim+1) / (max+1), i.e. one add and one
+    # multiply per score with the reciprocal hoisted out of the loop.
     vec_map: Dict[str, float] = {}
     if vec_raw:
-        raw_sims = [(eid, (sim + 1.0) / 2.0) for eid, sim in vec_raw]
-        max_vec = max(s for _, s in raw_sims) if raw_sims else 1.0
-        for eid, s in raw_sims:
-            vec_map[eid] = s / max_vec if max_vec > 0 else 0.0
+        max_shifted = max(sim for _, sim in vec_raw) + 1.0
+        if max_shifted > 0:
+            inv = 1.0 / max_shifted
+            vec_map = {eid: (sim + 1.0) * inv for eid, sim in vec_raw}
+        else:
+            vec_map = dict.fromkeys((eid for eid, _ in vec_raw), 0.0)
 
     # Union of candidate IDs
-    candidate_ids = set(bm25_map.keys()) | set(vec_map.keys())
-
-    # Compute composite scores
-    results: List[SearchResult] = []
+    candidate_ids = bm25_map.keys() | vec_map.keys()
+    entries = _resolve_entries(entries, candidate_ids)
+
+    # Compute composite scores as plain tuples; SearchResult objects are
+    # only built for the top-K that are returned.
+    bm25_weight = weights["bm25_weight"]
+    vector_weight = weights["vector_weight"]
+    bm25_get = bm25_map.get
+    vec_get = vec_map.get
+    scored: List[Tuple[float, str, dict, float, float, float, float]] = []
     for eid in candidate_ids:
-        if eid not in entries:
+        entry = entries.get(eid)
+        if entry is None:
             continue  # Skip if entry not in current JSONL (or deprecated)
 
-        entry = entries[eid]
-        bm25_s = bm25_map.get(eid, 0.0)
-        vec_s = vec_map.get(eid, 0.0)
-        boost = _compute_boost(entry, weights)
-        conf_boost = _compute_confidence_boost(entry, weights)
+        bm25_s = bm25_get(eid, 0.0)
+        vec_s = vec_get(eid, 0.0)
+        boost, conf_boost = _entry_boosts(entry, weights)
 
         score = (
-            weights["bm25_weight"] * bm25_s
-            + weights["vector_weight"] * vec_s
+            bm25_weight * bm25_s
+            + vector_weight * vec_s
             + boost
             + conf_boost
         )
+        if score < min_score:
+            continue
+        scored.append((score, eid, entry, bm25_s, vec_s, boost, conf_boost))
 
-        results.append(SearchResult(
+    return [
+        SearchResult(
             entry_id=eid,
             entry=entry,
             score=score,
@@ -198,20 +316,22 @@ def _search_hybrid(
             boost=boost,
             confidence_boost=conf_boost,
             search_mode="hybrid",
-        ))
-
-    results.sort(key=lambda r: r.score, reverse=True)
-    return results[:max_results]
+        )
+        for score, eid, entry, bm25_s, vec_s, boost, conf_boost in heapq.nlargest(
+            max_results, scored, key=_first,
+        )
+    ]
 
 
 def _search_vector(
     query: str,
     vectordb: "VectorDB",
     embedder: "EmbeddingProvider",
-    entries: Dict[str, dict],
+    entries: EntrySource,
     weights: dict,
     context: Optional[dict],
     max_results: int,
+    min_score: float = 0.0,
 ) -> List[SearchResult]:
     """
     Level 2: Pure vector search (no FTS5 available).
@@ -221,11 +341,13 @@ def _search_vector(
     fetch_limit = max_results * 3
 
     query_text = build_query_text(query, context)
-    query_result = embedder.embed_query(query_text)
+    query_vector = _embed_query(embedder, query_text)
     vec_raw = vectordb.search_vectors(
-        query_result.vector, limit=fetch_limit, exclude_deprecated=True,
+        query_vector, limit=fetch_limit, exclude_deprecated=True,
     )
 
+    entries = _resolve_entries(entries, [eid for eid, _ in vec_raw])
+
     results: List[SearchResult] = []
     for eid, sim in vec_raw:
         if eid not in entries:
@@ -233,9 +355,10 @@ def _search_vector(
 
         entry = entries[eid]
         vec_s = (sim + 1.0) / 2.0  # Normalize to [0, 1]
-        boost = _compute_boost(entry, weights)
-        conf_boost = _compute_confidence_boost(entry, weights)
+        boost, conf_boost = _entry_boosts(entry, weights)
         score = vec_s + boost + conf_boost
+        if score < min_score:
+            continue
 
         results.append(SearchResult(
             entry_id=eid,
@@ -247,16 +370,16 @@ def _search_vector(
             search_mode="vector",
         ))
 
-    results.sort(key=lambda r: r.score, reverse=True)
-    return results[:max_results]
+    return heapq.nlargest(max_results, results, key=_score_key)
 
 
 def _search_keyword(
     query: str,
     vectordb: "VectorDB",
-    entries: Dict[str, dict],
+    entries: EntrySource,
     weights: dict,
     max_results: int,
+    min_score: float = 0.0,
 ) -> List[SearchResult]:
     """
     Level 3: Pure BM25 keyword search (no embedder available).
@@ -265,15 +388,18 @@ def _search_keyword(
 
     bm25_raw = vectordb.search_fts(query, limit=fetch_limit)
 
+    entries = _resolve_entries(entries, [eid for eid, _ in bm25_raw])
+
     results: List[SearchResult] = []
     for eid, bm25_s in bm25_raw:
         if eid not in entries:
             continue
 
         entry = entries[eid]
-        boost = _compute_boost(entry, weights)
-        conf_boost = _compute_confidence_boost(entry, weights)
+        boost, conf_boost = _entry_boosts(entry, weights)
         score = bm25_s + boost + conf_boost
+        if score < min_score:
+            continue
 
         results.append(SearchResult(
             entry_id=eid,
@@ -285,8 +411,134 @@ def _search_keyword(
             search_mode="keyword",
         ))
 
-    results.sort(key=lambda r: r.score, reverse=True)
-    return results[:max_results]
+    return heapq.nlargest(max_results, results, key=_score_key)
+
+
+def _entry_text_key(entry: dict) -> tuple:
+    """
+    Hashable snapshot of the fields basic search tokenizes.
+
+    Used as the :func:`_tokenize_entry` cache key, so an entry whose text
+    is unchanged between searches reuses its token set.
+    """
+    content = entry.get("content", [])
+    tags = entry.get("tags", [])
+    return (
+        entry.get("title", ""),
+        entry.get("rule") or "",
+        entry.get("implication") or "",
+        tuple(content) if isinstance(content, list) else (),
+        tuple(tags) if isinstance(tags, list) else (),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _tokenize_entry(text_key: tuple) -> Tuple[FrozenSet[str], str]:
+    """Return (token set, lowercased title) for an :func:`_entry_text_key`."""
+    title, rule, implication, content, tags = text_key
+    text_parts = [part for part in (title, rule, implication) if part]
+    text_parts.extend(item for item in content if item)
+    text_parts.extend(tags)
+    full_text = " ".join(text_parts).lower()
+    # Interned: every entry (and the postings keys) share one string object
+    # per distinct token, and set lookups against interned query tokens
+    # resolve on identity.
+    return frozenset(map(sys.intern, _WORD_RE.findall(full_text))), title.lower()
+
+
+@dataclass
+class _BasicIndex:
+    """
+    Per-entry searchable text, precomputed once when entries are loaded.
+
+    ``postings`` (the inverted token index) is optional and filled in by
+    :func:`_ensure_postings` only once the index is reused; ``boosts``
+    likewise by :func:`_ensure_boosts`, for the weights it was built with.
+    """
+    ids: List[str]                        # position -> entry_id (dict order)
+    tokens: List[FrozenSet[str]]          # position -> entry token set
+    titles: List[str]                     # position -> lowercased title
+    postings: Optional[Dict[str, List[int]]] = None  # token -> positions
+    # (weights fingerprint, position -> (boost, confidence_boost), max sum)
+    boosts: Optional[Tuple[tuple, List[Tuple[float, float]], float]] = None
+
+
+def _build_basic_index(
+    entries: Dict[str, dict],
+    with_postings: bool = True,
+) -> _BasicIndex:
+    """Tokenize every entry once; optionally build token -> positions."""
+    ids: List[str] = []
+    token_sets: List[FrozenSet[str]] = []
+    titles: List[str] = []
+    for eid, entry in entries.items():
+        entry_tokens, title_lower = _tokenize_entry(_entry_text_key(entry))
+        ids.append(eid)
+        token_sets.append(entry_tokens)
+        titles.append(title_lower)
+    index = _BasicIndex(ids, token_sets, titles)
+    if with_postings:
+        _ensure_postings(index)
+    return index
+
+
+def _ensure_postings(index: _BasicIndex) -> None:
+    """Build the inverted index from the precomputed token sets."""
+    if index.postings is not None:
+        return
+    postings: Dict[str, List[int]] = {}
+    for pos, entry_tokens in enumerate(index.tokens):
+        for token in entry_tokens:
+            postings.setdefault(token, []).append(pos)
+    index.postings = postings
+
+
+def _ensure_boosts(
+    index: _BasicIndex,
+    entries: Dict[str, dict],
+    weights: dict,
+) -> Tuple[List[Tuple[float, float]], float]:
+    """
+    Per-position ``(boost, confidence_boost)`` and the largest total,
+    built once per weights.
+    """
+    fingerprint = _weights_fingerprint(weights)
+    if index.boosts is None or index.boosts[0] != fingerprint:
+        boosts = [_entry_boosts(entries[eid], weights) for eid in index.ids]
+        max_boost = max((b + c for b, c in boosts), default=0.0)
+        index.boosts = (fingerprint, boosts, max_boost)
+    return index.boosts[1], index.boosts[2]
+
+
+# Single-slot cache for basic mode: (path, mtime_ns, size), the loaded
+# non-deprecated entries, and their precomputed token sets.  Postings are
+# only built once the same unchanged file is searched a second time — a
+# one-shot process (e.g. the pre_edit_search hook) never pays for
+# indexing it would not reuse.
+_basic_cache: Optional[Tuple[Tuple[str, int, int], Dict[str, dict], _BasicIndex]] = None
+
+
+def _load_basic_entries(
+    events_path: Path,
+) -> Tuple[Dict[str, dict], _BasicIndex]:
+    """Return (entries, index) for basic search, cached per file state."""
+    global _basic_cache
+    try:
+        st = events_path.stat()
+        key = (str(events_path), st.st_mtime_ns, st.st_size)
+    except OSError:
+        entries = _load_entries(events_path)
+        return entries, _build_basic_index(entries, with_postings=False)
+
+    if _basic_cache is not None and _basic_cache[0] == key:
+        _key, entries, index = _basic_cache
+        _ensure_postings(index)
+        return entries, index
+
+    entries = _load_entries(events_path)
+    index = _build_basic_index(entries, with_postings=False)
+    _basic_cache = (key, entries, index)
+    return entries, index
 
 
 def _search_basic(
@@ -294,76 +546,115 @@ def _search_basic(
     entries: Dict[str, dict],
     weights: dict,
     max_results: int,
+    index: Optional[_BasicIndex] = None,
+    min_score: float = 0.0,
 ) -> List[SearchResult]:
     """
     Level 4: Basic token-overlap search on in-memory entries.
 
     Zero external dependencies. Fallback when both embedder and FTS5
-    are unavailable.
+    are unavailable.  With an ``index`` (built over ``entries``) the
+    precomputed token sets are used, and if it has postings only entries
+    sharing at least one token with the query are visited; otherwise
+    every entry is tokenized (via the cache) and scanned.
     """
     if not query.strip():
         return []
 
     # Tokenize query (lowercase, split on non-word characters)
-    query_tokens = set(re.findall(r'\w+', query.lower()))
-
-    results: List[SearchResult] = []
-    for eid, entry in entries.items():
-        # Build searchable text from entry fields
-        text_parts = []
-        title = entry.get("title", "")
-        if title:
-            text_parts.append(title)
-        rule = entry.get("rule")
-        if rule:
-            text_parts.append(rule)
-        implication = entry.get("implication")
-        if implication:
-            text_parts.append(implication)
-        content = entry.get("content", [])
-        if isinstance(content, list):
-            text_parts.extend(item for item in content if item)
-        tags = entry.get("tags", [])
-        if isinstance(tags, list):
-            text_parts.extend(tags)
-
-        full_text = " ".join(text_parts).lower()
-        entry_tokens = set(re.findall(r'\w+', full_text))
-
-        # Compute overlap ratio
-        if not entry_tokens:
-            continue
+    query_tokens = frozenset(map(sys.intern, _WORD_RE.findall(query.lower())))
+    if not query_tokens:
+        return []
+    n_query = len(query_tokens)
+
+    # (score, position, entry_id, entry, boost, confidence_boost) per
+    # matched entry; SearchResult objects are only built for the top-K.
+    scored: List[Tuple[float, int, str, dict, float, float]] = []
+    pruned = False
+    if index is not None and index.postings is not None:
+        # Count each candidate's matching query tokens straight off the
+        # postings (Counter.update counts in C); entries with no hit are
+        # never visited.  The index is being reused, so its boosts are
+        # worth precomputing.
+        hits: Counter = Counter()
+        for token in query_tokens:
+            hits.update(index.postings.get(token, ()))
+        boosts, max_boost = _ensure_boosts(index, entries, weights)
+        # MaxScore-style early exit: visit candidates by descending hit
+        # count (entry order within a count).  An entry with n hits scores
+        # at most n/|q| + 0.1*|q| (every query token in its title) + the
+        # largest boost; once that is below the current K-th score, no
+        # remaining candidate can enter the top-K.
+        bound_rest = 0.1 * n_query + max_boost
+        matched = (
+            (pos, index.ids[pos], index.titles[pos], hits[pos], boosts[pos],
+             hits[pos] / n_query + bound_rest)
+            for pos in sorted(sorted(hits), key=hits.__getitem__, reverse=True)
+        )
+        pruned = max_results > 0
+    else:
+        if index is not None:
+            # Precomputed token sets, no postings yet: scan them all
+            scanned = zip(index.ids, index.tokens, index.titles)
+        else:
+            scanned = (
+                (eid, *_tokenize_entry(_entry_text_key(entry)))
+                for eid, entry in entries.items()
+            )
+        # Most entries share no token with the query: reject them with a
+        # C-level test instead of building an overlap set.
+        matched = (
+            (pos, eid, title_lower, len(query_tokens & entry_tokens), None, None)
+            for pos, (eid, entry_tokens, title_lower) in enumerate(scanned)
+            if not query_tokens.isdisjoint(entry_tokens)
+        )
 
-        overlap = query_tokens & entry_tokens
-        if not overlap:
-            continue
+    kth: List[float] = []  # min-heap of the best max_results scores so far
+    for pos, eid, title_lower, n_overlap, entry_boosts, bound in matched:
+        if pruned and (
+            bound < min_score or (len(kth) == max_results and bound < kth[0])
+        ):
+            break
+        entry = entries[eid]
 
         # Score: weighted overlap (matching more query tokens = higher)
         # Jaccard-inspired: |overlap| / |query_tokens|
-        overlap_ratio = len(overlap) / len(query_tokens)
+        overlap_ratio = n_overlap / n_query
 
         # Bonus: title match is worth more
-        title_lower = title.lower()
         title_bonus = 0.0
         for token in query_tokens:
             if token in title_lower:
                 title_bonus += 0.1
 
-        boost = _compute_boost(entry, weights)
-        conf_boost = _compute_confidence_boost(entry, weights)
+        boost, conf_boost = entry_boosts or _entry_boosts(entry, weights)
         score = overlap_ratio + title_bonus + boost + conf_boost
-
-        results.append(SearchResult(
+        if score < min_score:
+            continue
+        scored.append((score, pos, eid, entry, boost, conf_boost))
+        if pruned:
+            if len(kth) < max_results:
+                heapq.heappush(kth, score)
+            else:
+                heapq.heappushpop(kth, score)
+
+    if pruned:
+        # Back to entry order so equal scores tie-break as in a full scan
+        scored.sort(key=_second)
+
+    return [
+        SearchResult(
             entry_id=eid,
             entry=entry,
             score=score,
             boost=boost,
             confidence_boost=conf_boost,
             search_mode="basic",
-        ))
-
-    results.sort(key=lambda r: r.score, reverse=True)
-    return results[:max_results]
+        )
+        for score, _pos, eid, entry, boost, conf_boost in heapq.nlargest(
+            max_results, scored, key=_first,
+        )
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -393,11 +684,7 @@ def _determine_mode(
         return force_mode, False, ""
 
     has_embedder = embedder is not None
-    has_fts = (
-        vectordb is not None
-        and hasattr(vectordb, "_fts5_available")
-        and vectordb._fts5_available
-    )
+    has_fts = vectordb is not None and getattr(vectordb, "_fts5_available", False)
     has_vectordb = vectordb is not None
 
     if has_embedder and has_fts and has_vectordb:
@@ -410,6 +697,67 @@ def _determine_mode(
         return "basic", True, "No vector DB or embedding provider; using basic text match"
 
 
+# Recent reports for repeated queries: key -> (monotonic time, report).
+# Keys pin the on-disk state of events.jsonl and vectors.db (plus its WAL,
+# where committed writes land first), so any write from any process
+# invalidates them; the TTL bounds anything stat() cannot see.
+_QUERY_CACHE_SIZE = 256
+_QUERY_CACHE_TTL = 60.0
+_query_cache: "OrderedDict[tuple, Tuple[float, SearchReport]]" = OrderedDict()
+
+
+def _query_cache_key(
+    query: str,
+    events_path: Path,
+    mode: str,
+    vectordb: Optional["VectorDB"],
+    embedder: Optional["EmbeddingProvider"],
+    weights: dict,
+    max_results: int,
+) -> Optional[tuple]:
+    """Cache key for a search, or None if the inputs cannot be pinned."""
+    events_state = _file_state(events_path)
+    if events_state is None:
+        return None
+    db_key = None
+    if mode != "basic":
+        try:
+            db_path = Path(vectordb.db_path)
+        except Exception:
+            return None
+        db_state = _file_state(db_path)
+        if db_state is None:
+            return None
+        wal_path = db_path.with_name(db_path.name + "-wal")
+        db_key = (str(db_path), db_state, _file_state(wal_path))
+    embedder_key = None
+    if mode in ("hybrid", "vector"):
+        try:
+            embedder_key = (
+                embedder.provider_id, embedder.model_name, embedder.dimensions,
+            )
+        except Exception:
+            return None
+    return (
+        query, str(events_path), events_state, mode, db_key, embedder_key,
+        _weights_fingerprint(weights), max_results,
+    )
+
+
+def _file_state(path: Path) -> Optional[Tuple[int, int, int]]:
+    """(inode, mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _copy_report(report: SearchReport) -> SearchReport:
+    """Copy a report and its results list (results are immutable and shared)."""
+    return replace(report, results=list(report.results))
+
+
 def search_memory(
     query: str,
     events_path: Path,
@@ -443,6 +791,28 @@ def search_memory(
     # Determine search mode
     mode, degraded, reason = _determine_mode(vectordb, embedder, force_mode)
 
+    # Apply max_results: caller override > config > default 5
+    config_max = config.get("search", {}).get("max_results", 5)
+    effective_max = max_results if max_results is not None else config_max
+
+    # Repeated query against unchanged data: reuse the earlier report.
+    # Context only feeds the query embedding; searches using it are rare
+    # repeats, so they bypass the cache.
+    cache_key = None
+    if context is None:
+        cache_key = _query_cache_key(
+            query, events_path, mode, vectordb, embedder, weights, effective_max,
+        )
+    if cache_key is not None:
+        hit = _query_cache.get(cache_key)
+        if hit is not None:
+            if time.monotonic() - hit[0] <= _QUERY_CACHE_TTL:
+                _query_cache.move_to_end(cache_key)
+                report = _copy_report(hit[1])
+                report.duration_ms = (time.monotonic() - start_time) * 1000
+                return report
+            del _query_cache[cache_key]
+
     report = SearchReport(
         query=query,
         mode=mode,
@@ -450,52 +820,63 @@ def search_memory(
         degradation_reason=reason,
     )
 
-    # Load entries from events.jsonl
-    entries = _load_entries(events_path)
-    if not entries:
-        report.duration_ms = (time.monotonic() - start_time) * 1000
-        return report
-
-    # Apply max_results: caller override > config > default 5
-    config_max = config.get("search", {}).get("max_results", 5)
-    effective_max = max_results if max_results is not None else config_max
+    # Load entries from events.jsonl.  Only basic mode scans every entry;
+    # the vectordb modes load just the candidates they get back.
+    entries: EntrySource
+    if mode == "basic":
+        entries, basic_index = _load_basic_entries(events_path)
+        if not entries:
+            report.duration_ms = (time.monotonic() - start_time) * 1000
+            return report
+    else:
+        entries = partial(_load_entries, events_path)
 
-    # Execute search based on mode
+    # Execute search based on mode.  The min_score filter is applied inside
+    # each scorer, before ranking, so losers never become SearchResults.
+    min_score = weights["min_score"]
     try:
         if mode == "hybrid":
             results = _search_hybrid(
                 query, vectordb, embedder, entries, weights, context, effective_max,
+                min_score,
             )
         elif mode == "vector":
             results = _search_vector(
                 query, vectordb, embedder, entries, weights, context, effective_max,
+                min_score,
             )
         elif mode == "keyword":
             results = _search_keyword(
-                query, vectordb, entries, weights, effective_max,
+                query, vectordb, entries, weights, effective_max, min_score,
             )
         else:  # basic
             results = _search_basic(
-                query, entries, weights, effective_max,
+                query, entries, weights, effective_max, basic_index, min_score,
             )
     except Exception as e:
         logger.error(f"Search failed in {mode} mode: {e}")
         # Fall back to basic if any mode fails
         if mode != "basic":
             logger.info("Falling back to basic search mode")
-            results = _search_basic(query, entries, weights, effective_max)
+            basic_entries, basic_index = _load_basic_entries(events_path)
+            results = _search_basic(
+                query, basic_entries, weights, effective_max, basic_index,
+                min_score,
+            )
             report.mode = "basic"
             report.degraded = True
             report.degradation_reason = f"{mode} search failed: {e}; fell back to basic"
         else:
             results = []
-
-    # Apply min_score filter
-    min_score = weights["min_score"]
-    results = [r for r in results if r.score >= min_score]
+        cache_key = None  # don't pin a transient failure
 
     report.results = results
     report.total_found = len(results)
     report.duration_ms = (time.monotonic() - start_time) * 1000
 
+    if cache_key is not None:
+        _query_cache[cache_key] = (time.monotonic(), _copy_report(report))
+        if len(_query_cache) > _QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+
     return report
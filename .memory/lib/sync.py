@@ -21,6 +21,7 @@ import hashlib
 import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, List, Optional
@@ -47,8 +48,14 @@ class SyncReport:
 
 
 def _compute_text_hash(text: str) -> str:
-    """SHA-256 hash of the embedding text (first 16 hex chars)."""
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+    """
+    SHA-256 hash of the embedding text (first 16 hex chars).
+
+    The value is stored in vectors.db and compared on every sync, so the
+    algorithm must not change: a different hash marks every entry dirty
+    and re-embeds the whole file.  Only the 8 bytes kept are hex-encoded.
+    """
+    return hashlib.sha256(text.encode("utf-8")).digest()[:8].hex()
 
 
 def _read_events(
@@ -59,11 +66,14 @@ def _read_events(
     """
     Read events.jsonl and resolve latest-wins semantics.
 
-    Thin wrapper around :func:`events_io.load_events_latest_wins`.
+    Thin wrapper around :func:`events_io.load_events_latest_wins`, which
+    streams the file in fixed-size binary blocks.  No ``_line`` key is
+    requested: nothing in sync reads it, and on a full sync it would add
+    a dict slot to every entry held in memory.
 
     Returns:
         (entries_dict, total_lines, end_byte_offset)
-        entries_dict: {entry_id: latest_entry_dict} (with ``_line`` metadata)
+        entries_dict: {entry_id: latest_entry_dict}
         total_lines: total number of lines in file
         end_byte_offset: byte position at end of file for cursor storage
     """
@@ -71,7 +81,6 @@ def _read_events(
     return load_events_latest_wins(
         events_path,
         start_line=start_line,
-        track_lines=True,
         byte_offset=byte_offset,
     )
 
@@ -82,6 +91,7 @@ def sync_embeddings(
     embedder: Optional[EmbeddingProvider] = None,
     force_full: bool = False,
     batch_size: int = 20,
+    max_workers: int = 4,
 ) -> SyncReport:
     """
     Synchronize events.jsonl → vectors.db.
@@ -92,6 +102,7 @@ def sync_embeddings(
         embedder: Optional embedding provider (None = FTS-only mode)
         force_full: If True, ignore cursor and reprocess all entries
         batch_size: Number of texts to embed per API call
+        max_workers: Embedding API calls allowed in flight at once
 
     Returns:
         SyncReport with operation summary
@@ -126,76 +137,96 @@ def sync_embeddings(
 
     # Handle deprecated entries (mark in vectors + remove from FTS)
     vectordb.begin_batch()
-    for entry_id in deprecated_ids:
-        vectordb.mark_deprecated(entry_id)
-        vectordb.delete_fts(entry_id)
-        report.entries_deprecated += 1
+    vectordb.mark_deprecated_many(deprecated_ids)
+    vectordb.delete_fts_many(deprecated_ids)
+    report.entries_deprecated += len(deprecated_ids)
     vectordb.end_batch()
 
     # Prepare embedding batches
     to_embed: list[tuple[str, dict, str, str]] = []  # (entry_id, entry, text, text_hash)
 
-    vectordb.begin_batch()
+    # Hash every active entry, then find the changed/new ones with one
+    # batched lookup instead of a SELECT per entry.
+    embed_texts: dict[str, str] = {}
+    text_hashes: dict[str, str] = {}
     for entry_id, entry in active_entries.items():
         embed_text = build_embedding_text(entry)
-        text_hash = _compute_text_hash(embed_text)
-
-        # Check if content has changed (hash mismatch or new entry)
-        if not vectordb.needs_update(entry_id, text_hash):
-            report.entries_skipped += 1
+        embed_texts[entry_id] = embed_text
+        text_hashes[entry_id] = _compute_text_hash(embed_text)
+    stored_hashes = vectordb.stored_text_hashes(text_hashes)
+    dirty = {
+        entry_id for entry_id, text_hash in text_hashes.items()
+        if stored_hashes.get(entry_id) != text_hash
+    }
+    report.entries_skipped += len(active_entries) - len(dirty)
+
+    # Update FTS only for changed/new entries (not all active entries)
+    fts_rows: list[tuple[str, str, str, str]] = []
+    for entry_id, entry in active_entries.items():
+        if entry_id not in dirty:
             continue
-
-        # Update FTS only for changed/new entries (not all active entries)
         fts_fields = build_fts_fields(entry)
-        vectordb.upsert_fts(
-            entry_id=entry_id,
-            title=fts_fields["title"],
-            text=fts_fields["text"],
-            tags=fts_fields["tags"],
+        fts_rows.append(
+            (entry_id, fts_fields["title"], fts_fields["text"], fts_fields["tags"])
         )
 
         if embedder is None:
             report.entries_fts_only += 1
             continue
 
-        to_embed.append((entry_id, entry, embed_text, text_hash))
-    vectordb.end_batch()
+        to_embed.append((entry_id, entry, embed_texts[entry_id], text_hashes[entry_id]))
+
+    vectordb.upsert_fts_many(fts_rows)
+
+    # Batch embed and store.  Embedder calls are network round trips, so up
+    # to max_workers batches are in flight at once; results are stored on
+    # this thread (the sqlite3 connection is single-threaded) in batch order.
+    batch_starts = range(0, len(to_embed), batch_size)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = [
+            pool.submit(
+                embedder.embed_documents,
+                [item[2] for item in to_embed[batch_start:batch_start + batch_size]],
+            )
+            for batch_start in batch_starts
+        ]
+        for batch_start, future in zip(batch_starts, futures):
+            batch = to_embed[batch_start:batch_start + batch_size]
 
-    # Batch embed and store
-    for batch_start in range(0, len(to_embed), batch_size):
-        batch = to_embed[batch_start:batch_start + batch_size]
-        texts = [item[2] for item in batch]
-
-        try:
-            results = embedder.embed_documents(texts)
-        except Exception as e:
-            error_msg = f"Batch embed failed (items {batch_start}-{batch_start + len(batch)}): {e}"
-            logger.error(error_msg)
-            report.errors.append(error_msg)
-            continue
-
-        vectordb.begin_batch()
-        for (entry_id, entry, embed_text, text_hash), result in zip(batch, results):
             try:
-                is_new = not vectordb.has_vector(entry_id)
-                vectordb.upsert_vector(
-                    entry_id=entry_id,
-                    text_hash=text_hash,
-                    provider=embedder.provider_id,
-                    model=embedder.model_name,
-                    dimensions=result.dimensions,
-                    embedding=result.vector,
-                    deprecated=False,
-                )
-                if is_new:
-                    report.entries_added += 1
-                else:
-                    report.entries_updated += 1
+                results = future.result()
             except Exception as e:
-                error_msg = f"Failed to store vector for {entry_id}: {e}"
+                error_msg = f"Batch embed failed (items {batch_start}-{batch_start + len(batch)}): {e}"
                 logger.error(error_msg)
                 report.errors.append(error_msg)
-        vectordb.end_batch()
+                continue
+
+            rows = [
+                (entry_id, text_hash, embedder.provider_id, embedder.model_name,
+                 result.dimensions, result.vector)
+                for (entry_id, _, _, text_hash), result in zip(batch, results)
+            ]
+            vectordb.begin_batch()
+            try:
+                vectordb.upsert_vectors_many(rows)
+                stored = rows
+            except Exception:
+                # Retry row by row so one bad vector doesn't lose the batch
+                stored = []
+                for row in rows:
+                    try:
+                        vectordb.upsert_vectors_many([row])
+                        stored.append(row)
+                    except Exception as e:
+                        error_msg = f"Failed to store vector for {row[0]}: {e}"
+                        logger.error(error_msg)
+                        report.errors.append(error_msg)
+            vectordb.end_batch()
+            for row in stored:
+                if row[0] in stored_hashes:
+                    report.entries_updated += 1
+                else:
+                    report.entries_added += 1
 
     # Update sync cursor only if no errors occurred.
     # When errors exist, don't advance — failed entries will be retried
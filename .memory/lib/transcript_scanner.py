@@ -10,7 +10,7 @@ memory session) and the draft queue system (auto_capture.py).
 
 Integration:
   - Stop hook calls scan_conversation_for_drafts() when no session exists
-  - Reuses _extract_candidates() from working_memory.py (6 harvest patterns)
+  - Reuses _iter_candidates() from working_memory.py (6 harvest patterns)
   - Reuses _convert_candidate_to_entry() for schema-compliant entries
   - Writes to .memory/drafts/ via create_draft() (never events.jsonl)
 
@@ -24,10 +24,15 @@ No external dependencies — pure Python stdlib + internal modules.
 
 import json
 import logging
+import mmap
+import re
 from collections import Counter
+from itertools import chain
 from pathlib import Path
 from typing import Dict, List
 
+from .events_io import json_loads, load_active_events_cached
+
 logger = logging.getLogger("efm.transcript_scanner")
 
 # Safety: skip transcripts larger than 10 MB to avoid blocking stop
@@ -42,6 +47,7 @@ _RULES_ECHO_MARKERS = [
     "**Memory:** `",
     "**Implication:**",
 ]
+_RULES_ECHO_RE = re.compile("|".join(map(re.escape, _RULES_ECHO_MARKERS)))
 
 
 def _strip_rules_echo(text: str) -> str:
@@ -62,12 +68,16 @@ def _strip_rules_echo(text: str) -> str:
         Text with rule-injected blocks removed.
     """
     lines = text.splitlines()
+    has_marker = _RULES_ECHO_RE.search
+    if not has_marker(text):
+        return "\n".join(lines)  # Common case: nothing was echoed
+
     filtered: List[str] = []
     skip_block = False
 
     for line in lines:
         # Start skipping when we see a rules marker
-        if any(marker in line for marker in _RULES_ECHO_MARKERS):
+        if has_marker(line):
             skip_block = True
             continue
         # Stop skipping at blank line (end of block)
@@ -80,6 +90,28 @@ def _strip_rules_echo(text: str) -> str:
     return "\n".join(filtered)
 
 
+def _lines_containing(buf, needle: bytes):
+    """Yield each ``\\n``-delimited line of ``buf`` that contains ``needle``.
+
+    Jumps between occurrences with ``find`` (memchr-speed in C) and only
+    slices out the lines that match; everything in between is never
+    copied into Python objects.
+    """
+    pos = 0
+    size = len(buf)
+    while True:
+        hit = buf.find(needle, pos)
+        if hit < 0:
+            return
+        newline = buf.rfind(b"\n", pos, hit)
+        start = newline + 1 if newline >= 0 else pos
+        end = buf.find(b"\n", hit)
+        if end < 0:
+            end = size
+        yield buf[start:end]
+        pos = end + 1
+
+
 def read_transcript_messages(transcript_path: Path) -> List[str]:
     """Read a Claude Code transcript JSONL and extract assistant message texts.
 
@@ -113,13 +145,16 @@ def read_transcript_messages(transcript_path: Path) -> List[str]:
 
     texts: List[str] = []
     try:
-        with open(transcript_path, "r", encoding="utf-8") as f:
-            for line in f:
+        # Only assistant turns are kept and any such line spells out
+        # "assistant", so the mapped file is searched for that and other
+        # lines are never read into Python. The JSON decoder takes the
+        # UTF-8 bytes as is.
+        with open(transcript_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in _lines_containing(mm, b'"assistant"'):
                 line = line.strip()
-                if not line:
-                    continue
                 try:
-                    obj = json.loads(line)
+                    obj = json_loads(line)
                 except json.JSONDecodeError:
                     continue
 
@@ -137,7 +172,7 @@ def read_transcript_messages(transcript_path: Path) -> List[str]:
                         text = block.get("text", "")
                         if text:
                             texts.append(text)
-    except (OSError, UnicodeDecodeError) as e:
+    except (OSError, ValueError) as e:  # ValueError: undecodable / emptied file
         logger.warning(f"Cannot read transcript: {e}")
         return []
 
@@ -155,10 +190,14 @@ def scan_conversation_for_drafts(
     Steps:
         1. read_transcript_messages() → list of assistant texts
         2. Concatenate and strip rules echo content
-        3. _extract_candidates() — reuse 6 harvest patterns from working_memory
+        3. _iter_candidates() — reuse 6 harvest patterns from working_memory
         4. Dedup against existing events.jsonl and pending drafts
         5. create_draft() — write to .memory/drafts/ (never events.jsonl)
 
+    Candidates are streamed through steps 3-5 one at a time. With
+    ``v3.max_drafts_per_scan`` set, the scan stops once that many drafts
+    were created (``candidates_found`` then counts those examined).
+
     Args:
         transcript_path: Path to the conversation JSONL file
         drafts_dir: Path to .memory/drafts/
@@ -191,47 +230,45 @@ def scan_conversation_for_drafts(
 
     # Step 3: Extract candidates (reuse working_memory patterns)
     try:
-        from .working_memory import _extract_candidates, _convert_candidate_to_entry
+        from .working_memory import _iter_candidates, _convert_candidate_to_entry
     except ImportError as e:
         result["errors"].append(f"Cannot import working_memory: {e}")
         return result
 
     source_hint = f"conversation:{transcript_path.stem}"
     seen_titles: set = set()
-    candidates = _extract_candidates(full_text, source_hint, seen_titles)
-    result["candidates_found"] = len(candidates)
-
-    if not candidates:
+    candidates = _iter_candidates(full_text, source_hint, seen_titles)
+    first = next(candidates, None)
+    if first is None:
         return result
 
     # Step 4: Import dedup and draft tools
     try:
-        from .auto_capture import create_draft, list_drafts
-        from .auto_verify import check_duplicates, _load_entries_latest_wins
+        from .auto_capture import create_draft, draft_titles
+        from .auto_verify import check_duplicates
     except ImportError as e:
         result["errors"].append(f"Cannot import modules: {e}")
         return result
 
-    # Pre-load existing entries for dedup (once, not per candidate)
+    # Pre-load active entries for dedup (once, not per candidate); the
+    # snapshot is cached per process and refreshed only by what was appended
     events_path = project_root / ".memory" / "events.jsonl"
     dedup_threshold = config.get("automation", {}).get("dedup_threshold", 0.85)
-    preloaded = (
-        _load_entries_latest_wins(events_path) if events_path.exists() else {}
-    )
+    preloaded = load_active_events_cached(events_path)
 
     # Collect titles of existing pending drafts to avoid duplicates
-    existing_draft_titles: set = set()
     try:
-        for draft in list_drafts(drafts_dir):
-            title = draft.entry.get("title", "")
-            if title:
-                existing_draft_titles.add(title)
+        existing_draft_titles = draft_titles(drafts_dir)
     except Exception:
-        pass  # If drafts dir doesn't exist yet, no problem
+        existing_draft_titles = set()  # If drafts dir doesn't exist yet, no problem
 
     # Step 5: Convert, dedup, and create drafts
+    max_drafts = config.get("v3", {}).get("max_drafts_per_scan", 0)
     type_counts: Counter = Counter()
-    for candidate in candidates:
+    for candidate in chain((first,), candidates):
+        if max_drafts and result["drafts_created"] >= max_drafts:
+            break
+        result["candidates_found"] += 1
         try:
             # Skip if a pending draft with the same title already exists
             if candidate.title in existing_draft_titles:
@@ -5,8 +5,9 @@ SQLite-based vector storage with FTS5 full-text search.
 Pure Python cosine similarity — no numpy, no native extensions.
 
 Storage:
-- vectors table: entry_id → embedding blob (struct-packed float32)
+- vectors table: entry_id → L2-normalized embedding blob (packed native float32)
 - fts_entries:   FTS5 virtual table for BM25 keyword search
+- fts_map:       entry_id → fts_entries rowid
 - sync_state:    tracks incremental sync cursor
 
 Performance: brute-force cosine over 5000 entries × 768 dims < 10ms.
@@ -14,16 +15,38 @@ Performance: brute-force cosine over 5000 entries × 768 dims < 10ms.
 
 import heapq
 import math
+import operator
 import sqlite3
-import struct
 import logging
+from array import array
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger("efm.vectordb")
 
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 4  # v2: L2-normalized embeddings; v3: sign-bit column; v4: fts_map
+
+# Binary pre-filter for search_vectors: at or above this many rows, rank by
+# Hamming distance on sign bits first, then re-score only the closest
+# limit * _BINARY_OVERSAMPLE candidates with full floats.
+_BINARY_PREFILTER_MIN = 5000
+_BINARY_OVERSAMPLE = 32
+
+# Connection tuning (see VectorDB.open): 256 MiB mmap window, 64 MiB page cache
+_MMAP_SIZE = 256 * 1024 * 1024
+_CACHE_SIZE_KIB = 64 * 1024
+
+# Bound parameters per statement for IN (...) lists; stays under
+# SQLITE_MAX_VARIABLE_NUMBER (999) of older SQLite builds.
+_MAX_PARAMS = 900
+
+# fts_map's implicit rowid doubles as the fts_entries rowid for that entry
+_CREATE_FTS_MAP = """
+    CREATE TABLE IF NOT EXISTS fts_map (
+        entry_id TEXT PRIMARY KEY
+    )
+"""
 
 
 # ---------------------------------------------------------------------------
@@ -31,13 +54,51 @@ SCHEMA_VERSION = 1
 # ---------------------------------------------------------------------------
 
 def pack_vector(vec: List[float]) -> bytes:
-    """Pack a list of floats into a binary blob (float32)."""
-    return struct.pack(f"{len(vec)}f", *vec)
+    """
+    Pack a list of floats into a binary blob (float32).
+
+    Converts into one contiguous native float32 buffer in C — the same
+    bytes as ``struct.pack(f"{n}f", *vec)`` without building an argument
+    tuple of ``n`` floats per call.
+    """
+    return array("f", vec).tobytes()
+
+
+def _unpack_array(blob: bytes, dimensions: int) -> array:
+    """Unpack a binary blob into a compact float32 array."""
+    values = array("f", blob)
+    if len(values) != dimensions:
+        raise ValueError(
+            f"Vector blob holds {len(values)} floats, expected {dimensions}"
+        )
+    return values
 
 
 def unpack_vector(blob: bytes, dimensions: int) -> List[float]:
     """Unpack a binary blob into a list of floats."""
-    return list(struct.unpack(f"{dimensions}f", blob))
+    return _unpack_array(blob, dimensions).tolist()
+
+
+def _dot(a: List[float], b: List[float]) -> float:
+    """Dot product of two equal-length vectors (C-level multiply + sum)."""
+    return sum(map(operator.mul, a, b))
+
+
+def l2_normalize(vec: List[float]) -> List[float]:
+    """Scale a vector to unit length; an all-zero vector is returned as is."""
+    norm = math.sqrt(_dot(vec, vec))
+    if norm == 0.0:
+        return list(vec)
+    inv = 1.0 / norm
+    return [v * inv for v in vec]
+
+
+def pack_signs(vec: List[float]) -> bytes:
+    """Pack one bit per dimension (1 = positive) into a big-endian blob."""
+    bits = 0
+    for v in vec:
+        bits = (bits << 1) | (v > 0.0)
+    return bits.to_bytes((len(vec) + 7) // 8, "big")
 
 
 def cosine_similarity(a: List[float], b: List[float]) -> float:
@@ -66,13 +127,55 @@ def cosine_similarity(a: List[float], b: List[float]) -> float:
 # VectorDB
 # ---------------------------------------------------------------------------
 
+class _VectorMatrix:
+    """
+    Decoded vectors for the exact search path, keyed to the
+    ``PRAGMA data_version`` they were read at.
+
+    Writes through the owning connection patch single rows in place;
+    commits from other connections move ``data_version`` and force a
+    rebuild.
+    """
+
+    __slots__ = ("data_version", "where", "ids", "vectors", "row_of")
+
+    def __init__(self, data_version: int, where: str):
+        self.data_version = data_version
+        self.where = where
+        self.ids: List[str] = []
+        self.vectors: List[array] = []
+        self.row_of: Dict[str, int] = {}
+
+    def put(self, entry_id: str, vec: array) -> None:
+        row = self.row_of.get(entry_id)
+        if row is None:
+            self.row_of[entry_id] = len(self.ids)
+            self.ids.append(entry_id)
+            self.vectors.append(vec)
+        else:
+            self.vectors[row] = vec
+
+    def drop(self, entry_id: str) -> None:
+        row = self.row_of.pop(entry_id, None)
+        if row is None:
+            return
+        # Swap-remove: move the last row into the hole
+        last_id = self.ids.pop()
+        last_vec = self.vectors.pop()
+        if last_id != entry_id:
+            self.ids[row] = last_id
+            self.vectors[row] = last_vec
+            self.row_of[last_id] = row
+
+
 class VectorDB:
     """
     SQLite-based vector storage with optional FTS5 support.
 
     Tables:
-    - vectors:     entry embeddings (struct-packed float32 blobs)
+    - vectors:     entry embeddings (packed native float32 blobs)
     - fts_entries: FTS5 full-text search index
+    - fts_map:     entry_id → fts_entries rowid
     - sync_state:  incremental sync tracking
     """
 
@@ -81,6 +184,7 @@ class VectorDB:
         self._conn: Optional[sqlite3.Connection] = None
         self._fts5_available: bool = True
         self._batch_depth: int = 0
+        self._matrix: Optional[_VectorMatrix] = None
 
     # --- Lifecycle ---
 
@@ -90,12 +194,18 @@ class VectorDB:
         self._conn = sqlite3.connect(str(self._db_path))
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.execute("PRAGMA synchronous=NORMAL")
+        # Read-heavy: serve blobs from a memory map instead of read() copies,
+        # and keep a page cache big enough for a typical vectors table
+        self._conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+        self._conn.execute(f"PRAGMA cache_size=-{_CACHE_SIZE_KIB}")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
 
     def close(self) -> None:
         """Close the database connection."""
         if self._conn:
             self._conn.close()
             self._conn = None
+        self._matrix = None
 
     def __enter__(self) -> "VectorDB":
         """Context manager: open + ensure schema."""
@@ -107,6 +217,11 @@ class VectorDB:
         """Context manager: close."""
         self.close()
 
+    @property
+    def db_path(self) -> Path:
+        """Path of the database file."""
+        return self._db_path
+
     def _require_conn(self) -> None:
         """Raise RuntimeError if database is not open."""
         if self._conn is None:
@@ -137,6 +252,7 @@ class VectorDB:
                 model       TEXT NOT NULL,
                 dimensions  INTEGER NOT NULL,
                 embedding   BLOB NOT NULL,
+                signs       BLOB,
                 deprecated  INTEGER DEFAULT 0,
                 created_at  TEXT NOT NULL,
                 updated_at  TEXT NOT NULL
@@ -147,6 +263,12 @@ class VectorDB:
             CREATE INDEX IF NOT EXISTS idx_vectors_deprecated
             ON vectors(deprecated)
         """)
+        # Covers the sign-bit pre-filter scan of active rows, so it reads
+        # a few bytes per row instead of walking past every embedding blob
+        self._conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_vectors_active_signs
+            ON vectors(entry_id, dimensions, signs, deprecated) WHERE deprecated = 0
+        """)
 
         # FTS5 — graceful fallback if not available
         try:
@@ -159,6 +281,8 @@ class VectorDB:
                     tags
                 )
             """)
+            # entry_id is UNINDEXED, so FTS rows are addressed by rowid
+            self._conn.execute(_CREATE_FTS_MAP)
             self._fts5_available = True
         except sqlite3.OperationalError:
             logger.warning("FTS5 not available in this SQLite build. BM25 search disabled.")
@@ -175,14 +299,78 @@ class VectorDB:
         self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
         self._conn.commit()
+        self._matrix = None  # Migrations may have rewritten stored vectors
 
     def _migrate(self, from_version: int) -> None:
         """Run schema migrations from from_version to SCHEMA_VERSION.
 
         Future migrations go here, keyed by version number.
         """
-        # Future migrations go here
-        pass
+        if from_version < 2:
+            self._normalize_stored_vectors()
+        if from_version < 3:
+            self._add_sign_bits()
+        if from_version < 4:
+            self._map_fts_rowids()
+
+    def _normalize_stored_vectors(self) -> None:
+        """v2: rescale every stored embedding to unit length, in place."""
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'vectors'"
+        ).fetchone()
+        if exists is None:
+            return  # Fresh database — nothing stored yet
+        rows = self._conn.execute(
+            "SELECT entry_id, embedding, dimensions FROM vectors"
+        ).fetchall()
+        self._conn.executemany(
+            "UPDATE vectors SET embedding = ? WHERE entry_id = ?",
+            (
+                (pack_vector(l2_normalize(unpack_vector(blob, dims))), entry_id)
+                for entry_id, blob, dims in rows
+            ),
+        )
+
+    def _add_sign_bits(self) -> None:
+        """v3: add the ``signs`` column and fill it for stored vectors."""
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(vectors)")
+        }
+        if not columns:
+            return  # Fresh database — CREATE TABLE includes the column
+        if "signs" not in columns:
+            self._conn.execute("ALTER TABLE vectors ADD COLUMN signs BLOB")
+        rows = self._conn.execute(
+            "SELECT entry_id, embedding, dimensions FROM vectors"
+        ).fetchall()
+        self._conn.executemany(
+            "UPDATE vectors SET signs = ? WHERE entry_id = ?",
+            (
+                (pack_signs(unpack_vector(blob, dims)), entry_id)
+                for entry_id, blob, dims in rows
+            ),
+        )
+
+    def _map_fts_rowids(self) -> None:
+        """v4: create ``fts_map`` from the rowids already in ``fts_entries``."""
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'fts_entries'"
+        ).fetchone()
+        if exists is None:
+            return  # Fresh database, or no FTS5 — ensure_schema handles it
+        try:
+            self._conn.execute(_CREATE_FTS_MAP)
+            self._conn.execute(
+                "INSERT OR IGNORE INTO fts_map (rowid, entry_id) "
+                "SELECT rowid, entry_id FROM fts_entries ORDER BY rowid DESC"
+            )
+            # Drop duplicate rows the old delete+insert could leave behind;
+            # the newest (highest rowid) text per entry is the one mapped
+            self._conn.execute(
+                "DELETE FROM fts_entries WHERE rowid NOT IN (SELECT rowid FROM fts_map)"
+            )
+        except sqlite3.OperationalError:
+            logger.warning("FTS5 not available; skipping fts_map migration.")
 
     # --- Batch transaction support ---
 
@@ -214,27 +402,70 @@ class VectorDB:
         embedding: List[float],
         deprecated: bool = False,
     ) -> None:
-        """Insert or update a vector embedding."""
+        """
+        Insert or update a vector embedding.
+
+        The vector is stored L2-normalized, so search can score cosine
+        similarity as a plain dot product, together with its sign bits for
+        the binary pre-filter.
+        """
+        self.upsert_vectors_many(
+            [(entry_id, text_hash, provider, model, dimensions, embedding)],
+            deprecated=deprecated,
+        )
+
+    def upsert_vectors_many(
+        self,
+        rows: Iterable[Tuple[str, str, str, str, int, List[float]]],
+        deprecated: bool = False,
+    ) -> None:
+        """
+        Batched :meth:`upsert_vector` for
+        ``(entry_id, text_hash, provider, model, dimensions, embedding)`` rows,
+        written with one ``executemany``.
+        """
         self._require_conn()
         now = datetime.now(timezone.utc).isoformat()
-        blob = pack_vector(embedding)
-        self._conn.execute(
-            """
-            INSERT INTO vectors (entry_id, text_hash, provider, model,
-                                 dimensions, embedding, deprecated, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(entry_id) DO UPDATE SET
-                text_hash  = excluded.text_hash,
-                provider   = excluded.provider,
-                model      = excluded.model,
-                dimensions = excluded.dimensions,
-                embedding  = excluded.embedding,
-                deprecated = excluded.deprecated,
-                updated_at = excluded.updated_at
-            """,
-            (entry_id, text_hash, provider, model, dimensions,
-             blob, int(deprecated), now, now),
-        )
+        params = []
+        for entry_id, text_hash, provider, model, dimensions, embedding in rows:
+            params.append((
+                entry_id, text_hash, provider, model, dimensions,
+                pack_vector(l2_normalize(embedding)), pack_signs(embedding),
+                int(deprecated), now, now,
+            ))
+        try:
+            self._conn.executemany(
+                """
+                INSERT INTO vectors (entry_id, text_hash, provider, model,
+                                     dimensions, embedding, signs, deprecated,
+                                     created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(entry_id) DO UPDATE SET
+                    text_hash  = excluded.text_hash,
+                    provider   = excluded.provider,
+                    model      = excluded.model,
+                    dimensions = excluded.dimensions,
+                    embedding  = excluded.embedding,
+                    signs      = excluded.signs,
+                    deprecated = excluded.deprecated,
+                    updated_at = excluded.updated_at
+                """,
+                params,
+            )
+        except sqlite3.Error:
+            self._matrix = None  # Some rows may have been written
+            raise
+        matrix = self._matrix
+        if matrix is not None:
+            for entry_id, _, _, _, dimensions, blob, *_ in params:
+                vec = array("f", blob)
+                if len(vec) != dimensions:
+                    self._matrix = None  # Let the rebuild report the bad row
+                    break
+                if deprecated and matrix.where:
+                    matrix.drop(entry_id)
+                else:
+                    matrix.put(entry_id, vec)
         self._auto_commit()
 
     def get_vector(self, entry_id: str) -> Optional[List[float]]:
@@ -268,19 +499,44 @@ class VectorDB:
             return True  # Missing — needs creation
         return row[0] != text_hash  # Hash changed — needs update
 
+    def stored_text_hashes(self, entry_ids: Iterable[str]) -> Dict[str, str]:
+        """Map each of ``entry_ids`` that has a vector to its stored text hash."""
+        self._require_conn()
+        ids = list(entry_ids)
+        stored: Dict[str, str] = {}
+        for i in range(0, len(ids), _MAX_PARAMS):
+            chunk = ids[i:i + _MAX_PARAMS]
+            stored.update(self._conn.execute(
+                "SELECT entry_id, text_hash FROM vectors WHERE entry_id IN "
+                f"({','.join('?' * len(chunk))})",
+                chunk,
+            ))
+        return stored
+
     def mark_deprecated(self, entry_id: str) -> None:
         """Mark a vector as deprecated (excluded from search, kept for dedup)."""
+        self.mark_deprecated_many([entry_id])
+
+    def mark_deprecated_many(self, entry_ids: Iterable[str]) -> None:
+        """Batched :meth:`mark_deprecated`."""
         self._require_conn()
-        self._conn.execute(
+        ids = list(entry_ids)
+        now = datetime.now(timezone.utc).isoformat()
+        self._conn.executemany(
             "UPDATE vectors SET deprecated = 1, updated_at = ? WHERE entry_id = ?",
-            (datetime.now(timezone.utc).isoformat(), entry_id),
+            [(now, entry_id) for entry_id in ids],
         )
+        if self._matrix is not None and self._matrix.where:
+            for entry_id in ids:
+                self._matrix.drop(entry_id)
         self._auto_commit()
 
     def delete_vector(self, entry_id: str) -> None:
         """Delete a vector entirely."""
         self._require_conn()
         self._conn.execute("DELETE FROM vectors WHERE entry_id = ?", (entry_id,))
+        if self._matrix is not None:
+            self._matrix.drop(entry_id)
         self._auto_commit()
 
     # --- Vector search ---
@@ -294,47 +550,171 @@ class VectorDB:
         """
         Brute-force cosine similarity search over all vectors.
 
+        Stored vectors are unit length, so with the query normalized once
+        each candidate's cosine is a single dot product — no per-row norms.
+        From ``_BINARY_PREFILTER_MIN`` rows up, only the candidates closest
+        by sign-bit Hamming distance are scored (see
+        :meth:`_binary_candidates`).
+
         Returns list of (entry_id, similarity_score) sorted by score descending.
         """
         self._require_conn()
         where = "WHERE deprecated = 0" if exclude_deprecated else ""
-        rows = self._conn.execute(
-            f"SELECT entry_id, embedding, dimensions FROM vectors {where}"
-        ).fetchall()
 
-        scored = (
-            (cosine_similarity(query_vec, unpack_vector(blob, dims)), entry_id)
-            for entry_id, blob, dims in rows
+        query_unit = l2_normalize(query_vec)
+        n_dims = len(query_unit)
+
+        candidates = self._binary_candidates(
+            query_unit, limit * _BINARY_OVERSAMPLE, where,
         )
+        if candidates is None:
+            ids, vectors = self._vector_matrix(where)
+        else:
+            ids, vectors = [], []
+            for i in range(0, len(candidates), _MAX_PARAMS):
+                chunk = candidates[i:i + _MAX_PARAMS]
+                for entry_id, blob, dims in self._conn.execute(
+                    "SELECT entry_id, embedding, dimensions FROM vectors "
+                    f"WHERE entry_id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ):
+                    ids.append(entry_id)
+                    vectors.append(_unpack_array(blob, dims))
+
+        def _similarity(vec: array) -> float:
+            if len(vec) != n_dims:
+                raise ValueError(
+                    f"Vector dimension mismatch: {n_dims} vs {len(vec)}"
+                )
+            return _dot(query_unit, vec)
+
+        scored = zip(map(_similarity, vectors), ids)
         top = heapq.nlargest(limit, scored, key=lambda x: x[0])
         return [(entry_id, sim) for sim, entry_id in top]
 
+    def _vector_matrix(self, where: str) -> Tuple[List[str], List[array]]:
+        """
+        Entry ids and decoded float32 vectors for a full scan.
+
+        Decoding every blob dominated a search as much as the dot products
+        did, so the decoded arrays are kept between searches. This
+        connection's own writes patch the affected row; the full rebuild
+        only happens when another connection has committed.
+        """
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        matrix = self._matrix
+        if (
+            matrix is not None
+            and matrix.data_version == data_version
+            and matrix.where == where
+        ):
+            return matrix.ids, matrix.vectors
+
+        matrix = _VectorMatrix(data_version, where)
+        for entry_id, blob, dims in self._conn.execute(
+            f"SELECT entry_id, embedding, dimensions FROM vectors {where}"
+        ):
+            matrix.put(entry_id, _unpack_array(blob, dims))
+        self._matrix = matrix
+        return matrix.ids, matrix.vectors
+
+    def _binary_candidates(
+        self,
+        query_unit: List[float],
+        n_candidates: int,
+        where: str,
+    ) -> Optional[List[str]]:
+        """
+        Entry ids of the ``n_candidates`` vectors nearest the query by sign
+        bits, or None when the table is small enough to score in full.
+
+        Hamming distance between sign patterns tracks angular distance, so
+        one XOR + ``int.bit_count`` per row replaces a float dot product;
+        the survivors are then re-scored exactly.
+        """
+        count = self._conn.execute(
+            f"SELECT COUNT(*) FROM vectors {where}"
+        ).fetchone()[0]
+        if count < _BINARY_PREFILTER_MIN or count <= n_candidates:
+            return None
+
+        n_dims = len(query_unit)
+        query_bits = int.from_bytes(pack_signs(query_unit), "big")
+        from_bytes = int.from_bytes
+        # The planner picks idx_vectors_deprecated (not covering) on its own
+        source = "vectors INDEXED BY idx_vectors_active_signs" if where else "vectors"
+        try:
+            rows = self._conn.execute(
+                f"SELECT entry_id, signs, dimensions FROM {source} {where}"
+            )
+        except sqlite3.OperationalError:  # ensure_schema() not run yet
+            rows = self._conn.execute(
+                f"SELECT entry_id, signs, dimensions FROM vectors {where}"
+            )
+        distances = []
+        for entry_id, signs, dims in rows:
+            if dims != n_dims:
+                raise ValueError(f"Vector dimension mismatch: {n_dims} vs {dims}")
+            if signs is None:
+                distances.append((-1, entry_id))  # unknown: always re-score
+            else:
+                distances.append(
+                    ((query_bits ^ from_bytes(signs, "big")).bit_count(), entry_id)
+                )
+        return [
+            entry_id
+            for _, entry_id in heapq.nsmallest(n_candidates, distances)
+        ]
+
     # --- FTS operations ---
 
     def upsert_fts(self, entry_id: str, title: str, text: str, tags: str) -> None:
         """Insert or update FTS5 index entry."""
+        self.upsert_fts_many([(entry_id, title, text, tags)])
+
+    def upsert_fts_many(self, rows: Iterable[Tuple[str, str, str, str]]) -> None:
+        """
+        Batched :meth:`upsert_fts` for ``(entry_id, title, text, tags)`` rows.
+
+        FTS5 has no UPSERT and ``entry_id`` is UNINDEXED, so each entry gets
+        a stable rowid from ``fts_map`` and is replaced in place by rowid.
+        """
         if not self._fts5_available:
             return
         self._require_conn()
-
-        # FTS5 doesn't support UPSERT, so delete+insert
-        self._conn.execute(
-            "DELETE FROM fts_entries WHERE entry_id = ?", (entry_id,)
+        rows = list(rows)
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO fts_map (entry_id) VALUES (?)",
+            ((row[0],) for row in rows),
         )
-        self._conn.execute(
-            "INSERT INTO fts_entries (entry_id, title, text, tags) VALUES (?, ?, ?, ?)",
-            (entry_id, title, text, tags),
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO fts_entries (rowid, entry_id, title, text, tags) "
+            "VALUES ((SELECT rowid FROM fts_map WHERE entry_id = ?), ?, ?, ?, ?)",
+            ((row[0],) + tuple(row) for row in rows),
         )
         self._auto_commit()
 
     def delete_fts(self, entry_id: str) -> None:
         """Delete an FTS entry."""
+        self.delete_fts_many([entry_id])
+
+    def delete_fts_many(self, entry_ids: Iterable[str]) -> None:
+        """Batched :meth:`delete_fts`, resolved to rowids through ``fts_map``."""
         if not self._fts5_available:
             return
         self._require_conn()
-        self._conn.execute(
-            "DELETE FROM fts_entries WHERE entry_id = ?", (entry_id,)
-        )
+        ids = list(entry_ids)
+        for i in range(0, len(ids), _MAX_PARAMS):
+            chunk = ids[i:i + _MAX_PARAMS]
+            marks = ",".join("?" * len(chunk))
+            self._conn.execute(
+                "DELETE FROM fts_entries WHERE rowid IN "
+                f"(SELECT rowid FROM fts_map WHERE entry_id IN ({marks}))",
+                chunk,
+            )
+            self._conn.execute(
+                f"DELETE FROM fts_map WHERE entry_id IN ({marks})", chunk
+            )
         self._auto_commit()
 
     def search_fts(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
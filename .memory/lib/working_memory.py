@@ -22,10 +22,11 @@ import json
 import logging
 import re
 import time
+from functools import lru_cache
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger("efm.working_memory")
 
@@ -132,6 +133,16 @@ _RE_HRULE = re.compile(r'^-{3,}$', re.MULTILINE)
 _RE_HEADING = re.compile(r'^#{1,6}\s*')
 _RE_WHITESPACE = re.compile(r'\s+')
 
+# Tag extraction: lowercase words of 3+ letters, minus common stop words
+_RE_TAG_WORD = re.compile(r"[a-z]{3,}")
+_TAG_STOP_WORDS = frozenset({
+    "the", "and", "for", "with", "from", "that", "this", "are",
+    "was", "were", "has", "have", "had", "not", "but", "can",
+    "will", "should", "must", "never", "always", "when", "before",
+    "after", "into", "all", "each", "every", "any", "use", "using",
+    "auto", "harvested", "working", "memory", "session", "extracted",
+})
+
 
 def _clean_markdown_artifacts(text: str) -> str:
     """Remove markdown formatting artifacts from extracted text."""
@@ -325,45 +336,22 @@ def resume_session(working_dir: Path) -> Optional[SessionResumeReport]:
     start_time = time.monotonic()
 
     plan_path = working_dir / TASK_PLAN_FILE
-    if not plan_path.exists():
+    plan_content = _maybe_read(plan_path)
+    if plan_content is None:
         return None
 
-    plan_content = plan_path.read_text()
     progress_path = working_dir / PROGRESS_FILE
     findings_path = working_dir / FINDINGS_FILE
 
-    # Extract task description
-    task_desc = _extract_field(plan_content, "Task")
-
-    # Count phases and completions
-    phases_total, phases_done = _count_phases(plan_content)
-
-    # Get current phase
-    current_phase = _get_current_phase(plan_content)
+    # Task description, phase counts and current phase
+    task_desc, phases_total, phases_done, current_phase = _parse_plan(plan_content)
 
     # Last progress line
-    last_line = ""
-    if progress_path.exists():
-        lines = progress_path.read_text().strip().splitlines()
-        # Find last non-empty, non-header line
-        for line in reversed(lines):
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#") and not stripped.startswith("---"):
-                last_line = stripped
-                break
+    progress_content = _maybe_read(progress_path)
+    last_line = _last_progress_line(progress_content) if progress_content else ""
 
     # Count findings
-    findings_count = 0
-    if findings_path.exists():
-        findings_content = findings_path.read_text()
-        # Count non-empty lines in "Session Discoveries" section
-        in_discoveries = False
-        for line in findings_content.splitlines():
-            if "Session Discoveries" in line:
-                in_discoveries = True
-                continue
-            if in_discoveries and line.strip() and not line.strip().startswith("("):
-                findings_count += 1
+    findings_count = _count_findings(findings_path)
 
     report = SessionResumeReport(
         task_description=task_desc,
@@ -384,35 +372,23 @@ def get_session_status(working_dir: Path) -> SessionStatus:
     Returns SessionStatus with active=False if no session exists.
     """
     plan_path = working_dir / TASK_PLAN_FILE
-    if not plan_path.exists():
+    plan_content = _maybe_read(plan_path)
+    if plan_content is None:
         return SessionStatus(active=False)
 
-    plan_content = plan_path.read_text()
-    task_desc = _extract_field(plan_content, "Task")
-    phases_total, phases_done = _count_phases(plan_content)
+    task_desc, phases_total, phases_done, _ = _parse_plan(plan_content)
 
     # Count findings (only in "Session Discoveries" section, not prefill)
-    findings_count = 0
-    findings_path = working_dir / FINDINGS_FILE
-    if findings_path.exists():
-        content = findings_path.read_text()
-        in_discoveries = False
-        for line in content.splitlines():
-            if "Session Discoveries" in line:
-                in_discoveries = True
-                continue
-            if in_discoveries and line.strip() and not line.strip().startswith("("):
-                findings_count += 1
+    findings_count = _count_findings(working_dir / FINDINGS_FILE)
 
     # Count progress lines
     progress_lines = 0
-    progress_path = working_dir / PROGRESS_FILE
-    if progress_path.exists():
-        content = progress_path.read_text()
-        progress_lines = len([
-            l for l in content.splitlines()
-            if l.strip().startswith("- ") and not l.strip().startswith("- Session started")
-        ])
+    content = _maybe_read(working_dir / PROGRESS_FILE)
+    if content is not None:
+        for line in content.splitlines():
+            stripped = line.strip()
+            if stripped.startswith("- ") and not stripped.startswith("- Session started"):
+                progress_lines += 1
 
     # File timestamps
     stat = plan_path.stat()
@@ -449,13 +425,12 @@ def is_session_complete(working_dir: Path) -> bool:
     phases are completed.  Returns False for missing/empty plans or
     if any phase is still in progress.
     """
-    plan_path = working_dir / TASK_PLAN_FILE
-    if not plan_path.exists():
-        return False
     try:
-        plan_text = plan_path.read_text()
+        plan_text = _maybe_read(working_dir / TASK_PLAN_FILE)
     except OSError:
         return False
+    if plan_text is None:
+        return False
     total, done = _count_phases(plan_text)
     return total > 0 and done == total
 
@@ -475,14 +450,12 @@ def is_session_stale(working_dir: Path, timeout_hours: float = 48.0) -> bool:
     # Check most recent mtime across all session files
     latest_mtime = 0.0
     for filename in (TASK_PLAN_FILE, FINDINGS_FILE, PROGRESS_FILE):
-        filepath = working_dir / filename
-        if filepath.exists():
-            try:
-                mtime = filepath.stat().st_mtime
-                if mtime > latest_mtime:
-                    latest_mtime = mtime
-            except OSError:
-                continue
+        try:
+            mtime = (working_dir / filename).stat().st_mtime
+        except OSError:
+            continue  # Missing or unreadable
+        if mtime > latest_mtime:
+            latest_mtime = mtime
 
     if latest_mtime == 0.0:
         return False
@@ -515,14 +488,14 @@ def harvest_session(
     # Track seen titles across all files to avoid cross-file duplicates
     seen_titles: set = set()
 
-    if findings_path.exists():
-        findings_content = findings_path.read_text()
+    findings_content = _maybe_read(findings_path)
+    if findings_content is not None:
         report.findings_scanned = True
         candidates = _extract_candidates(findings_content, str(findings_path), seen_titles)
         report.candidates.extend(candidates)
 
-    if progress_path.exists():
-        progress_content = progress_path.read_text()
+    progress_content = _maybe_read(progress_path)
+    if progress_content is not None:
         report.progress_scanned = True
         candidates = _extract_candidates(progress_content, str(progress_path), seen_titles)
         report.candidates.extend(candidates)
@@ -538,11 +511,11 @@ def read_plan_summary(working_dir: Path, max_lines: int = 30) -> str:
     Equivalent to PWF's PreToolUse: `cat task_plan.md | head -30`.
     Returns empty string if no active session.
     """
-    plan_path = working_dir / TASK_PLAN_FILE
-    if not plan_path.exists():
+    plan_content = _maybe_read(working_dir / TASK_PLAN_FILE)
+    if plan_content is None:
         return ""
 
-    lines = plan_path.read_text().splitlines()
+    lines = plan_content.splitlines()
     return "\n".join(lines[:max_lines])
 
 
@@ -557,10 +530,11 @@ def clear_session(working_dir: Path) -> bool:
 
     removed = False
     for filename in (TASK_PLAN_FILE, FINDINGS_FILE, PROGRESS_FILE):
-        filepath = working_dir / filename
-        if filepath.exists():
-            filepath.unlink()
-            removed = True
+        try:
+            (working_dir / filename).unlink()
+        except FileNotFoundError:
+            continue
+        removed = True
 
     return removed
 
@@ -628,7 +602,22 @@ def _extract_candidates(
             If provided, titles already in the set are skipped, and
             new titles are added to it.
     """
-    candidates = []
+    return list(_iter_candidates(text, source_hint, seen_titles))
+
+
+def _iter_candidates(
+    text: str,
+    source_hint: str,
+    seen_titles: Optional[set] = None,
+) -> Iterator[HarvestCandidate]:
+    """Lazy form of :func:`_extract_candidates`.
+
+    Candidates are yielded in the same order; a consumer that stops early
+    skips the remaining pattern scans.
+    """
+    # Titles yielded so far, newline-joined for the pattern 5 substring
+    # check (neither titles nor statements can contain a newline)
+    titles = ""
     if seen_titles is None:
         seen_titles = set()
 
@@ -638,7 +627,7 @@ def _extract_candidates(
         title = _clean_markdown_artifacts(title)
         if title and title not in seen_titles:
             seen_titles.add(title)
-            candidates.append(HarvestCandidate(
+            candidate = HarvestCandidate(
                 suggested_type="lesson",
                 title=title[:120],
                 content=[title],
@@ -646,7 +635,9 @@ def _extract_candidates(
                 implication=title,
                 source_hint=source_hint,
                 extraction_reason="Explicit LESSON: marker",
-            ))
+            )
+            titles += "\n" + candidate.title
+            yield candidate
 
     # Pattern 2: Explicit CONSTRAINT/INVARIANT: markers
     for match in _CONSTRAINT_PATTERN.finditer(text):
@@ -654,7 +645,7 @@ def _extract_candidates(
         title = _clean_markdown_artifacts(title)
         if title and title not in seen_titles:
             seen_titles.add(title)
-            candidates.append(HarvestCandidate(
+            candidate = HarvestCandidate(
                 suggested_type="constraint",
                 title=title[:120],
                 content=[title],
@@ -662,7 +653,9 @@ def _extract_candidates(
                 implication=None,
                 source_hint=source_hint,
                 extraction_reason="Explicit CONSTRAINT/INVARIANT: marker",
-            ))
+            )
+            titles += "\n" + candidate.title
+            yield candidate
 
     # Pattern 3: Explicit DECISION: markers
     for match in _DECISION_PATTERN.finditer(text):
@@ -670,7 +663,7 @@ def _extract_candidates(
         title = _clean_markdown_artifacts(title)
         if title and title not in seen_titles:
             seen_titles.add(title)
-            candidates.append(HarvestCandidate(
+            candidate = HarvestCandidate(
                 suggested_type="decision",
                 title=title[:120],
                 content=[title],
@@ -678,7 +671,9 @@ def _extract_candidates(
                 implication=title,
                 source_hint=source_hint,
                 extraction_reason="Explicit DECISION: marker",
-            ))
+            )
+            titles += "\n" + candidate.title
+            yield candidate
 
     # Pattern 4: WARNING/RISK markers
     for match in _WARNING_PATTERN.finditer(text):
@@ -686,7 +681,7 @@ def _extract_candidates(
         title = _clean_markdown_artifacts(title)
         if title and title not in seen_titles:
             seen_titles.add(title)
-            candidates.append(HarvestCandidate(
+            candidate = HarvestCandidate(
                 suggested_type="risk",
                 title=title[:120],
                 content=[title],
@@ -694,7 +689,9 @@ def _extract_candidates(
                 implication=title,
                 source_hint=source_hint,
                 extraction_reason="Explicit WARNING/RISK: marker",
-            ))
+            )
+            titles += "\n" + candidate.title
+            yield candidate
 
     # Pattern 5: MUST/NEVER/ALWAYS statements (if not already captured)
     for match in _MUST_PATTERN.finditer(text):
@@ -704,9 +701,9 @@ def _extract_candidates(
             continue
         if statement and statement not in seen_titles:
             # Check not already captured by other patterns
-            if not any(statement in c.title for c in candidates):
+            if statement not in titles:
                 seen_titles.add(statement)
-                candidates.append(HarvestCandidate(
+                candidate = HarvestCandidate(
                     suggested_type="constraint",
                     title=statement[:120],
                     content=[statement],
@@ -714,7 +711,9 @@ def _extract_candidates(
                     implication=None,
                     source_hint=source_hint,
                     extraction_reason="MUST/NEVER/ALWAYS statement",
-                ))
+                )
+                titles += "\n" + candidate.title
+                yield candidate
 
     # Pattern 6: Error/Fix patterns → lesson candidates
     for match in _ERROR_FIX_PATTERN.finditer(text):
@@ -722,7 +721,7 @@ def _extract_candidates(
         title = _clean_markdown_artifacts(title)
         if title and title not in seen_titles:
             seen_titles.add(title)
-            candidates.append(HarvestCandidate(
+            candidate = HarvestCandidate(
                 suggested_type="lesson",
                 title=title[:120],
                 content=[title],
@@ -730,9 +729,9 @@ def _extract_candidates(
                 implication=title,
                 source_hint=source_hint,
                 extraction_reason="Error/Fix pattern",
-            ))
-
-    return candidates
+            )
+            titles += "\n" + candidate.title
+            yield candidate
 
 
 # ---------------------------------------------------------------------------
@@ -886,24 +885,16 @@ def _convert_candidate_to_entry(
 def _extract_tags(title: str, content: List[str]) -> List[str]:
     """Extract keyword tags from title and content."""
     text = (title + " " + " ".join(content)).lower()
-    # Split on non-alphanumeric
-    words = re.findall(r"[a-z]{3,}", text)
-    # Filter common stop words
-    stop = {
-        "the", "and", "for", "with", "from", "that", "this", "are",
-        "was", "were", "has", "have", "had", "not", "but", "can",
-        "will", "should", "must", "never", "always", "when", "before",
-        "after", "into", "all", "each", "every", "any", "use", "using",
-        "auto", "harvested", "working", "memory", "session", "extracted",
-    }
     # Deduplicate preserving order, skip stop words
     seen: set = set()
     tags = []
-    for w in words:
-        if w not in stop and w not in seen:
+    for w in _RE_TAG_WORD.findall(text):
+        if w not in _TAG_STOP_WORDS and w not in seen:
             seen.add(w)
             tags.append(w)
-    return tags[:5]
+            if len(tags) == 5:
+                break
+    return tags
 
 
 def auto_harvest_and_persist(
@@ -955,11 +946,13 @@ def auto_harvest_and_persist(
         return result
 
     # Step 2-3: Convert, validate, and dedup against existing entries
-    from .auto_verify import validate_schema, check_duplicates, _load_entries_latest_wins
+    from .auto_verify import validate_schema, check_duplicates
+    from .events_io import load_active_events_cached
 
     dedup_threshold = config.get("automation", {}).get("dedup_threshold", 0.85)
-    # Pre-load entries once to avoid re-reading events.jsonl per candidate
-    preloaded = _load_entries_latest_wins(events_path) if events_path.exists() else {}
+    # Active entries only (dedup skips deprecated ones); the snapshot is
+    # reused across harvests and only re-reads what was appended since
+    preloaded = load_active_events_cached(events_path)
 
     # Session-level dedup: skip entries already written by this conversation
     session_ids_written: set = set()
@@ -1073,11 +1066,14 @@ def auto_harvest_and_persist(
     # Write high-confidence entries to events.jsonl
     if entries_to_write:
         try:
-            with open(events_path, "a") as f:
-                for entry in entries_to_write:
-                    if conversation_id:
-                        entry.setdefault("_meta", {})["conversation_id"] = conversation_id
-                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            lines = []
+            for entry in entries_to_write:
+                if conversation_id:
+                    entry.setdefault("_meta", {})["conversation_id"] = conversation_id
+                lines.append(json.dumps(entry, ensure_ascii=False) + "\n")
+            # Serialize first, then append everything with one write
+            with open(events_path, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
             result["entries_written"] = len(entries_to_write)
         except Exception as e:
             result["errors"].append(f"Write failed: {e}")
@@ -1101,44 +1097,97 @@ def auto_harvest_and_persist(
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _maybe_read(path: Path) -> Optional[str]:
+    """Read a session file, or return None if it does not exist."""
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _field_pattern(field_name: str) -> "re.Pattern[str]":
+    """Compiled pattern for a **Field**: Value line."""
+    return re.compile(rf"\*\*{re.escape(field_name)}\*\*\s*[:：]\s*(.+)")
+
+
 def _extract_field(text: str, field_name: str) -> str:
     """Extract a **Field**: Value from markdown text."""
-    pattern = re.compile(rf"\*\*{field_name}\*\*\s*[:：]\s*(.+)")
-    match = pattern.search(text)
+    match = _field_pattern(field_name).search(text)
     return match.group(1).strip() if match else ""
 
 
-def _count_phases(plan_text: str) -> Tuple[int, int]:
-    """Count total phases and completed phases in task_plan.md."""
+def _count_findings(findings_path: Path) -> int:
+    """Count non-empty, non-placeholder lines under "Session Discoveries"."""
+    content = _maybe_read(findings_path)
+    if content is None:
+        return 0
+    _, marker, tail = content.partition("Session Discoveries")
+    if not marker:
+        return 0
+    count = 0
+    # splitlines() keeps every line boundary the baseline loop honoured;
+    # the first item is the rest of the header line itself
+    for line in tail.splitlines()[1:]:
+        stripped = line.strip()
+        if stripped and not stripped.startswith("(") and "Session Discoveries" not in line:
+            count += 1
+    return count
+
+
+def _last_progress_line(text: str) -> str:
+    """Last non-empty line of progress.md that is not a header or rule.
+
+    Walks back from the end of the text, so a long log is not split
+    into lines just to read its tail.
+    """
+    end = len(text)
+    while end > 0:
+        start = text.rfind("\n", 0, end) + 1
+        # splitlines() still honours \r and the other line boundaries
+        for line in reversed(text[start:end].splitlines()):
+            stripped = line.strip()
+            if stripped and not stripped.startswith("#") and not stripped.startswith("---"):
+                return stripped
+        end = start - 1
+    return ""
+
+
+def _parse_plan(plan_text: str) -> Tuple[str, int, int, str]:
+    """
+    Parse task_plan.md in one pass over its lines.
+
+    Returns (task, phases_total, phases_done, current_phase), where
+    current_phase is the first phase without a [DONE] marker ("Unknown"
+    if every phase is done).
+    """
     total = 0
     done = 0
+    current = ""
     in_phases = False
     for line in plan_text.splitlines():
-        if line.strip().startswith("## Phases"):
+        stripped = line.strip()
+        if stripped.startswith("## Phases"):
             in_phases = True
             continue
-        if in_phases and line.strip().startswith("## "):
+        if in_phases and stripped.startswith("## "):
             break  # Next section
-        if in_phases and line.strip().startswith("### Phase"):
+        if in_phases and stripped.startswith("### Phase"):
             total += 1
             # Phase is done when header contains [DONE] marker
             if "[DONE]" in line or "[done]" in line:
                 done += 1
+            elif not current:
+                current = stripped.lstrip("#").strip()
+    return _extract_field(plan_text, "Task"), total, done, current or "Unknown"
+
+
+def _count_phases(plan_text: str) -> Tuple[int, int]:
+    """Count total phases and completed phases in task_plan.md."""
+    _, total, done, _ = _parse_plan(plan_text)
     return total, done
 
 
 def _get_current_phase(plan_text: str) -> str:
     """Get the name of the current (first uncompleted) phase."""
-    in_phases = False
-    for line in plan_text.splitlines():
-        if line.strip().startswith("## Phases"):
-            in_phases = True
-            continue
-        if in_phases and line.strip().startswith("## "):
-            break
-        if in_phases and line.strip().startswith("### Phase"):
-            if "[DONE]" not in line and "[done]" not in line:
-                # Extract phase name
-                name = line.strip().lstrip("#").strip()
-                return name
-    return "Unknown"
+    return _parse_plan(plan_text)[3]
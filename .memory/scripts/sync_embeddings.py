@@ -110,6 +110,7 @@ def main():
         embedder=embedder,
         force_full=force_full,
         batch_size=embedding_config.get("sync", {}).get("batch_size", 20),
+        max_workers=embedding_config.get("sync", {}).get("concurrency", 4),
     )
 
     _print_report(report)
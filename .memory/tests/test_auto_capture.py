@@ -26,6 +26,7 @@ from lib.auto_capture import (
     _sanitize_title,
     approve_draft,
     create_draft,
+    draft_titles,
     expire_stale_drafts,
     list_drafts,
     reject_draft,
@@ -206,6 +207,49 @@ class TestListDrafts(unittest.TestCase):
         self.assertEqual(len(drafts), 0)
 
 
+# ---------------------------------------------------------------------------
+# TestDraftTitles
+# ---------------------------------------------------------------------------
+
+class TestDraftTitles(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.drafts_dir = self.tmpdir / "drafts"
+        self.drafts_dir.mkdir()
+
+    def test_matches_list_drafts(self):
+        create_draft(_make_valid_entry(title="First entry"), self.drafts_dir)
+        create_draft(_make_valid_entry(title="Second entry"), self.drafts_dir)
+        (self.drafts_dir / "bad.json").write_text("not valid json{{{")
+        expected = {d.entry["title"] for d in list_drafts(self.drafts_dir)}
+        self.assertEqual(expected, {"First entry", "Second entry"})
+        self.assertEqual(draft_titles(self.drafts_dir), expected)
+
+    def test_cached_titles_not_reparsed(self):
+        from unittest.mock import patch
+        create_draft(_make_valid_entry(title="Cached entry"), self.drafts_dir)
+        draft_titles(self.drafts_dir)
+        with patch("lib.auto_capture.json.loads", wraps=json.loads) as loads:
+            titles = draft_titles(self.drafts_dir)
+        self.assertEqual(titles, {"Cached entry"})
+        self.assertEqual(loads.call_count, 1)  # the index file only
+
+    def test_removed_and_edited_drafts_tracked(self):
+        gone = create_draft(_make_valid_entry(title="Will be rejected"), self.drafts_dir)
+        kept = create_draft(_make_valid_entry(title="Original title"), self.drafts_dir)
+        draft_titles(self.drafts_dir)
+
+        reject_draft(gone.path)
+        entry = json.loads(kept.path.read_text())
+        entry["title"] = "Edited title that is longer"
+        kept.path.write_text(json.dumps(entry))
+        self.assertEqual(draft_titles(self.drafts_dir), {"Edited title that is longer"})
+
+    def test_nonexistent_directory(self):
+        self.assertEqual(draft_titles(self.tmpdir / "nonexistent"), set())
+
+
 # ---------------------------------------------------------------------------
 # TestApproveDraft
 # ---------------------------------------------------------------------------
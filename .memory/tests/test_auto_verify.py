@@ -25,6 +25,8 @@ from lib.auto_verify import (
     StalenessResult,
     ValidationResult,
     VerifyReport,
+    _char_masks,
+    _lcs_length,
     _matches_source_pattern,
     _parse_source_ref,
     check_duplicates,
@@ -462,6 +464,59 @@ class TestCheckDuplicates(unittest.TestCase):
         r = check_duplicates(candidate, self.events_path)
         self.assertFalse(r.is_duplicate)
 
+    def test_lcs_length_matches_dynamic_programming(self):
+        import random
+        rng = random.Random(5)
+
+        def lcs_dp(a, b):
+            prev = [0] * (len(b) + 1)
+            for x in a:
+                cur = [0]
+                for j, y in enumerate(b):
+                    cur.append(prev[j] + 1 if x == y else max(prev[j + 1], cur[j]))
+                prev = cur
+            return prev[-1]
+
+        for _ in range(200):
+            a = "".join(rng.choice("abc d") for _ in range(rng.randint(0, 30)))
+            b = "".join(rng.choice("abc d") for _ in range(rng.randint(0, 30)))
+            self.assertEqual(_lcs_length(_char_masks(a), len(a), b), lcs_dp(a, b))
+
+    def test_lcs_prefilter_keeps_exact_ratios(self):
+        """Pruned or not, reported matches equal a plain SequenceMatcher pass."""
+        import difflib
+        import random
+        from lib.text_builder import build_dedup_text
+        rng = random.Random(9)
+        words = "cache lock sync path token rule draft entry query index".split()
+
+        def entry(i):
+            return {
+                "id": f"lesson-x-{i:08d}",
+                "title": " ".join(rng.choice(words) for _ in range(rng.randint(1, 6))),
+                "rule": " ".join(rng.choice(words) for _ in range(rng.randint(0, 6))),
+            }
+
+        existing = {e["id"]: e for e in (entry(i) for i in range(60))}
+        candidate = entry(999)
+        candidate_text = build_dedup_text(candidate)
+        for threshold in (0.85, 0.6, 0.3):
+            r = check_duplicates(
+                candidate, self.events_path, threshold,
+                _preloaded_entries=existing,
+            )
+            expected = sorted(
+                (
+                    (eid, round(ratio, 4))
+                    for eid, e in existing.items()
+                    for ratio in [difflib.SequenceMatcher(
+                        None, candidate_text, build_dedup_text(e)).ratio()]
+                    if ratio >= threshold
+                ),
+                key=lambda x: x[1], reverse=True,
+            )
+            self.assertEqual(r.similar_entries, expected)
+
 
 # ---------------------------------------------------------------------------
 # TestCheckVerifyCommand
@@ -8,7 +8,9 @@ Run:
     cd .memory/tests && python3 -m pytest test_events_io.py -v
 """
 
+import io
 import json
+import os
 import sys
 from pathlib import Path
 from unittest.mock import patch
@@ -18,7 +20,15 @@ _MEMORY_DIR = Path(__file__).resolve().parent.parent
 if str(_MEMORY_DIR) not in sys.path:
     sys.path.insert(0, str(_MEMORY_DIR))
 
-from lib.events_io import load_events_latest_wins
+from lib.events_io import (
+    iter_jsonl_lines,
+    json_loads,
+    load_active_events,
+    load_active_events_cached,
+    load_events_by_ids,
+    load_events_latest_wins,
+    peek_entry_id,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -317,6 +327,23 @@ class TestInvalidData:
         assert set(entries.keys()) == {"ok-1", "ok-2", "ok-3"}
         assert total_lines == 7
 
+    def test_invalid_utf8_and_crlf(self, tmp_path):
+        """Undecodable bytes are skipped; CRLF line endings still parse."""
+        events_file = tmp_path / "events.jsonl"
+        events_file.write_bytes(
+            json.dumps(_make_entry("crlf")).encode() + b"\r\n"
+            + b'{"id": "bad", "title": "\xff\xfe"}\n'
+            + json.dumps(_make_entry("ok", title="café"), ensure_ascii=False).encode()
+            + b"\n"
+        )
+
+        entries, total_lines, _ = load_events_latest_wins(events_file, track_lines=True)
+
+        assert set(entries) == {"crlf", "ok"}
+        assert entries["ok"]["title"] == "café"
+        assert entries["ok"]["_line"] == 2
+        assert total_lines == 3
+
 
 # ---------------------------------------------------------------------------
 # Tests — End byte offset
@@ -427,3 +454,267 @@ class TestIncrementalSync:
         assert offset2 == events_file.stat().st_size
         # The new offset should be larger than the old one
         assert offset2 > offset1
+
+
+# ---------------------------------------------------------------------------
+# Tests — json_loads
+# ---------------------------------------------------------------------------
+
+class _StrictFakeOrjson:
+    """Stand-in for orjson that rejects NaN the way the real one does."""
+
+    class JSONDecodeError(json.JSONDecodeError):
+        pass
+
+    @classmethod
+    def loads(cls, data):
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        if "NaN" in data:
+            raise cls.JSONDecodeError("NaN not allowed", data, 0)
+        return json.loads(data)
+
+
+class TestJsonLoads:
+    """Tests for the optional-orjson decoder."""
+
+    def test_decodes_str_and_bytes(self):
+        assert json_loads('{"id": "a"}') == {"id": "a"}
+        assert json_loads(b'{"id": "a"}') == {"id": "a"}
+
+    def test_invalid_raises_stdlib_error(self):
+        try:
+            json_loads("{not json")
+        except json.JSONDecodeError:
+            pass
+        else:
+            raise AssertionError("expected JSONDecodeError")
+
+    def test_fast_path_used_when_available(self):
+        with patch("lib.events_io._orjson", _StrictFakeOrjson):
+            assert json_loads('[1, 2]') == [1, 2]
+
+    def test_fast_path_rejection_falls_back_to_stdlib(self):
+        with patch("lib.events_io._orjson", _StrictFakeOrjson):
+            result = json_loads('{"score": NaN}')
+        assert result["score"] != result["score"]  # NaN
+
+    def test_loader_decodes_through_fast_path(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        _write_entries(path, [_make_entry("A"), _make_entry("B")])
+        calls = []
+
+        class _CountingOrjson(_StrictFakeOrjson):
+            @classmethod
+            def loads(cls, data):
+                calls.append(data)
+                return super().loads(data)
+
+        with patch("lib.events_io._orjson", _CountingOrjson):
+            entries, _, _ = load_events_latest_wins(path)
+        assert set(entries) == {"A", "B"}
+        assert len(calls) == 2
+
+
+# ---------------------------------------------------------------------------
+# Tests — iter_jsonl_lines
+# ---------------------------------------------------------------------------
+
+class TestIterJsonlLines:
+    """Tests for the chunked binary line reader."""
+
+    def test_matches_text_mode_iteration(self):
+        data = b'{"id": "a"}\n\n  \n{"id": "b"}\r\n{"id": "c"}'
+        expected = [line.rstrip("\n").encode()
+                    for line in io.StringIO(data.decode(), newline="")]
+        assert list(iter_jsonl_lines(io.BytesIO(data))) == expected
+
+    def test_lines_spanning_chunk_boundaries(self):
+        lines = [json.dumps(_make_entry(f"ID-{i}", title="x" * i)).encode()
+                 for i in range(50)]
+        data = b"\n".join(lines) + b"\n"
+        for chunk_size in (1, 7, 64, 1 << 20):
+            got = list(iter_jsonl_lines(io.BytesIO(data), chunk_size=chunk_size))
+            assert got == lines
+
+    def test_empty_file(self):
+        assert list(iter_jsonl_lines(io.BytesIO(b""))) == []
+
+    def test_reads_from_current_position(self):
+        f = io.BytesIO(b"skip\nkeep\n")
+        f.seek(5)
+        assert list(iter_jsonl_lines(f)) == [b"keep"]
+
+
+# ---------------------------------------------------------------------------
+# Tests — peek_entry_id / load_events_by_ids
+# ---------------------------------------------------------------------------
+
+class TestPeekEntryId:
+
+    def test_leading_id(self):
+        assert peek_entry_id(b'{"id": "A-1", "title": "x"}') == "A-1"
+
+    def test_non_leading_id_not_peeked(self):
+        assert peek_entry_id(b'{"title": "x", "id": "A-1"}') is None
+
+    def test_escaped_id_not_peeked(self):
+        assert peek_entry_id(b'{"id": "A\\u00e9"}') is None
+
+
+class TestLoadEventsByIds:
+
+    def test_only_wanted_ids_returned(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        _write_entries(path, [_make_entry("A"), _make_entry("B"), _make_entry("C")])
+        entries = load_events_by_ids(path, ["A", "C", "Z"])
+        assert set(entries) == {"A", "C"}
+
+    def test_latest_wins(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        _write_entries(path, [
+            _make_entry("A", title="old"),
+            _make_entry("B"),
+            _make_entry("A", title="new", deprecated=True),
+        ])
+        entries = load_events_by_ids(path, {"A"})
+        assert entries["A"]["title"] == "new"
+        assert entries["A"]["deprecated"] is True
+
+    def test_unwanted_lines_not_parsed(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        _write_entries(path, [_make_entry(f"ID-{i}") for i in range(20)])
+        with patch("lib.events_io.json_loads", side_effect=json.loads) as m:
+            entries = load_events_by_ids(path, {"ID-7"})
+        assert list(entries) == ["ID-7"]
+        assert m.call_count == 1
+
+    def test_non_leading_id_still_found(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        _write_jsonl(path, ['{"title": "x", "id": "A"}', "not json"])
+        assert set(load_events_by_ids(path, {"A"})) == {"A"}
+
+    def test_empty_ids_and_missing_file(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        assert load_events_by_ids(path, {"A"}) == {}
+        _write_entries(path, [_make_entry("A")])
+        assert load_events_by_ids(path, []) == {}
+
+
+# ---------------------------------------------------------------------------
+# Tests — load_active_events
+# ---------------------------------------------------------------------------
+
+class TestLoadActiveEvents:
+
+    def test_matches_filtered_latest_wins(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        _write_jsonl(path, [
+            json.dumps(_make_entry("A", title="v1")),
+            json.dumps(_make_entry("B")),
+            "",
+            "{broken",
+            json.dumps(_make_entry("A", title="v2")),
+            json.dumps(_make_entry("B", deprecated=True)),
+            json.dumps(_make_entry("C", deprecated=True)),
+            json.dumps(_make_entry("C", title="revived")),
+            json.dumps({"title": "no id"}),
+        ])
+        full, _, _ = load_events_latest_wins(path)
+        expected = {k: v for k, v in full.items() if not v.get("deprecated")}
+        active = load_active_events(path)
+        assert active == expected
+        assert list(active) == ["A", "C"]
+        assert active["A"]["title"] == "v2"
+
+    def test_missing_file(self, tmp_path):
+        assert load_active_events(tmp_path / "nope.jsonl") == {}
+
+
+# ---------------------------------------------------------------------------
+# Tests — load_active_events_cached
+# ---------------------------------------------------------------------------
+
+class TestLoadActiveEventsCached:
+
+    def setup_method(self):
+        import lib.events_io
+        lib.events_io._active_cache.clear()
+
+    @staticmethod
+    def _append(path, lines):
+        with open(path, "a", encoding="utf-8") as f:
+            for line in lines:
+                f.write(line + "\n")
+
+    def test_unchanged_file_returns_snapshot(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        _write_entries(path, [_make_entry("A"), _make_entry("B")])
+        first = load_active_events_cached(path)
+        with patch("lib.events_io.json_loads") as loads:
+            second = load_active_events_cached(path)
+        assert second is first
+        loads.assert_not_called()
+
+    def test_append_parses_only_new_lines(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        _write_entries(path, [_make_entry("A"), _make_entry("B")])
+        first = load_active_events_cached(path)
+        self._append(path, [
+            json.dumps(_make_entry("C")),
+            json.dumps(_make_entry("A", deprecated=True)),
+        ])
+        with patch("lib.events_io.json_loads", side_effect=json_loads) as loads:
+            active = load_active_events_cached(path)
+        assert loads.call_count == 2
+        assert active == load_active_events(path)
+        assert list(active) == ["B", "C"]
+        # The earlier snapshot is left untouched
+        assert set(first) == {"A", "B"}
+
+    def test_replaced_file_reloads(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        _write_entries(path, [_make_entry("A"), _make_entry("B")])
+        load_active_events_cached(path)
+        tmp = tmp_path / "events.jsonl.tmp"
+        _write_entries(tmp, [_make_entry("B"), _make_entry("C"), _make_entry("D")])
+        tmp.replace(path)
+        assert list(load_active_events_cached(path)) == ["B", "C", "D"]
+
+    def test_replace_between_lookup_and_read(self, tmp_path):
+        """A swap just before the open reloads the new file, not a mix."""
+        import builtins
+        path = tmp_path / "events.jsonl"
+        _write_entries(path, [_make_entry("A")])
+        load_active_events_cached(path)
+        # Grow the old inode so a stat-first signature would take the
+        # resume branch, then swap in a rewritten file as it is opened
+        self._append(path, [json.dumps(_make_entry("B"))])
+        tmp = tmp_path / "events.jsonl.tmp"
+        _write_entries(tmp, [_make_entry("C"), _make_entry("D"), _make_entry("E")])
+        real_open = builtins.open
+
+        def swapping_open(file, *args, **kwargs):
+            if tmp.exists():
+                tmp.replace(path)
+            return real_open(file, *args, **kwargs)
+
+        with patch("builtins.open", side_effect=swapping_open):
+            active = load_active_events_cached(path)
+        assert list(active) == ["C", "D", "E"]
+        import lib.events_io
+        assert lib.events_io._active_cache[str(path)][0][1] == os.stat(path).st_ino
+        assert load_active_events_cached(path) is active
+
+    def test_partial_last_line_reread(self, tmp_path):
+        path = tmp_path / "events.jsonl"
+        line = json.dumps(_make_entry("B"))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(_make_entry("A")) + "\n" + line[:10])
+        assert list(load_active_events_cached(path)) == ["A"]
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line[10:] + "\n")
+        assert list(load_active_events_cached(path)) == ["A", "B"]
+
+    def test_missing_file(self, tmp_path):
+        assert load_active_events_cached(tmp_path / "nope.jsonl") == {}
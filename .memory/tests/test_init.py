@@ -526,6 +526,16 @@ class TestScanProject(unittest.TestCase):
             suggestions = scan_project(Path(tmp))
             self.assertTrue(any(".memory/working/" in s for s in suggestions))
 
+    def test_gitignore_drafts_json_only_flags_titles_index(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            (Path(tmp) / ".gitignore").write_text(
+                ".memory/working/\nvectors.db\n"
+                ".memory/archive/\n.memory/drafts/*.json\n"
+                ".claude/rules/ef-memory/\n"
+            )
+            suggestions = scan_project(Path(tmp))
+            self.assertTrue(any("_titles.index" in s for s in suggestions))
+
     def test_gitignore_complete(self):
         with tempfile.TemporaryDirectory() as tmp:
             (Path(tmp) / ".gitignore").write_text(
@@ -84,6 +84,23 @@ class TestEntriesToCompactText(unittest.TestCase):
         self.assertIn("truncated", text)
         self.assertLessEqual(len(text), 1000)  # Some overhead from join
 
+    def test_accepts_dict_values(self):
+        entries = {"a": {"id": "a", "title": "First"}, "b": {"id": "b", "title": "Second"}}
+        text = _entries_to_compact_text(entries.values(), 5000)
+        self.assertIn("First", text)
+        self.assertIn("Second", text)
+
+    def test_stops_consuming_after_budget(self):
+        consumed = []
+
+        def gen():
+            for i in range(100):
+                consumed.append(i)
+                yield {"id": f"entry-{i}", "title": "x" * 50}
+
+        _entries_to_compact_text(gen(), 200)
+        self.assertLess(len(consumed), 10)
+
     def test_empty_entries(self):
         text = _entries_to_compact_text([], 5000)
         self.assertEqual(text, "")
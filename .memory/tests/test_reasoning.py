@@ -9,6 +9,7 @@ and all helper functions.
 import json
 import sys
 import tempfile
+import threading
 import unittest
 from dataclasses import dataclass
 from pathlib import Path
@@ -37,6 +38,14 @@ from lib.reasoning import (
     _parse_llm_json,
     _safe_llm_call,
     _get_reasoning_config,
+    _index_tags,
+    _bits_to_tags,
+    _keyword_mask,
+    _KEYWORD_BITS,
+    _source_file_path,
+    _tag_sharing_pairs,
+    _entry_timestamp,
+    _join_within_budget,
 )
 from tests.conftest import (
     MockLLMProvider,
@@ -217,6 +226,17 @@ class TestCorrelationHeuristic(unittest.TestCase):
         temporal_groups = [g for g in report.groups if "temporal" in g.relationship]
         self.assertGreater(len(temporal_groups), 0)
 
+    def test_temporal_window_boundary(self):
+        entries = {
+            "a": {"id": "a", "tags": [], "source": [], "created_at": "2026-02-01T00:00:00Z"},
+            "b": {"id": "b", "tags": [], "source": [], "created_at": "2026-02-02T00:00:00+00:00"},
+            "c": {"id": "c", "tags": [], "source": [], "created_at": "2026-02-03T00:00:01Z"},
+        }
+        report = find_correlations(entries, _make_config())
+        temporal_groups = [g for g in report.groups if "temporal" in g.relationship]
+        # a-b exactly 24h apart are grouped; c is one second outside b's window
+        self.assertEqual([g.entry_ids for g in temporal_groups], [["a", "b"]])
+
     def test_no_correlations_for_diverse_entries(self):
         entries = {
             "a": {"id": "a", "tags": ["x"], "source": ["file1.py:L1"], "created_at": "2026-01-01T00:00:00Z"},
@@ -253,6 +273,20 @@ class TestCorrelationHeuristic(unittest.TestCase):
         tag_groups_high = [g for g in report_high.groups if "tag" in g.relationship]
         self.assertEqual(len(tag_groups_high), 0)
 
+    def test_overlapping_groups_merge_transitively(self):
+        # a-b share tags, c-d share a source file, b-c are within 24h
+        entries = {
+            "a": {"id": "a", "tags": ["x", "y"], "source": [], "created_at": "2026-01-01T00:00:00Z"},
+            "b": {"id": "b", "tags": ["x", "y"], "source": [], "created_at": "2026-03-01T00:00:00Z"},
+            "c": {"id": "c", "tags": [], "source": ["src/foo.py:L1"], "created_at": "2026-03-01T10:00:00Z"},
+            "d": {"id": "d", "tags": [], "source": ["src/foo.py:L9"], "created_at": "2026-06-01T00:00:00Z"},
+        }
+        report = find_correlations(entries, _make_config())
+        self.assertEqual(len(report.groups), 1)
+        self.assertEqual(report.groups[0].entry_ids, ["a", "b", "c", "d"])
+        self.assertEqual(report.groups[0].relationship, "tag+source+temporal")
+        self.assertEqual(report.groups[0].strength, 1.0)
+
     def test_duration_tracked(self):
         report = find_correlations({}, _make_config())
         self.assertGreaterEqual(report.duration_ms, 0)
@@ -341,6 +375,33 @@ class TestContradictionHeuristic(unittest.TestCase):
         severity_pairs = [p for p in report.pairs if p.type == "severity_mismatch"]
         self.assertGreater(len(severity_pairs), 0)
 
+    def test_severity_mismatch_requires_both_severities(self):
+        entries = {
+            "a": {"id": "a", "tags": ["x", "y"], "severity": "S1", "rule": "do X"},
+            "b": {"id": "b", "tags": ["x", "y"], "severity": "", "rule": "do Y"},
+            "c": {"id": "c", "tags": ["x", "y"], "rule": "do Z"},
+            "d": {"id": "d", "tags": ["x", "y"], "severity": "S1", "rule": "do W"},
+        }
+        report = detect_contradictions(entries, _make_config())
+        self.assertEqual(report.pairs, [])
+
+    def test_rule_conflict_not_duplicated_as_severity_mismatch(self):
+        entries = {
+            "a": {"id": "a", "tags": ["x", "y"], "severity": "S1", "rule": "MUST shift"},
+            "b": {"id": "b", "tags": ["x", "y"], "severity": "S3", "rule": "NEVER shift"},
+        }
+        report = detect_contradictions(entries, _make_config())
+        self.assertEqual([p.type for p in report.pairs], ["rule_conflict"])
+
+    def test_severity_mismatch_explanation(self):
+        entries = {
+            "a": {"id": "a", "tags": ["x", "y"], "severity": "S2", "rule": "do X"},
+            "b": {"id": "b", "tags": ["x", "y"], "severity": "custom", "rule": "do Y"},
+        }
+        report = detect_contradictions(entries, _make_config())
+        self.assertEqual(len(report.pairs), 1)
+        self.assertIn("(S2 vs custom)", report.pairs[0].explanation)
+
     def test_no_contradictions_for_compatible_entries(self):
         entries = {
             "a": {"id": "a", "tags": ["x", "y"], "severity": "S1", "rule": "MUST do X", "source": [], "created_at": "2026-01-01T00:00:00Z"},
@@ -407,6 +468,20 @@ class TestContradictionWithLLM(unittest.TestCase):
         report = detect_contradictions(entries, _make_config(), llm_provider=FailingLLM())
         self.assertEqual(report.mode, "heuristic")
 
+    def test_many_pairs_keep_prompt_instructions(self):
+        rule = "MUST " + "x" * 300
+        entries = {
+            f"e{i}": {"id": f"e{i}", "tags": ["t"], "rule": rule if i % 2 else "NEVER " + "y" * 300}
+            for i in range(30)
+        }
+        mock = MockLLMProvider()
+        detect_contradictions(entries, _make_config(token_budget=2000), llm_provider=mock)
+        self.assertEqual(mock._call_count, 1)
+        user_prompt = mock._calls[0][1]
+        self.assertLessEqual(len(user_prompt), 2000)
+        self.assertTrue(user_prompt.endswith("Return JSON only."))
+        self.assertIn("omitted due to token budget", user_prompt)
+
     def test_llm_no_candidates_no_call(self):
         # If no heuristic candidates, LLM is not called
         entries = {
@@ -691,6 +766,34 @@ class TestBuildReasoningReport(unittest.TestCase):
         # So mode stays heuristic unless responses are configured
         self.assertIn(report.mode, ("heuristic", "llm_enriched"))
 
+    def test_llm_stages_run_concurrently(self):
+        # Each call waits until all three stages are in flight; a sequential
+        # orchestrator would break the barrier and every stage would degrade.
+        barrier = threading.Barrier(3, timeout=5)
+        eids = [e["id"] for e in SAMPLE_ENTRIES_EXTENDED]
+
+        class BarrierLLM(MockLLMProvider):
+            def complete(self, system_prompt, user_prompt, max_tokens=4096):
+                barrier.wait()
+                response = super().complete(system_prompt, user_prompt, max_tokens)
+                if "correlations" in user_prompt:
+                    payload = {"groups": [{"entry_ids": eids[:2], "relationship": "r"}]}
+                elif "contradiction" in user_prompt:
+                    payload = {"contradictions": [{"entry_id_a": eids[0], "entry_id_b": eids[1]}]}
+                else:
+                    payload = {"syntheses": [{"source_entry_ids": eids[:3]}]}
+                response.text = json.dumps(payload)
+                return response
+
+        report = build_reasoning_report(
+            self.events_path, _make_config(), self.tmpdir,
+            llm_provider=BarrierLLM(),
+        )
+        self.assertEqual(report.correlation_report.mode, "llm_enriched")
+        self.assertEqual(report.contradiction_report.mode, "llm_enriched")
+        self.assertEqual(report.synthesis_report.mode, "llm_enriched")
+        self.assertEqual(report.llm_calls, 3)
+
     def test_deprecated_entries_excluded(self):
         dep_path = self.tmpdir / "with_deprecated.jsonl"
         with open(dep_path, "w") as f:
@@ -802,5 +905,140 @@ class TestCorrelationTimestampSafety(unittest.TestCase):
         self.assertEqual(report.total_entries, 2)
 
 
+# ---------------------------------------------------------------------------
+# Tag bitset helpers
+# ---------------------------------------------------------------------------
+
+class TestIndexTags(unittest.TestCase):
+
+    def test_roundtrip(self):
+        entry_list = [
+            ("a", {"tags": ["x", "y"]}),
+            ("b", {"tags": ["y", "z", "x"]}),
+            ("c", {}),
+        ]
+        bits, names, postings = _index_tags(entry_list)
+        self.assertEqual(len(bits), 3)
+        self.assertEqual(bits[2], 0)
+        self.assertEqual(_bits_to_tags(bits[1], names), ["x", "y", "z"])
+        self.assertEqual(_bits_to_tags(bits[0] & bits[1], names), ["x", "y"])
+
+    def test_duplicate_tags_counted_once(self):
+        bits, names, postings = _index_tags([("a", {"tags": ["x", "x"]})])
+        self.assertEqual(bits[0].bit_count(), 1)
+        self.assertEqual(postings, [[0]])
+
+    def test_postings_list_entries_per_tag(self):
+        entry_list = [("a", {"tags": ["x"]}), ("b", {"tags": ["y", "x"]})]
+        _bits, names, postings = _index_tags(entry_list)
+        self.assertEqual(dict(zip(names, postings)), {"x": [0, 1], "y": [1]})
+
+    def test_shared_tags_in_explanation(self):
+        entries = {
+            "a": {"id": "a", "tags": ["y", "x"], "severity": "S1", "rule": "do X"},
+            "b": {"id": "b", "tags": ["x", "y", "z"], "severity": "S3", "rule": "do Y"},
+        }
+        report = detect_contradictions(entries, _make_config())
+        self.assertEqual(len(report.pairs), 1)
+        self.assertIn("['x', 'y']", report.pairs[0].explanation)
+
+
+class TestTagSharingPairs(unittest.TestCase):
+
+    def test_only_pairs_sharing_a_tag(self):
+        entry_list = [
+            ("a", {"tags": ["x"]}),
+            ("b", {"tags": ["y"]}),
+            ("c", {"tags": ["x", "y"]}),
+            ("d", {"tags": []}),
+        ]
+        _bits, _names, postings = _index_tags(entry_list)
+        self.assertEqual(_tag_sharing_pairs(postings), [(0, 2), (1, 2)])
+
+    def test_multiple_shared_tags_yield_one_pair(self):
+        entry_list = [("a", {"tags": ["x", "y", "x"]}), ("b", {"tags": ["y", "x"]})]
+        _bits, _names, postings = _index_tags(entry_list)
+        self.assertEqual(_tag_sharing_pairs(postings), [(0, 1)])
+
+
+class TestKeywordMask(unittest.TestCase):
+
+    def test_case_insensitive(self):
+        self.assertEqual(_keyword_mask("always shift"), _KEYWORD_BITS["always"])
+
+    def test_must_not_also_sets_must(self):
+        mask = _keyword_mask("You MUST NOT do this")
+        self.assertTrue(mask & _KEYWORD_BITS["must not"])
+        self.assertTrue(mask & _KEYWORD_BITS["must"])
+
+    def test_empty_rule(self):
+        self.assertEqual(_keyword_mask(""), 0)
+
+    def test_before_after_conflict(self):
+        entries = {
+            "a": {"id": "a", "tags": ["x"], "rule": "Validate before merge"},
+            "b": {"id": "b", "tags": ["x"], "rule": "Validate after merge"},
+        }
+        report = detect_contradictions(entries, _make_config())
+        self.assertEqual([p.type for p in report.pairs], ["rule_conflict"])
+        self.assertIn("'before'/'after'", report.pairs[0].explanation)
+
+
+class TestSourceFilePath(unittest.TestCase):
+
+    def test_line_range(self):
+        self.assertEqual(_source_file_path("src/foo.py:L1-L10"), "src/foo.py")
+
+    def test_anchor_before_colon(self):
+        self.assertEqual(
+            _source_file_path("docs/INCIDENTS.md#INC-036:L553-L699"),
+            "docs/INCIDENTS.md",
+        )
+
+    def test_symbol_ref(self):
+        self.assertEqual(_source_file_path("lib/x.py::func"), "lib/x.py")
+
+    def test_plain_path(self):
+        self.assertEqual(_source_file_path("README.md"), "README.md")
+
+
+class TestEntryTimestamp(unittest.TestCase):
+
+    def test_parses_z_suffix(self):
+        ts = _entry_timestamp("2026-02-01T14:00:00Z")
+        self.assertEqual((ts.year, ts.month, ts.day, ts.hour), (2026, 2, 1, 14))
+        self.assertIsNotNone(ts.tzinfo)
+
+    def test_repeated_parse_returns_cached_object(self):
+        self.assertIs(
+            _entry_timestamp("2026-02-01T14:00:00Z"),
+            _entry_timestamp("2026-02-01T14:00:00Z"),
+        )
+
+    def test_missing_or_invalid_returns_none(self):
+        for value in (None, "", "not-a-date", 12345, ["2026-01-01"]):
+            self.assertIsNone(_entry_timestamp(value))
+
+
+class TestJoinWithinBudget(unittest.TestCase):
+
+    def test_all_parts_fit(self):
+        self.assertEqual(_join_within_budget(["ab", "cd"], 10), ("ab\ncd", 2))
+
+    def test_overflow_is_noted(self):
+        text, kept = _join_within_budget(["abcd", "efgh", "ijkl"], 9)
+        self.assertEqual(kept, 2)
+        self.assertTrue(text.startswith("abcd\nefgh\n"))
+        self.assertIn("omitted", text)
+
+    def test_nothing_fits(self):
+        text, kept = _join_within_budget(["abcdef"], 3)
+        self.assertEqual(kept, 0)
+        self.assertIn("omitted", text)
+
+    def test_empty(self):
+        self.assertEqual(_join_within_budget([], 10), ("", 0))
+
+
 if __name__ == "__main__":
     unittest.main()
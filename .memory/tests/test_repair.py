@@ -6,8 +6,11 @@ from pathlib import Path
 
 from lib.repair import (
     RepairReport,
+    count_merge_markers,
     detect_merge_markers,
+    has_merge_markers,
     repair_events,
+    _ReadStats,
     _read_raw_lines,
     _resolve_by_newest,
     _check_orphan_sources,
@@ -67,6 +70,17 @@ class TestDetectMergeMarkers(unittest.TestCase):
     def test_nonexistent_file(self):
         self.assertEqual(detect_merge_markers(Path("/nonexistent/events.jsonl")), 0)
 
+    def test_marker_requires_exact_prefix(self):
+        """Eight-char runs, indented runs and marker-like JSON are not markers."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
+            f.write("========\n")
+            f.write(" <<<<<<< HEAD\n")
+            f.write(json.dumps(_make_entry("EV-001", title=">>>>>>> x")) + "\n")
+            f.write("=======")  # marker at EOF without newline
+            path = Path(f.name)
+        self.assertEqual(detect_merge_markers(path), 1)
+        path.unlink()
+
     def test_empty_file(self):
         with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
             path = Path(f.name)
@@ -74,6 +88,43 @@ class TestDetectMergeMarkers(unittest.TestCase):
         path.unlink()
 
 
+class TestHasMergeMarkers(unittest.TestCase):
+
+    def test_clean_and_conflicted(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            clean = Path(tmp) / "clean.jsonl"
+            _write_events(str(clean), [_make_entry("EV-001")])
+            dirty = Path(tmp) / "dirty.jsonl"
+            _write_events(str(dirty), [_make_entry("EV-001"), "<<<<<<< HEAD"])
+            self.assertFalse(has_merge_markers(clean))
+            self.assertTrue(has_merge_markers(dirty))
+            self.assertFalse(has_merge_markers(Path(tmp) / "missing.jsonl"))
+
+    def test_stops_at_first_marker(self):
+        from unittest.mock import patch
+        import lib.repair as repair_mod
+        seen = []
+        real = repair_mod._is_merge_marker
+
+        def spy(line):
+            seen.append(line)
+            return real(line)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "events.jsonl"
+            _write_events(str(path), [
+                "<<<<<<< HEAD", _make_entry("EV-001"), "=======",
+                _make_entry("EV-002"), ">>>>>>> branch",
+            ])
+            with patch.object(repair_mod, "_is_merge_marker", spy):
+                self.assertTrue(has_merge_markers(path))
+            self.assertEqual(len(seen), 1)
+            self.assertEqual(count_merge_markers(path), 3)
+
+    def test_detect_alias_counts(self):
+        self.assertIs(detect_merge_markers, count_merge_markers)
+
+
 # ===========================================================================
 # _read_raw_lines
 # ===========================================================================
@@ -92,9 +143,10 @@ class TestReadRawLines(unittest.TestCase):
             ])
             path = Path(f.name)
 
-        entries, total_valid, markers = _read_raw_lines(path)
-        self.assertEqual(markers, 3)
-        self.assertEqual(total_valid, 3)
+        stats = _ReadStats()
+        entries = [e for _, e in _read_raw_lines(path, stats)]
+        self.assertEqual(stats.markers, 3)
+        self.assertEqual(stats.total_valid, 3)
         ids = [e["id"] for e in entries]
         self.assertIn("EV-001", ids)
         self.assertIn("EV-002", ids)
@@ -109,9 +161,65 @@ class TestReadRawLines(unittest.TestCase):
             ])
             path = Path(f.name)
 
-        entries, _, _ = _read_raw_lines(path)
-        self.assertEqual(entries[0]["_pos"], 0)
-        self.assertEqual(entries[1]["_pos"], 1)
+        positions = [pos for pos, _ in _read_raw_lines(path)]
+        self.assertEqual(positions, [0, 1])
+        path.unlink()
+
+    def test_is_lazy_generator(self):
+        """Lines are parsed on demand, not buffered into a list up front."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
+            _write_events(f.name, [
+                _make_entry("EV-001"),
+                "<<<<<<< HEAD",
+                _make_entry("EV-002"),
+            ])
+            path = Path(f.name)
+
+        stats = _ReadStats()
+        stream = _read_raw_lines(path, stats)
+        _, first = next(stream)
+        self.assertEqual(first["id"], "EV-001")
+        self.assertEqual(stats.total_valid, 1)
+        self.assertEqual(stats.markers, 0)
+        list(stream)
+        self.assertEqual(stats.total_valid, 2)
+        self.assertEqual(stats.markers, 1)
+        path.unlink()
+
+
+    def test_skips_stale_duplicates(self):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
+            _write_events(f.name, [
+                _make_entry("EV-001", created_at="2026-03-01T00:00:00Z", title="new"),
+                _make_entry("EV-001", created_at="2026-01-01T00:00:00Z", title="old"),
+                _make_entry("EV-001", created_at="2026-03-01T00:00:00Z", title="tie"),
+            ])
+            path = Path(f.name)
+
+        stats = _ReadStats()
+        best = {}
+        result, dups = _resolve_by_newest(_read_raw_lines(path, stats, best), best)
+        self.assertEqual(stats.total_valid, 3)
+        self.assertEqual(stats.stale_skipped, 1)
+        self.assertEqual(dups + stats.stale_skipped, 2)
+        # Equal timestamps are still parsed so the later line wins
+        self.assertEqual(result[0]["title"], "tie")
+        path.unlink()
+
+    def test_unorderable_timestamps_go_through_dedup(self):
+        """A line without created_at is never skipped as stale."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
+            _write_events(f.name, [
+                _make_entry("EV-001", created_at="2026-03-01T00:00:00Z"),
+                '{"id": "EV-001", "title": "no stamp"}',
+            ])
+            path = Path(f.name)
+
+        stats = _ReadStats()
+        best = {}
+        _resolve_by_newest(_read_raw_lines(path, stats, best), best)
+        self.assertEqual(stats.stale_skipped, 0)
+        self.assertEqual(stats.total_valid, 2)
         path.unlink()
 
 
@@ -123,8 +231,8 @@ class TestResolveByNewest(unittest.TestCase):
 
     def test_no_duplicates(self):
         entries = [
-            {**_make_entry("EV-001"), "_pos": 0},
-            {**_make_entry("EV-002"), "_pos": 1},
+            (0, _make_entry("EV-001")),
+            (1, _make_entry("EV-002")),
         ]
         result, dups = _resolve_by_newest(entries)
         self.assertEqual(len(result), 2)
@@ -132,8 +240,8 @@ class TestResolveByNewest(unittest.TestCase):
 
     def test_same_id_different_timestamps(self):
         entries = [
-            {**_make_entry("EV-001", created_at="2026-01-01T00:00:00Z", title="old"), "_pos": 0},
-            {**_make_entry("EV-001", created_at="2026-02-01T00:00:00Z", title="new"), "_pos": 1},
+            (0, _make_entry("EV-001", created_at="2026-01-01T00:00:00Z", title="old")),
+            (1, _make_entry("EV-001", created_at="2026-02-01T00:00:00Z", title="new")),
         ]
         result, dups = _resolve_by_newest(entries)
         self.assertEqual(len(result), 1)
@@ -143,8 +251,8 @@ class TestResolveByNewest(unittest.TestCase):
     def test_same_id_same_timestamp_file_order(self):
         """When timestamps are equal, later file position wins."""
         entries = [
-            {**_make_entry("EV-001", created_at="2026-02-01T00:00:00Z", title="first"), "_pos": 0},
-            {**_make_entry("EV-001", created_at="2026-02-01T00:00:00Z", title="second"), "_pos": 5},
+            (0, _make_entry("EV-001", created_at="2026-02-01T00:00:00Z", title="first")),
+            (5, _make_entry("EV-001", created_at="2026-02-01T00:00:00Z", title="second")),
         ]
         result, dups = _resolve_by_newest(entries)
         self.assertEqual(len(result), 1)
@@ -154,18 +262,43 @@ class TestResolveByNewest(unittest.TestCase):
     def test_newer_timestamp_wins_regardless_of_position(self):
         """Newer timestamp wins even if it appears earlier in file."""
         entries = [
-            {**_make_entry("EV-001", created_at="2026-03-01T00:00:00Z", title="newer-first"), "_pos": 0},
-            {**_make_entry("EV-001", created_at="2026-01-01T00:00:00Z", title="older-second"), "_pos": 5},
+            (0, _make_entry("EV-001", created_at="2026-03-01T00:00:00Z", title="newer-first")),
+            (5, _make_entry("EV-001", created_at="2026-01-01T00:00:00Z", title="older-second")),
         ]
         result, dups = _resolve_by_newest(entries)
         self.assertEqual(result[0]["title"], "newer-first")
 
-    def test_pos_field_stripped(self):
+    def test_accepts_iterator(self):
+        entries = iter([
+            (0, _make_entry("EV-001", title="a")),
+            (1, _make_entry("EV-001", title="b")),
+            (2, _make_entry("EV-002")),
+        ])
+        result, dups = _resolve_by_newest(entries)
+        self.assertEqual(len(result), 2)
+        self.assertEqual(dups, 1)
+
+    def test_survivors_sorted_by_created_at(self):
         entries = [
-            {**_make_entry("EV-001"), "_pos": 3},
+            (0, _make_entry("EV-003", created_at="2026-03-01T00:00:00Z")),
+            (1, _make_entry("EV-001", created_at="2026-01-01T00:00:00Z")),
+            (2, _make_entry("EV-002", created_at="2026-02-01T00:00:00Z")),
+            (3, _make_entry("EV-001", created_at="2026-04-01T00:00:00Z")),
+            (4, _make_entry("EV-004", created_at="2026-02-01T00:00:00Z")),
         ]
-        result, _ = _resolve_by_newest(entries)
-        self.assertNotIn("_pos", result[0])
+        result, dups = _resolve_by_newest(entries)
+        self.assertEqual(dups, 1)
+        self.assertEqual(
+            [e["id"] for e in result], ["EV-002", "EV-004", "EV-003", "EV-001"],
+        )
+
+    def test_entries_returned_unmodified(self):
+        """Positions are tracked beside entries; dicts are not copied or mutated."""
+        entry = _make_entry("EV-001")
+        original = dict(entry)
+        result, _ = _resolve_by_newest([(3, entry)])
+        self.assertIs(result[0], entry)
+        self.assertEqual(entry, original)
 
 
 # ===========================================================================
@@ -224,6 +357,22 @@ class TestCheckOrphanSources(unittest.TestCase):
             self.assertEqual(len(orphans), 0)
 
 
+    def test_shared_file_stat_once(self):
+        """Several refs to the same file cost one existence check."""
+        from unittest.mock import patch
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            entries = [
+                _make_entry("EV-001", source=["gone.py:L1", "gone.py#top"]),
+                _make_entry("EV-002", source=["gone.py::fn"]),
+            ]
+            with patch.object(Path, "exists", autospec=True, return_value=False) as m:
+                orphans = _check_orphan_sources(entries, root)
+            self.assertEqual(m.call_count, 1)
+            self.assertEqual(len(orphans), 2)
+            self.assertEqual(len(orphans[0].missing_sources), 2)
+
+
 # ===========================================================================
 # repair_events (integration)
 # ===========================================================================
@@ -286,6 +435,77 @@ class TestRepairEvents(unittest.TestCase):
                 entries = {json.loads(l)["id"]: json.loads(l) for l in f if l.strip()}
             self.assertEqual(entries["EV-001"]["title"], "new")
 
+    def test_orphans_reported_when_rewriting(self):
+        """Orphan detection still fills the report when it overlaps the write."""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            events = root / "events.jsonl"
+            _write_events(str(events), [
+                _make_entry("EV-001", source=["missing.py:L1"]),
+                "<<<<<<< HEAD",
+                _make_entry("EV-002", source=["missing.py:L2"]),
+            ])
+            report = repair_events(events, root)
+            self.assertEqual(report.errors, [])
+            self.assertEqual(report.merge_markers_removed, 1)
+            self.assertTrue(report.backup_path)
+            self.assertEqual(
+                sorted(o.entry_id for o in report.orphan_sources),
+                ["EV-001", "EV-002"],
+            )
+
+    def test_rewrite_bytes_match_stdlib_format(self):
+        """Batched binary rewrite emits exactly json.dumps(..., ensure_ascii=False) lines."""
+        from unittest.mock import patch
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            events = root / "events.jsonl"
+            entries = [
+                _make_entry(f"EV-{i:03d}", title=f"título {i} — ✓",
+                            created_at=f"2026-02-{i + 1:02d}T00:00:00Z")
+                for i in range(12)
+            ]
+            _write_events(str(events), entries + ["=======", entries[0]])
+            with patch("lib.repair._WRITE_FLUSH", 300):
+                report = repair_events(events, root, create_backup=False)
+            self.assertEqual(report.errors, [])
+            expected = "".join(
+                json.dumps(e, ensure_ascii=False) + "\n" for e in entries
+            ).encode("utf-8")
+            self.assertEqual(events.read_bytes(), expected)
+
+    def test_stale_duplicate_counted_when_skipped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            events = root / "events.jsonl"
+            _write_events(str(events), [
+                _make_entry("EV-001", title="new", created_at="2026-02-01T00:00:00Z"),
+                _make_entry("EV-001", title="old", created_at="2026-01-01T00:00:00Z"),
+            ])
+            report = repair_events(events, root)
+            self.assertEqual(report.entries_before, 2)
+            self.assertEqual(report.duplicate_ids_resolved, 1)
+            self.assertEqual(report.entries_after, 1)
+            with open(events) as f:
+                kept = [json.loads(l) for l in f if l.strip()]
+            self.assertEqual(kept[0]["title"], "new")
+
+    def test_corrupt_stale_looking_line_left_alone(self):
+        """A broken line with a readable older id/created_at is just invalid."""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            events = root / "events.jsonl"
+            _write_events(str(events), [
+                _make_entry("EV-001", title="new", created_at="2026-02-01T00:00:00Z"),
+                '{"id": "EV-001", "created_at": "2026-01-01T00:00:00Z", "title": "cut}',
+            ])
+            original = events.read_bytes()
+            report = repair_events(events, root)
+            self.assertEqual(report.entries_before, 1)
+            self.assertEqual(report.duplicate_ids_resolved, 0)
+            self.assertFalse(report.needs_repair)
+            self.assertEqual(events.read_bytes(), original)
+
     def test_dry_run_no_modification(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp)
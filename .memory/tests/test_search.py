@@ -3,6 +3,7 @@
 import json
 import tempfile
 import unittest
+import unittest.mock
 import sys
 from pathlib import Path
 
@@ -18,6 +19,9 @@ from lib.search import (
     _get_search_weights,
     _load_entries,
     _determine_mode,
+    _entry_boosts,
+    _entry_text_key,
+    _tokenize_entry,
     SearchResult,
 )
 from lib.vectordb import VectorDB
@@ -49,6 +53,9 @@ class SearchTestBase(unittest.TestCase):
     """Base class that sets up events.jsonl and vectors.db with sample data."""
 
     def setUp(self):
+        import lib.search as search_mod
+        search_mod._query_cache.clear()
+        search_mod._embed_cache.clear()
         self.tmpdir = tempfile.mkdtemp()
         self.events_path = Path(self.tmpdir) / "events.jsonl"
         self.db_path = Path(self.tmpdir) / "vectors.db"
@@ -148,6 +155,46 @@ class TestComputeBoost(unittest.TestCase):
         entry = {"severity": "S1"}
         self.assertAlmostEqual(_compute_boost(entry, self.weights), 0.0)
 
+    def test_hard_unknown_severity_no_boost(self):
+        for severity in ("S4", "", None):
+            entry = {"classification": "hard", "severity": severity}
+            self.assertAlmostEqual(_compute_boost(entry, self.weights), 0.0)
+
+
+class TestTokenizeEntry(unittest.TestCase):
+
+    def test_tokens_cover_all_text_fields(self):
+        entry = {
+            "title": "Rolling Window",
+            "rule": "Shift first",
+            "implication": None,
+            "content": ["Use lag", ""],
+            "tags": ["leakage"],
+        }
+        tokens, title_lower = _tokenize_entry(_entry_text_key(entry))
+        self.assertEqual(
+            tokens, {"rolling", "window", "shift", "first", "use", "lag", "leakage"},
+        )
+        self.assertEqual(title_lower, "rolling window")
+
+    def test_non_list_content_ignored(self):
+        entry = {"title": "T", "content": "not a list", "tags": "nope"}
+        tokens, _ = _tokenize_entry(_entry_text_key(entry))
+        self.assertEqual(tokens, {"t"})
+
+    def test_cached_across_equal_entries(self):
+        entry = {"title": "cache probe unique", "content": ["x"]}
+        first = _tokenize_entry(_entry_text_key(entry))
+        second = _tokenize_entry(_entry_text_key(dict(entry)))
+        self.assertIs(first, second)
+
+    def test_tokens_are_interned(self):
+        a, _ = _tokenize_entry(_entry_text_key({"title": "interned zebrafish one"}))
+        b, _ = _tokenize_entry(_entry_text_key({"title": "interned zebrafish two"}))
+        token_a = next(t for t in a if t == "zebrafish")
+        token_b = next(t for t in b if t == "zebrafish")
+        self.assertIs(token_a, token_b)
+
 
 class TestLoadEntries(unittest.TestCase):
 
@@ -352,6 +399,149 @@ class TestBasicSearch(SearchTestBase):
         self.assertNotIn("lesson-inc036-a3f8c2d1", ids)
 
 
+class TestBasicIndex(SearchTestBase):
+    """Inverted index and per-file cache for basic mode."""
+
+    def setUp(self):
+        super().setUp()
+        import lib.search as search_mod
+        search_mod._basic_cache = None
+
+    def test_index_matches_linear_scan(self):
+        from lib.search import _build_basic_index
+        entries = _load_entries(self.events_path)
+        weights = _get_search_weights(TEST_CONFIG)
+        index = _build_basic_index(entries)
+        for query in ("leakage rolling", "shift", "zzz_nothing", "window data"):
+            linear = _search_basic(query, entries, weights, 10)
+            indexed = _search_basic(query, entries, weights, 10, index)
+            self.assertEqual(
+                [(r.entry_id, r.score) for r in linear],
+                [(r.entry_id, r.score) for r in indexed],
+            )
+
+    def test_postings_path_skips_token_sets(self):
+        from lib.search import _build_basic_index
+        entries = _load_entries(self.events_path)
+        weights = _get_search_weights(TEST_CONFIG)
+        index = _build_basic_index(entries)
+        linear = _search_basic("leakage rolling", entries, weights, 10)
+        index.tokens = []  # overlap comes from posting hit counts alone
+        indexed = _search_basic("leakage rolling", entries, weights, 10, index)
+        self.assertTrue(indexed)
+        self.assertEqual(
+            [(r.entry_id, r.score) for r in linear],
+            [(r.entry_id, r.score) for r in indexed],
+        )
+
+    def test_pruned_postings_match_linear_scan(self):
+        import random
+        from lib.search import _build_basic_index
+        rng = random.Random(7)
+        words = [f"w{i}" for i in range(30)]
+        entries = {
+            f"e{i}": {
+                "id": f"e{i}",
+                "title": " ".join(rng.sample(words, 3)),
+                "content": [" ".join(rng.sample(words, 5))],
+                "classification": rng.choice(["hard", "soft"]),
+                "severity": rng.choice(["S1", "S2", "S3"]),
+                "_meta": {"confidence": rng.random()},
+            }
+            for i in range(300)
+        }
+        weights = _get_search_weights(TEST_CONFIG)
+        index = _build_basic_index(entries)
+        for _ in range(40):
+            query = " ".join(rng.sample(words, rng.randint(1, 4)))
+            for k in (1, 3, 10):
+                linear = _search_basic(query, entries, weights, k)
+                indexed = _search_basic(query, entries, weights, k, index)
+                self.assertEqual(
+                    [(r.entry_id, r.score) for r in linear],
+                    [(r.entry_id, r.score) for r in indexed],
+                )
+
+    def test_pruning_stops_early(self):
+        from lib.search import _build_basic_index
+
+        class CountingDict(dict):
+            reads = 0
+
+            def __getitem__(self, key):
+                CountingDict.reads += 1
+                return super().__getitem__(key)
+
+        entries = CountingDict(
+            (f"e{i}", {"id": f"e{i}", "title": "alpha beta" if i < 3 else "x",
+                       "content": ["alpha" if i >= 3 else ""]})
+            for i in range(200)
+        )
+        weights = _get_search_weights(TEST_CONFIG)
+        index = _build_basic_index(entries)
+        _search_basic("alpha beta", entries, weights, 3, index)  # fills boosts
+        CountingDict.reads = 0
+        results = _search_basic("alpha beta", entries, weights, 3, index)
+        self.assertEqual([r.entry_id for r in results], ["e0", "e1", "e2"])
+        self.assertLess(CountingDict.reads, 10)
+
+    def test_index_built_on_second_search(self):
+        from lib.search import _load_basic_entries
+        entries, index = _load_basic_entries(self.events_path)
+        self.assertEqual(index.ids, list(entries))
+        self.assertIsNone(index.postings)
+        entries2, index2 = _load_basic_entries(self.events_path)
+        self.assertIs(entries2, entries)
+        self.assertIs(index2, index)
+        self.assertIsNotNone(index2.postings)
+
+    def test_precomputed_tokens_match_linear_scan(self):
+        from lib.search import _build_basic_index
+        entries = _load_entries(self.events_path)
+        weights = _get_search_weights(TEST_CONFIG)
+        index = _build_basic_index(entries, with_postings=False)
+        with unittest.mock.patch("lib.search._entry_text_key") as key_fn:
+            indexed = _search_basic("leakage rolling", entries, weights, 10, index)
+        key_fn.assert_not_called()
+        linear = _search_basic("leakage rolling", entries, weights, 10)
+        self.assertEqual(
+            [(r.entry_id, r.score) for r in linear],
+            [(r.entry_id, r.score) for r in indexed],
+        )
+
+    def test_boosts_precomputed_per_weights(self):
+        from lib.search import _build_basic_index
+        entries = _load_entries(self.events_path)
+        weights = _get_search_weights(TEST_CONFIG)
+        index = _build_basic_index(entries)
+        linear = _search_basic("leakage rolling", entries, weights, 10)
+        with unittest.mock.patch(
+            "lib.search._entry_boosts", wraps=_entry_boosts,
+        ) as boosts:
+            indexed = _search_basic("leakage rolling", entries, weights, 10, index)
+            _search_basic("shift window", entries, weights, 10, index)
+            self.assertEqual(boosts.call_count, len(entries))
+            _search_basic("shift", entries, {**weights, "hard_s1_boost": 1.0}, 10, index)
+            self.assertEqual(boosts.call_count, 2 * len(entries))
+        self.assertEqual(
+            [(r.entry_id, r.score, r.boost) for r in linear],
+            [(r.entry_id, r.score, r.boost) for r in indexed],
+        )
+
+    def test_cache_invalidated_on_append(self):
+        from lib.search import _load_basic_entries
+        _load_basic_entries(self.events_path)
+        _load_basic_entries(self.events_path)
+        new_entry = {**SAMPLE_ENTRIES[0], "id": "lesson-new-00000001",
+                     "title": "Freshly appended zebra entry"}
+        with open(self.events_path, "a") as f:
+            f.write(json.dumps(new_entry) + "\n")
+        report = search_memory(
+            query="zebra", events_path=self.events_path, config=TEST_CONFIG,
+        )
+        self.assertEqual([r.entry_id for r in report.results], ["lesson-new-00000001"])
+
+
 class TestSearchReport(SearchTestBase):
 
     def test_report_has_duration(self):
@@ -444,6 +634,37 @@ class TestMinScoreFilter(unittest.TestCase):
         self.assertEqual(report.total_found, 0)
 
 
+class TestScorerMinScore(SearchTestBase):
+    """min_score inside the scorers matches filtering their output."""
+
+    def _check(self, run):
+        full = run(0.0)
+        self.assertTrue(full)
+        cutoff = sorted(r.score for r in full)[len(full) // 2]
+        self.assertEqual(
+            [(r.entry_id, r.score) for r in run(cutoff)],
+            [(r.entry_id, r.score) for r in full if r.score >= cutoff],
+        )
+
+    def test_all_modes(self):
+        from lib.search import (
+            _build_basic_index, _search_hybrid, _search_keyword, _search_vector,
+        )
+        entries = _load_entries(self.events_path)
+        weights = _get_search_weights(TEST_CONFIG)
+        index = _build_basic_index(entries)
+        self._check(lambda m: _search_hybrid(
+            "leakage rolling", self.db, self.embedder, entries, weights, None, 10, m))
+        self._check(lambda m: _search_vector(
+            "leakage rolling", self.db, self.embedder, entries, weights, None, 10, m))
+        self._check(lambda m: _search_keyword(
+            "leakage", self.db, entries, weights, 10, m))
+        self._check(lambda m: _search_basic(
+            "leakage rolling window", entries, weights, 10, None, m))
+        self._check(lambda m: _search_basic(
+            "leakage rolling window", entries, weights, 10, index, m))
+
+
 class TestContextSearch(SearchTestBase):
 
     def test_search_with_context(self):
@@ -524,6 +745,221 @@ class TestSearchExceptionFallback(SearchTestBase):
         self.assertIn("fell back to basic", report.degradation_reason)
 
 
+class TestLazyEntryLoading(SearchTestBase):
+    """Vectordb-backed modes load only their candidates, not the whole file."""
+
+    def _search_without_full_load(self, **kwargs):
+        from unittest.mock import patch
+        full_load = AssertionError("full load in vectordb mode")
+        with patch("lib.events_io.load_events_latest_wins", side_effect=full_load), \
+                patch("lib.events_io.load_active_events", side_effect=full_load), \
+                patch("lib.events_io.load_active_events_cached", side_effect=full_load):
+            return search_memory(
+                events_path=self.events_path,
+                vectordb=self.db,
+                config=TEST_CONFIG,
+                **kwargs,
+            )
+
+    def test_hybrid_loads_candidates_only(self):
+        report = self._search_without_full_load(
+            query="leakage", embedder=self.embedder,
+        )
+        self.assertEqual(report.mode, "hybrid")
+        self.assertGreater(report.total_found, 0)
+
+    def test_keyword_loads_candidates_only(self):
+        report = self._search_without_full_load(query="leakage", embedder=None)
+        self.assertEqual(report.mode, "keyword")
+        self.assertGreater(report.total_found, 0)
+
+    def test_deprecated_candidates_excluded(self):
+        dep = SAMPLE_ENTRIES[0].copy()
+        dep["deprecated"] = True
+        with open(self.events_path, "a") as f:
+            f.write(json.dumps(dep) + "\n")
+        report = self._search_without_full_load(
+            query="leakage", embedder=self.embedder, max_results=20,
+        )
+        ids = [r.entry_id for r in report.results]
+        self.assertNotIn(dep["id"], ids)
+
+
+class TestQueryCache(SearchTestBase):
+    """Repeated queries against unchanged data reuse the earlier report."""
+
+    def _search(self, query="leakage", **kwargs):
+        kwargs.setdefault("vectordb", self.db)
+        kwargs.setdefault("embedder", self.embedder)
+        return search_memory(
+            query=query, events_path=self.events_path, config=TEST_CONFIG,
+            **kwargs,
+        )
+
+    def _count_hybrid_calls(self):
+        import lib.search as search_mod
+        return unittest.mock.patch.object(
+            search_mod, "_search_hybrid", wraps=search_mod._search_hybrid,
+        )
+
+    def test_repeat_query_hits_cache(self):
+        with self._count_hybrid_calls() as hybrid:
+            first = self._search()
+            second = self._search()
+        self.assertEqual(hybrid.call_count, 1)
+        self.assertEqual(
+            [(r.entry_id, r.score) for r in first.results],
+            [(r.entry_id, r.score) for r in second.results],
+        )
+
+    def test_returned_reports_are_copies(self):
+        first = self._search()
+        first.results.clear()
+        first.reasoning_annotations = [{"x": 1}]
+        second = self._search()
+        self.assertGreater(second.total_found, 0)
+        self.assertEqual(len(second.results), second.total_found)
+        self.assertIsNone(second.reasoning_annotations)
+
+    def test_events_append_invalidates(self):
+        self._search(vectordb=None, embedder=None)
+        new_entry = {**SAMPLE_ENTRIES[0], "id": "lesson-new-00000001",
+                     "title": "Freshly appended leakage entry"}
+        with open(self.events_path, "a") as f:
+            f.write(json.dumps(new_entry) + "\n")
+        report = self._search(vectordb=None, embedder=None)
+        self.assertIn("lesson-new-00000001", [r.entry_id for r in report.results])
+
+    def test_vectordb_write_invalidates(self):
+        with self._count_hybrid_calls() as hybrid:
+            self._search()
+            self.db.mark_deprecated(SAMPLE_ENTRIES[0]["id"])
+            self._search()
+        self.assertEqual(hybrid.call_count, 2)
+
+    def test_write_from_other_connection_invalidates(self):
+        other = VectorDB(self.db_path)
+        other.open()
+        try:
+            with self._count_hybrid_calls() as hybrid:
+                self._search()
+                other.mark_deprecated(SAMPLE_ENTRIES[0]["id"])
+                self._search()
+        finally:
+            other.close()
+        self.assertEqual(hybrid.call_count, 2)
+
+    def test_reopened_db_reuses_cache(self):
+        reopened = VectorDB(self.db_path)
+        reopened.open()
+        try:
+            with self._count_hybrid_calls() as hybrid:
+                self._search()
+                self._search(vectordb=reopened, embedder=MockEmbedder(dimensions=8))
+        finally:
+            reopened.close()
+        self.assertEqual(hybrid.call_count, 1)
+
+    def test_expired_entry_recomputed(self):
+        import lib.search as search_mod
+        with self._count_hybrid_calls() as hybrid:
+            self._search()
+            with unittest.mock.patch.object(search_mod, "_QUERY_CACHE_TTL", -1.0):
+                self._search()
+        self.assertEqual(hybrid.call_count, 2)
+
+    def test_context_bypasses_cache(self):
+        with self._count_hybrid_calls() as hybrid:
+            self._search(context={"tags": ["leakage"]})
+            self._search(context={"tags": ["leakage"]})
+        self.assertEqual(hybrid.call_count, 2)
+
+
+class TestEmbedQueryCache(SearchTestBase):
+    """Query embeddings are reused for repeated query text."""
+
+    def test_same_text_embedded_once(self):
+        from lib.search import _embed_query
+        with unittest.mock.patch.object(
+            self.embedder, "embed_query", wraps=self.embedder.embed_query,
+        ) as embed:
+            first = _embed_query(self.embedder, "rolling window")
+            second = _embed_query(self.embedder, "rolling window")
+            _embed_query(self.embedder, "something else")
+        self.assertEqual(first, second)
+        self.assertEqual(embed.call_count, 2)
+
+    def test_model_is_part_of_key(self):
+        from lib.search import _embed_query
+        other = MockEmbedder(dimensions=4)
+        self.assertEqual(len(_embed_query(self.embedder, "q")), 8)
+        self.assertEqual(len(_embed_query(other, "q")), 4)
+
+    def test_expired_vector_recomputed(self):
+        import lib.search as search_mod
+        with unittest.mock.patch.object(
+            self.embedder, "embed_query", wraps=self.embedder.embed_query,
+        ) as embed, unittest.mock.patch.object(search_mod, "_EMBED_CACHE_TTL", -1.0):
+            search_mod._embed_query(self.embedder, "q")
+            search_mod._embed_query(self.embedder, "q")
+        self.assertEqual(embed.call_count, 2)
+
+    def test_search_with_context_reuses_embedding(self):
+        with unittest.mock.patch.object(
+            self.embedder, "embed_query", wraps=self.embedder.embed_query,
+        ) as embed:
+            for _ in range(2):
+                search_memory(
+                    query="leakage", events_path=self.events_path,
+                    vectordb=self.db, embedder=self.embedder,
+                    config=TEST_CONFIG, context={"tags": ["leakage"]},
+                )
+        self.assertEqual(embed.call_count, 1)
+
+
+class TestHybridConcurrentFetch(SearchTestBase):
+    """The query embedding runs off-thread while FTS runs on the caller."""
+
+    def test_fts_on_caller_thread_embedding_off_thread(self):
+        import threading
+        from lib.search import _search_hybrid
+        caller = threading.get_ident()
+        seen = {}
+        real_fts = self.db.search_fts
+        real_embed = self.embedder.embed_query
+
+        def fts(*args, **kwargs):
+            seen["fts"] = threading.get_ident()
+            return real_fts(*args, **kwargs)
+
+        def embed(text):
+            seen["embed"] = threading.get_ident()
+            return real_embed(text)
+
+        with unittest.mock.patch.object(self.db, "search_fts", side_effect=fts), \
+                unittest.mock.patch.object(self.embedder, "embed_query", side_effect=embed):
+            results = _search_hybrid(
+                "leakage", self.db, self.embedder, _load_entries(self.events_path),
+                _get_search_weights(TEST_CONFIG), None, 5,
+            )
+        self.assertTrue(results)
+        self.assertEqual(seen["fts"], caller)
+        self.assertNotEqual(seen["embed"], caller)
+
+    def test_embedding_error_propagates(self):
+        class BrokenEmbedder(MockEmbedder):
+            def embed_query(self, text):
+                raise RuntimeError("API error")
+
+        from lib.search import _search_hybrid
+        with self.assertRaises(RuntimeError):
+            _search_hybrid(
+                "leakage", self.db, BrokenEmbedder(dimensions=8),
+                _load_entries(self.events_path),
+                _get_search_weights(TEST_CONFIG), None, 5,
+            )
+
+
 class TestConfigMaxResults(SearchTestBase):
 
     def test_config_max_results_used_when_no_caller_override(self):
@@ -676,6 +1112,19 @@ class TestSearchHybridDirect(SearchTestBase):
         )
         self.assertLessEqual(len(results), 1)
 
+    def test_hybrid_vector_scores_normalized_to_best(self):
+        from lib.search import _search_hybrid
+        entries = _load_entries(self.events_path)
+        weights = _get_search_weights(TEST_CONFIG)
+        results = _search_hybrid(
+            "leakage", self.db, self.embedder,
+            entries, weights, None, 10,
+        )
+        vec_scores = [r.vector_score for r in results if r.vector_score > 0]
+        self.assertTrue(vec_scores)
+        self.assertAlmostEqual(max(vec_scores), 1.0)
+        self.assertTrue(all(0.0 <= v <= 1.0 for v in vec_scores))
+
     def test_hybrid_skips_missing_entries(self):
         """Entries in vectordb but not in entries dict should be skipped."""
         from lib.search import _search_hybrid
@@ -790,6 +1239,16 @@ class TestGetSearchWeightsDirect(unittest.TestCase):
         self.assertEqual(set(weights.keys()), expected_keys)
 
 
+class TestSearchResultImmutable(unittest.TestCase):
+
+    def test_frozen_and_slotted(self):
+        import dataclasses
+        r = SearchResult(entry_id="a", entry={}, score=1.0)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            r.score = 2.0
+        self.assertFalse(hasattr(r, "__dict__"))
+
+
 class TestConfidenceBoostSearch(SearchTestBase):
     """Tests for confidence-aware search ranking."""
 
@@ -11,11 +11,38 @@ _MEMORY_DIR = Path(__file__).resolve().parent.parent
 if str(_MEMORY_DIR) not in sys.path:
     sys.path.insert(0, str(_MEMORY_DIR))
 
-from lib.sync import sync_embeddings
+from lib.sync import _compute_text_hash, _read_events, sync_embeddings
 from lib.vectordb import VectorDB
 from tests.conftest import SAMPLE_ENTRIES, MockEmbedder
 
 
+class TestComputeTextHash(unittest.TestCase):
+
+    def test_matches_stored_sha256_prefix(self):
+        # Stored hashes must stay comparable across versions
+        import hashlib
+        for text in ("", "rolling window leakage", "café ✓"):
+            self.assertEqual(
+                _compute_text_hash(text),
+                hashlib.sha256(text.encode("utf-8")).hexdigest()[:16],
+            )
+
+
+class TestReadEvents(unittest.TestCase):
+
+    def test_entries_carry_no_line_metadata(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            events_path = Path(tmpdir) / "events.jsonl"
+            with open(events_path, "w") as f:
+                for entry in SAMPLE_ENTRIES:
+                    f.write(json.dumps(entry) + "\n")
+            entries, total_lines, end_offset = _read_events(events_path)
+        self.assertEqual(total_lines, len(SAMPLE_ENTRIES))
+        self.assertGreater(end_offset, 0)
+        for entry_id, entry in entries.items():
+            self.assertNotIn("_line", entry)
+
+
 class TestSyncEmbeddings(unittest.TestCase):
 
     def setUp(self):
@@ -199,5 +226,97 @@ class TestSyncErrorPaths(unittest.TestCase):
         self.assertGreater(report.duration_ms, 0)
 
 
+class TestSyncParallelBatches(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.events_path = Path(self.tmpdir) / "events.jsonl"
+        self.db_path = Path(self.tmpdir) / "vectors.db"
+
+        with open(self.events_path, "w") as f:
+            for i in range(6):
+                entry = {**SAMPLE_ENTRIES[0], "id": f"lesson-par-{i:08d}",
+                         "title": f"Parallel entry {i}"}
+                f.write(json.dumps(entry) + "\n")
+
+        self.db = VectorDB(self.db_path)
+        self.db.open()
+        self.db.ensure_schema()
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_batches_embedded_concurrently(self):
+        import threading
+        barrier = threading.Barrier(3, timeout=5)
+
+        class BarrierEmbedder(MockEmbedder):
+            def embed_documents(self, texts):
+                barrier.wait()  # only passes if all 3 batches are in flight
+                return super().embed_documents(texts)
+
+        report = sync_embeddings(
+            self.events_path, self.db, BarrierEmbedder(dimensions=8),
+            force_full=True, batch_size=2, max_workers=3,
+        )
+        self.assertEqual(report.errors, [])
+        self.assertEqual(report.entries_added, 6)
+
+    def test_failed_batch_isolated(self):
+        class FlakyEmbedder(MockEmbedder):
+            def embed_documents(self, texts):
+                if any("entry 2" in t for t in texts):
+                    raise RuntimeError("API error")
+                return super().embed_documents(texts)
+
+        report = sync_embeddings(
+            self.events_path, self.db, FlakyEmbedder(dimensions=8),
+            force_full=True, batch_size=2, max_workers=3,
+        )
+        self.assertEqual(len(report.errors), 1)
+        self.assertIn("items 2-4", report.errors[0])
+        self.assertEqual(report.entries_added, 4)
+        self.assertFalse(self.db.has_vector("lesson-par-00000002"))
+        self.assertTrue(self.db.has_vector("lesson-par-00000004"))
+        self.assertIsNone(self.db.get_sync_cursor())
+
+    def test_bad_vector_isolated_within_batch(self):
+        from dataclasses import replace
+
+        class BadVectorEmbedder(MockEmbedder):
+            def embed_documents(self, texts):
+                results = super().embed_documents(texts)
+                return [
+                    replace(r, vector=["nan?"] * 8) if "entry 3" in t else r
+                    for t, r in zip(texts, results)
+                ]
+
+        report = sync_embeddings(
+            self.events_path, self.db, BadVectorEmbedder(dimensions=8),
+            force_full=True, batch_size=6,
+        )
+        self.assertEqual(len(report.errors), 1)
+        self.assertIn("lesson-par-00000003", report.errors[0])
+        self.assertEqual(report.entries_added, 5)
+        self.assertFalse(self.db.has_vector("lesson-par-00000003"))
+        self.assertTrue(self.db.has_vector("lesson-par-00000005"))
+
+    def test_deprecations_applied_in_bulk(self):
+        embedder = MockEmbedder(dimensions=8)
+        sync_embeddings(self.events_path, self.db, embedder, force_full=True)
+        with open(self.events_path, "a") as f:
+            for i in (1, 4):
+                entry = {**SAMPLE_ENTRIES[0], "id": f"lesson-par-{i:08d}",
+                         "title": f"Parallel entry {i}", "deprecated": True}
+                f.write(json.dumps(entry) + "\n")
+
+        report = sync_embeddings(self.events_path, self.db, embedder)
+        self.assertEqual(report.entries_deprecated, 2)
+        hits = {r[0] for r in self.db.search_fts("Parallel entry", limit=10)}
+        self.assertNotIn("lesson-par-00000001", hits)
+        self.assertNotIn("lesson-par-00000004", hits)
+        self.assertIn("lesson-par-00000000", hits)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -18,6 +18,7 @@ if str(_MEMORY_DIR) not in sys.path:
 
 from lib.transcript_scanner import (
     _MAX_TRANSCRIPT_BYTES,
+    _lines_containing,
     _strip_rules_echo,
     read_transcript_messages,
     scan_conversation_for_drafts,
@@ -149,6 +150,60 @@ class TestReadTranscriptMessages(unittest.TestCase):
             self.assertEqual(len(result), 1)
             self.assertEqual(result[0], "Plain string content")
 
+    def test_read_handles_crlf_and_non_ascii(self):
+        """CRLF line endings and non-ASCII text survive the binary read."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "transcript.jsonl"
+            lines = [
+                json.dumps({
+                    "type": "assistant",
+                    "message": {"content": [{"type": "text", "text": "café ✓"}]},
+                }, ensure_ascii=False),
+                _make_transcript_line("human", "question"),
+            ]
+            path.write_bytes("\r\n".join(lines).encode("utf-8"))
+            result = read_transcript_messages(path)
+            self.assertEqual(result, ["café ✓"])
+
+    def test_read_mention_of_assistant_in_human_turn_not_kept(self):
+        """A human line quoting "assistant" passes the byte filter but not the type check."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            lines = [
+                _make_transcript_line("human", '"assistant" is a role name'),
+                json.dumps({"type": "summary", "role": "assistant"}),
+                _make_transcript_line("assistant", "kept"),
+            ]
+            path = _write_transcript(tmpdir, lines)
+            self.assertEqual(read_transcript_messages(path), ["kept"])
+
+    def test_lines_containing(self):
+        buf = b'x "a" "a"\nskip\n"a" first\n\n"a"'
+        self.assertEqual(
+            list(_lines_containing(buf, b'"a"')),
+            [b'x "a" "a"', b'"a" first', b'"a"'],
+        )
+        self.assertEqual(list(_lines_containing(b"none\nhere", b'"a"')), [])
+
+    def test_read_last_line_without_newline(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "transcript.jsonl"
+            path.write_text(
+                _make_transcript_line("human", "q") + "\n"
+                + _make_transcript_line("assistant", "tail"),
+                encoding="utf-8",
+            )
+            self.assertEqual(read_transcript_messages(path), ["tail"])
+
+    def test_read_invalid_utf8_returns_empty(self):
+        """Undecodable bytes still degrade to [] as with the text-mode read."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "transcript.jsonl"
+            path.write_bytes(
+                _make_transcript_line("assistant", "ok").encode() + b"\n"
+                + b'{"type": "assistant", "x": "\xff"}\n'
+            )
+            self.assertEqual(read_transcript_messages(path), [])
+
 
 # ---------------------------------------------------------------------------
 # Tests: scan_conversation_for_drafts
@@ -330,6 +385,27 @@ class TestScanConversationForDrafts(unittest.TestCase):
             self.assertEqual(result["candidates_found"], 1)
             self.assertEqual(result["drafts_created"], 1)
 
+    def test_scan_stops_at_max_drafts_per_scan(self):
+        """v3.max_drafts_per_scan caps drafts created in one scan."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            lines = [
+                _make_transcript_line("assistant", "LESSON: always check file permissions before writing"),
+                _make_transcript_line("assistant", "DECISION: use sqlite for the vector store backend"),
+                _make_transcript_line("assistant", "WARNING: never commit generated credentials to git"),
+            ]
+            path = _write_transcript(tmpdir, lines)
+            drafts_dir = Path(tmpdir) / "drafts"
+            config = self._make_config()
+            config["v3"]["max_drafts_per_scan"] = 2
+
+            result = scan_conversation_for_drafts(
+                path, drafts_dir, Path(tmpdir), config
+            )
+
+            self.assertEqual(result["drafts_created"], 2)
+            self.assertEqual(result["candidates_found"], 2)
+            self.assertEqual(len(list(drafts_dir.glob("*.json"))), 2)
+
     def test_scan_source_attribution(self):
         """Draft entries include conversation source attribution."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -455,6 +531,10 @@ class TestStripRulesEcho(unittest.TestCase):
         """Empty string returns empty string."""
         self.assertEqual(_strip_rules_echo(""), "")
 
+    def test_text_without_markers_normalizes_newlines(self):
+        """The no-marker fast path still joins lines with \\n."""
+        self.assertEqual(_strip_rules_echo("a\r\nb\rc\n"), "a\nb\nc")
+
 
 # ---------------------------------------------------------------------------
 # Tests: scan dedup against events.jsonl
@@ -11,7 +11,7 @@ _MEMORY_DIR = Path(__file__).resolve().parent.parent
 if str(_MEMORY_DIR) not in sys.path:
     sys.path.insert(0, str(_MEMORY_DIR))
 
-from lib.vectordb import VectorDB, SCHEMA_VERSION, cosine_similarity, pack_vector, unpack_vector
+from lib.vectordb import VectorDB, SCHEMA_VERSION, cosine_similarity, pack_signs, pack_vector, unpack_vector
 
 
 class TestCosineSimiarity(unittest.TestCase):
@@ -56,6 +56,20 @@ class TestPackUnpack(unittest.TestCase):
         recovered = unpack_vector(blob, 0)
         self.assertEqual(recovered, [])
 
+    def test_blob_format_unchanged(self):
+        # Existing vectors.db files were written with struct.pack
+        import struct
+        vec = [0.1, -2.5, 3.0, 1e-3]
+        self.assertEqual(pack_vector(vec), struct.pack("4f", *vec))
+        self.assertEqual(
+            unpack_vector(struct.pack("4f", *vec), 4),
+            list(struct.unpack("4f", struct.pack("4f", *vec))),
+        )
+
+    def test_dimension_mismatch_raises(self):
+        with self.assertRaises(ValueError):
+            unpack_vector(pack_vector([1.0, 2.0, 3.0]), 4)
+
 
 class TestVectorDB(unittest.TestCase):
 
@@ -74,8 +88,24 @@ class TestVectorDB(unittest.TestCase):
         self.db.upsert_vector("entry-1", "hash1", "mock", "mock-v1", 3, vec)
         result = self.db.get_vector("entry-1")
         self.assertIsNotNone(result)
+        # Stored L2-normalized (schema v2)
+        norm = math.sqrt(sum(v * v for v in vec))
         for a, b in zip(vec, result):
-            self.assertAlmostEqual(a, b, places=5)
+            self.assertAlmostEqual(a / norm, b, places=5)
+
+    def test_search_scores_match_cosine(self):
+        vecs = {"a": [3.0, 4.0, 0.0], "b": [-1.0, 2.0, 2.0], "z": [0.0, 0.0, 0.0]}
+        for eid, vec in vecs.items():
+            self.db.upsert_vector(eid, "h", "mock", "m", 3, vec)
+        query = [2.0, 1.0, -1.0]
+        results = dict(self.db.search_vectors(query, limit=3))
+        for eid, vec in vecs.items():
+            self.assertAlmostEqual(results[eid], cosine_similarity(query, vec), places=5)
+
+    def test_search_dimension_mismatch_raises(self):
+        self.db.upsert_vector("a", "h", "mock", "m", 3, [1.0, 0.0, 0.0])
+        with self.assertRaises(ValueError):
+            self.db.search_vectors([1.0, 0.0], limit=1)
 
     def test_get_nonexistent(self):
         result = self.db.get_vector("nonexistent")
@@ -154,6 +184,70 @@ class TestVectorDB(unittest.TestCase):
         self.assertEqual(stats["vectors_active"], 1)
         self.assertEqual(stats["vectors_deprecated"], 1)
 
+    def test_stored_text_hashes(self):
+        self.db.upsert_vector("a", "h1", "mock", "m", 3, [1.0, 0.0, 0.0])
+        self.assertEqual(self.db.stored_text_hashes(["a", "missing"]), {"a": "h1"})
+        self.assertEqual(self.db.stored_text_hashes([]), {})
+
+    def test_stored_text_hashes_chunks_large_input(self):
+        self.db.begin_batch()
+        for i in range(0, 2000, 2):
+            self.db.upsert_vector(f"e{i}", "h", "mock", "m", 3, [1.0, 0.0, 0.0])
+        self.db.end_batch()
+        stored = self.db.stored_text_hashes(f"e{i}" for i in range(2000))
+        self.assertEqual(stored, {f"e{i}": "h" for i in range(0, 2000, 2)})
+
+    def test_upsert_fts_many_replaces_rows(self):
+        self.db.upsert_fts("a", "Old title", "old text", "")
+        self.db.upsert_fts_many([
+            ("a", "Rolling window", "leakage text", "ml"),
+            ("b", "Other", "unrelated", ""),
+        ])
+        count = self.db._conn.execute(
+            "SELECT COUNT(*) FROM fts_entries WHERE entry_id = 'a'"
+        ).fetchone()[0]
+        self.assertEqual(count, 1)
+        self.assertEqual([eid for eid, _ in self.db.search_fts("rolling")], ["a"])
+        self.assertEqual(self.db.search_fts("old"), [])
+
+    def test_fts_rowid_stable_across_upsert_and_delete(self):
+        self.db.upsert_fts("a", "First", "alpha", "")
+        self.db.upsert_fts("b", "Second", "beta", "")
+        rowid = self.db._conn.execute(
+            "SELECT rowid FROM fts_entries WHERE entry_id = 'a'"
+        ).fetchone()[0]
+        self.db.upsert_fts("a", "First again", "gamma", "")
+        self.assertEqual(
+            self.db._conn.execute(
+                "SELECT rowid FROM fts_entries WHERE entry_id = 'a'"
+            ).fetchall(),
+            [(rowid,)],
+        )
+        self.db.delete_fts("a")
+        self.assertEqual(self.db.search_fts("gamma"), [])
+        self.assertEqual(
+            self.db._conn.execute("SELECT entry_id FROM fts_map").fetchall(),
+            [("b",)],
+        )
+
+    def test_db_path(self):
+        self.assertEqual(self.db.db_path, self.db_path)
+
+
+class TestOpenPragmas(unittest.TestCase):
+
+    def test_read_tuning_pragmas_applied(self):
+        db = VectorDB(Path(tempfile.mkdtemp()) / "pragmas.db")
+        db.open()
+        conn = db._conn
+        self.assertEqual(conn.execute("PRAGMA cache_size").fetchone()[0], -65536)
+        self.assertEqual(conn.execute("PRAGMA temp_store").fetchone()[0], 2)
+        mmap_size = conn.execute("PRAGMA mmap_size").fetchone()
+        # Builds compiled without mmap support report nothing / 0
+        if mmap_size and mmap_size[0]:
+            self.assertEqual(mmap_size[0], 256 * 1024 * 1024)
+        db.close()
+
 
 class TestContextManager(unittest.TestCase):
 
@@ -310,6 +404,183 @@ class TestSearchVectorsDeprecatedIncluded(unittest.TestCase):
         db.close()
 
 
+class TestBulkWrites(unittest.TestCase):
+
+    def setUp(self):
+        self.db = VectorDB(Path(tempfile.mkdtemp()) / "bulk.db")
+        self.db.open()
+        self.db.ensure_schema()
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_upsert_vectors_many(self):
+        self.db.upsert_vectors_many([
+            ("a", "h1", "mock", "m", 2, [3.0, 4.0]),
+            ("b", "h2", "mock", "m", 2, [0.0, 1.0]),
+        ])
+        self.assertEqual(self.db.stored_text_hashes(["a", "b", "c"]),
+                         {"a": "h1", "b": "h2"})
+        vec = self.db.get_vector("a")
+        self.assertAlmostEqual(vec[0], 0.6, places=5)
+
+    def test_upsert_vectors_many_overwrites(self):
+        self.db.upsert_vector("a", "h1", "mock", "m", 2, [1.0, 0.0])
+        self.db.upsert_vectors_many([("a", "h2", "mock", "m", 2, [0.0, 1.0])])
+        self.assertEqual(self.db.stored_text_hashes(["a"]), {"a": "h2"})
+        self.assertEqual(self.db.stats()["vectors_total"], 1)
+
+    def test_mark_deprecated_many(self):
+        for eid in ("a", "b", "c"):
+            self.db.upsert_vector(eid, "h", "mock", "m", 2, [1.0, 0.0])
+        self.db.mark_deprecated_many(["a", "c"])
+        ids = [r[0] for r in self.db.search_vectors([1.0, 0.0])]
+        self.assertEqual(ids, ["b"])
+
+    def test_delete_fts_many(self):
+        self.db.upsert_fts_many([
+            ("a", "alpha one", "", ""),
+            ("b", "alpha two", "", ""),
+            ("c", "alpha three", "", ""),
+        ])
+        self.db.delete_fts_many(["a", "b"])
+        self.assertEqual([r[0] for r in self.db.search_fts("alpha")], ["c"])
+
+
+class TestVectorMatrixCache(unittest.TestCase):
+
+    def setUp(self):
+        self.db = VectorDB(Path(tempfile.mkdtemp()) / "matrix.db")
+        self.db.open()
+        self.db.ensure_schema()
+        self.db.upsert_vector("a", "h1", "mock", "m", 3, [1.0, 0.0, 0.0])
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_decoded_vectors_reused_between_searches(self):
+        self.db.search_vectors([1.0, 0.0, 0.0])
+        first = self.db._matrix
+        self.db.search_vectors([0.0, 1.0, 0.0])
+        self.assertIs(self.db._matrix, first)
+
+    def test_writes_patch_rows_in_place(self):
+        self.db.search_vectors([1.0, 0.0, 0.0])
+        matrix = self.db._matrix
+        self.db.upsert_vector("b", "h2", "mock", "m", 3, [0.0, 1.0, 0.0])
+        results = self.db.search_vectors([0.0, 1.0, 0.0], limit=1)
+        self.assertEqual(results[0][0], "b")
+        self.assertIs(self.db._matrix, matrix)
+
+    def test_deprecation_drops_row(self):
+        self.db.search_vectors([1.0, 0.0, 0.0])
+        self.db.mark_deprecated("a")
+        self.assertEqual(self.db.search_vectors([1.0, 0.0, 0.0]), [])
+        ids = [r[0] for r in self.db.search_vectors(
+            [1.0, 0.0, 0.0], exclude_deprecated=False,
+        )]
+        self.assertEqual(ids, ["a"])
+
+    def test_patched_matrix_matches_rebuild(self):
+        import random
+        rng = random.Random(3)
+        query = [1.0, 0.5, -0.5]
+        self.db.search_vectors(query)
+        for i in range(300):
+            entry_id = f"e{rng.randrange(20)}"
+            op = rng.random()
+            if op < 0.6:
+                vec = [rng.uniform(-1, 1) for _ in range(3)]
+                self.db.upsert_vector(
+                    entry_id, "h", "mock", "m", 3, vec,
+                    deprecated=rng.random() < 0.2,
+                )
+            elif op < 0.8:
+                self.db.mark_deprecated(entry_id)
+            else:
+                self.db.delete_vector(entry_id)
+        patched = self.db.search_vectors(query, limit=50)
+        self.db._matrix = None
+        rebuilt = self.db.search_vectors(query, limit=50)
+        self.assertEqual(sorted(patched), sorted(rebuilt))
+
+    def test_commit_from_other_connection_rebuilds(self):
+        self.db.search_vectors([1.0, 0.0, 0.0])
+        other = VectorDB(self.db._db_path)
+        other.open()
+        other.upsert_vector("b", "h2", "mock", "m", 3, [0.0, 1.0, 0.0])
+        other.close()
+        results = self.db.search_vectors([0.0, 1.0, 0.0], limit=1)
+        self.assertEqual(results[0][0], "b")
+
+    def test_close_drops_cache(self):
+        self.db.search_vectors([1.0, 0.0, 0.0])
+        self.db.close()
+        self.assertIsNone(self.db._matrix)
+
+
+class TestBinaryPrefilter(unittest.TestCase):
+
+    def setUp(self):
+        self.db = VectorDB(Path(tempfile.mkdtemp()) / "bits.db")
+        self.db.open()
+        self.db.ensure_schema()
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_pack_signs(self):
+        self.assertEqual(pack_signs([1.0, -1.0, 0.0, 2.0]), bytes([0b1001]))
+        self.assertEqual(len(pack_signs([0.5] * 9)), 2)
+
+    def test_upsert_stores_signs(self):
+        self.db.upsert_vector("a", "h", "mock", "m", 3, [0.5, -0.2, 0.1])
+        signs = self.db._conn.execute(
+            "SELECT signs FROM vectors WHERE entry_id = 'a'"
+        ).fetchone()[0]
+        self.assertEqual(signs, pack_signs([0.5, -0.2, 0.1]))
+
+    def test_prefilter_matches_exact_search(self):
+        from unittest.mock import patch
+        import random
+        rng = random.Random(7)
+        self.db.begin_batch()
+        for i in range(200):
+            vec = [rng.uniform(-1, 1) for _ in range(16)]
+            self.db.upsert_vector(f"e{i}", f"h{i}", "mock", "m", 16, vec)
+        self.db.end_batch()
+        query = [rng.uniform(-1, 1) for _ in range(16)]
+        # Near-duplicates of the query are unambiguous nearest neighbours
+        for j in range(3):
+            near = [q + rng.uniform(-0.01, 0.01) for q in query]
+            self.db.upsert_vector(f"near{j}", f"n{j}", "mock", "m", 16, near)
+
+        exact = self.db.search_vectors(query, limit=3)
+        with patch("lib.vectordb._BINARY_PREFILTER_MIN", 10), \
+                patch("lib.vectordb._BINARY_OVERSAMPLE", 4):
+            self.assertIsNotNone(
+                self.db._binary_candidates(query, 12, "WHERE deprecated = 0")
+            )
+            filtered = self.db.search_vectors(query, limit=3)
+        self.assertEqual(
+            sorted(r[0] for r in filtered), ["near0", "near1", "near2"],
+        )
+        self.assertEqual([r[0] for r in filtered], [r[0] for r in exact])
+
+    def test_active_signs_index_covers_prefilter_scan(self):
+        plan = self.db._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT entry_id, signs, dimensions FROM vectors "
+            "INDEXED BY idx_vectors_active_signs WHERE deprecated = 0"
+        ).fetchall()
+        self.assertIn("COVERING INDEX idx_vectors_active_signs", plan[0][3])
+
+    def test_small_table_skips_prefilter(self):
+        self.db.upsert_vector("a", "h", "mock", "m", 3, [1.0, 0.0, 0.0])
+        self.assertIsNone(
+            self.db._binary_candidates([1.0, 0.0, 0.0], 32, "")
+        )
+
+
 class TestSchemaVersioning(unittest.TestCase):
 
     def test_schema_version_set_on_fresh_db(self):
@@ -355,6 +626,124 @@ class TestSchemaVersioning(unittest.TestCase):
         self.assertEqual(version, SCHEMA_VERSION)
         db.close()
 
+    def test_v1_vectors_normalized_on_upgrade(self):
+        """Opening a v1 DB rescales its stored vectors to unit length."""
+        import sqlite3
+        db_path = Path(tempfile.mkdtemp()) / "v1.db"
+        db = VectorDB(db_path)
+        db.open()
+        db.ensure_schema()
+        db.close()
+
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            "INSERT INTO vectors (entry_id, text_hash, provider, model, dimensions, "
+            "embedding, deprecated, created_at, updated_at) "
+            "VALUES ('a', 'h', 'mock', 'm', 2, ?, 0, 'now', 'now')",
+            (pack_vector([3.0, 4.0]),),
+        )
+        conn.execute("PRAGMA user_version = 1")
+        conn.commit()
+        conn.close()
+
+        db = VectorDB(db_path)
+        db.open()
+        db.ensure_schema()
+        vec = db.get_vector("a")
+        self.assertAlmostEqual(vec[0], 0.6, places=5)
+        self.assertAlmostEqual(vec[1], 0.8, places=5)
+        self.assertEqual(
+            db._conn.execute("PRAGMA user_version").fetchone()[0], SCHEMA_VERSION,
+        )
+        db.close()
+
+    def test_v2_gets_sign_bits_on_upgrade(self):
+        """Opening a v2 DB adds the signs column and backfills it."""
+        import sqlite3
+        db_path = Path(tempfile.mkdtemp()) / "v2.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            "CREATE TABLE vectors (entry_id TEXT PRIMARY KEY, text_hash TEXT NOT NULL, "
+            "provider TEXT NOT NULL, model TEXT NOT NULL, dimensions INTEGER NOT NULL, "
+            "embedding BLOB NOT NULL, deprecated INTEGER DEFAULT 0, "
+            "created_at TEXT NOT NULL, updated_at TEXT NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO vectors VALUES ('a', 'h', 'mock', 'm', 2, ?, 0, 'now', 'now')",
+            (pack_vector([0.6, -0.8]),),
+        )
+        conn.execute("PRAGMA user_version = 2")
+        conn.commit()
+        conn.close()
+
+        db = VectorDB(db_path)
+        db.open()
+        db.ensure_schema()
+        signs = db._conn.execute(
+            "SELECT signs FROM vectors WHERE entry_id = 'a'"
+        ).fetchone()[0]
+        self.assertEqual(signs, pack_signs([0.6, -0.8]))
+        self.assertEqual(
+            db._conn.execute("PRAGMA user_version").fetchone()[0], SCHEMA_VERSION,
+        )
+        db.close()
+
+    def test_v3_fts_rows_mapped_on_upgrade(self):
+        """Opening a v3 DB builds fts_map and drops duplicate FTS rows."""
+        import sqlite3
+        db_path = Path(tempfile.mkdtemp()) / "v3.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            "CREATE VIRTUAL TABLE fts_entries USING fts5(entry_id UNINDEXED, title, text, tags)"
+        )
+        conn.executemany(
+            "INSERT INTO fts_entries (entry_id, title, text, tags) VALUES (?, ?, ?, ?)",
+            [("a", "One", "alpha", ""), ("b", "Two", "beta", ""), ("a", "Dup", "alpha", "")],
+        )
+        conn.execute("PRAGMA user_version = 3")
+        conn.commit()
+        conn.close()
+
+        db = VectorDB(db_path)
+        db.open()
+        db.ensure_schema()
+        self.assertEqual(
+            db._conn.execute("SELECT rowid, entry_id FROM fts_map ORDER BY rowid").fetchall(),
+            [(2, "b"), (3, "a")],
+        )
+        self.assertEqual(db.stats()["fts_entries"], 2)
+        db.upsert_fts("a", "One", "delta", "")
+        self.assertEqual([eid for eid, _ in db.search_fts("delta")], ["a"])
+        self.assertEqual(db.stats()["fts_entries"], 2)
+        db.close()
+
+    def test_v3_duplicate_fts_rows_keep_newest_text(self):
+        """The most recently written FTS row survives the v4 migration."""
+        import sqlite3
+        db_path = Path(tempfile.mkdtemp()) / "v3dup.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            "CREATE VIRTUAL TABLE fts_entries USING fts5(entry_id UNINDEXED, title, text, tags)"
+        )
+        conn.executemany(
+            "INSERT INTO fts_entries (entry_id, title, text, tags) VALUES (?, ?, ?, ?)",
+            [("a", "Old", "stale", ""), ("a", "New", "fresh", "")],
+        )
+        conn.execute("PRAGMA user_version = 3")
+        conn.commit()
+        conn.close()
+
+        db = VectorDB(db_path)
+        db.open()
+        db.ensure_schema()
+        self.assertEqual(
+            db._conn.execute("SELECT title, text FROM fts_entries").fetchall(),
+            [("New", "fresh")],
+        )
+        self.assertEqual(db.search_fts("stale"), [])
+        self.assertEqual([eid for eid, _ in db.search_fts("fresh")], ["a"])
+        db.close()
+
     def test_newer_schema_warns(self):
         """DB with higher version logs a warning."""
         import sqlite3
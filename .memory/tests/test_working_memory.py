@@ -3,8 +3,9 @@ Tests for EF Memory V3 — Working Memory (PWF Integration)
 
 Covers: start_session, resume_session, get_session_status,
         harvest_session, read_plan_summary, clear_session,
-        _extract_candidates, _extract_field, _count_phases,
-        _get_current_phase, _search_for_prefill,
+        _extract_candidates, _extract_field, _count_phases, _count_findings,
+        _get_current_phase, _parse_plan, _maybe_read, _last_progress_line,
+        _search_for_prefill,
         template generators, PrefillEntry, dataclasses
 """
 
@@ -36,6 +37,7 @@ from lib.working_memory import (
     _clean_markdown_artifacts,
     _compute_extraction_confidence,
     _convert_candidate_to_entry,
+    _count_findings,
     _count_phases,
     _extract_candidates,
     _extract_field,
@@ -45,7 +47,10 @@ from lib.working_memory import (
     _generate_task_plan,
     _get_current_phase,
     _hash8,
+    _parse_plan,
     _is_viable_candidate,
+    _last_progress_line,
+    _maybe_read,
     _sanitize_anchor,
     auto_harvest_and_persist,
     clear_session,
@@ -643,7 +648,8 @@ WARNING: Pool exhaustion under heavy load
 
 
 # ===========================================================================
-# Test: _extract_field, _count_phases, _get_current_phase
+# Test: _extract_field, _count_phases, _get_current_phase, _count_findings,
+#       _parse_plan, _maybe_read, _last_progress_line
 # ===========================================================================
 
 class TestHelpers(unittest.TestCase):
@@ -696,6 +702,44 @@ class TestHelpers(unittest.TestCase):
         phase = _get_current_phase(plan)
         self.assertEqual(phase, "Unknown")
 
+    def test_parse_plan(self):
+        plan = """**Task**: Ship it
+## Phases
+### Phase 1: Investigation [DONE]
+### Phase 2: Implementation
+### Phase 3: Verification [done]
+## Notes
+### Phase 4: Not a phase
+"""
+        self.assertEqual(
+            _parse_plan(plan), ("Ship it", 3, 2, "Phase 2: Implementation"),
+        )
+        self.assertEqual(_parse_plan(""), ("", 0, 0, "Unknown"))
+
+    def test_maybe_read(self):
+        path = Path(tempfile.mkdtemp()) / PROGRESS_FILE
+        self.assertIsNone(_maybe_read(path))
+        path.write_text("- done\n")
+        self.assertEqual(_maybe_read(path), "- done\n")
+
+    def test_last_progress_line(self):
+        text = "# Progress\n- first\r\n  - second  \r\n\n---\n## Log\n\n"
+        self.assertEqual(_last_progress_line(text), "- second")
+        self.assertEqual(_last_progress_line("# Progress\n---\n"), "")
+        self.assertEqual(_last_progress_line(""), "")
+
+    def test_count_findings(self):
+        path = Path(tempfile.mkdtemp()) / FINDINGS_FILE
+        self.assertEqual(_count_findings(path), 0)
+        path.write_text("# Findings\n- before the section\n")
+        self.assertEqual(_count_findings(path), 0)
+        path.write_text(
+            _generate_findings("t") + "\n- found one\n\n  - found two\n(note)"
+        )
+        self.assertEqual(_count_findings(path), 2)
+        path.write_bytes(b"## Session Discoveries\r- one\r\r(note)\r- two\r")
+        self.assertEqual(_count_findings(path), 2)
+
 
 # ===========================================================================
 # Test: Dataclasses
@@ -980,6 +1024,28 @@ class TestAutoHarvestAndPersist(unittest.TestCase):
         self.assertGreater(result["candidates_found"], 0)
         self.assertGreater(result["entries_skipped"], 0)
 
+    def test_repeat_harvest_dedups_against_appended_entries(self):
+        """A second harvest in the same process sees what the first appended."""
+        self._write_session_with_markers()
+        first = auto_harvest_and_persist(
+            self.working_dir, self.events_path,
+            self.project_root, self.config,
+            run_pipeline_after=False,
+        )
+        self.assertGreater(first["entries_written"], 0)
+
+        # Same markers from another session dir: new ids, same text
+        self.working_dir = self.project_root / ".memory" / "working2"
+        self.working_dir.mkdir()
+        self._write_session_with_markers()
+        second = auto_harvest_and_persist(
+            self.working_dir, self.events_path,
+            self.project_root, self.config,
+            run_pipeline_after=False,
+        )
+        self.assertEqual(second["entries_written"], 0)
+        self.assertEqual(len(second["dedup_skipped"]), first["entries_written"])
+
     def test_dedup_threshold_respected(self):
         """Low dedup threshold catches more duplicates, high threshold catches fewer."""
         # Pre-populate with an entry